@@ -1,23 +1,26 @@
-import csv
 import hmac
-import io
 
-from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Header, HTTPException, UploadFile
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_db
 from app.models.book import Book, BookLink, Source
+from app.models.import_job import ImportJob
 from app.models.list import CuratedList, ListItem
 from app.models.schemas import (
     BookCreate,
     BookLinkCreate,
     CuratedListCreate,
     CuratedListOut,
+    ImportJobOut,
     ListItemCreate,
     SourceCreate,
     SourceOut,
 )
+from app.services import also_planned, catalog_events, import_jobs, related
+from app.services.librarian_cache import librarian_cache
 
 router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
 
@@ -28,6 +31,11 @@ def verify_admin(x_api_key: str = Header(...)):
     return True
 
 
+async def _touch_book(db: AsyncSession, book_id: int) -> None:
+    """Bump updated_at so incremental exports pick up link/list changes."""
+    await db.execute(update(Book).where(Book.id == book_id).values(updated_at=func.now()))
+
+
 @router.post("/books", response_model=dict)
 async def create_book(
     book: BookCreate,
@@ -38,56 +46,57 @@ async def create_book(
     db_book = Book(**book.model_dump())
     db.add(db_book)
     await db.flush()
+    await related.refresh_related_for(db, db_book.id)
+    # Commit before invalidating so no cached response can be rebuilt from old rows
+    await db.commit()
+    await catalog_events.books_created([db_book])
     return {"id": db_book.id, "title": db_book.title}
 
 
-@router.post("/books/import-csv")
+@router.post("/books/import-csv", status_code=202)
 async def import_books_csv(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin),
 ):
-    """Import books from a CSV file. Expected columns match BookCreate fields."""
-    content = await file.read()
-    text = content.decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(text))
-
-    created = 0
-    errors = []
-    for i, row in enumerate(reader, start=2):
-        try:
-            subjects = [s.strip() for s in row.get("subjects", "").split("|") if s.strip()]
-            awards = [a.strip() for a in row.get("awards", "").split("|") if a.strip()] or None
-
-            book = Book(
-                title=row["title"],
-                author=row["author"],
-                description=row["description"],
-                long_description=row.get("long_description") or None,
-                reading_level=row.get("reading_level") or None,
-                age_range=row["age_range"],
-                subjects=subjects,
-                time_period=row.get("time_period") or None,
-                region=row.get("region") or None,
-                isbn=row.get("isbn") or None,
-                cover_image_url=row.get("cover_image_url") or None,
-                language=row.get("language", "English"),
-                series=row.get("series") or None,
-                awards=awards,
-                popularity_score=float(row.get("popularity_score", 0)),
-                page_count=int(row["page_count"]) if row.get("page_count") else None,
-                publication_year=(
-                    int(row["publication_year"]) if row.get("publication_year") else None
-                ),
-                publisher=row.get("publisher") or None,
-            )
-            db.add(book)
-            created += 1
-        except Exception as e:
-            errors.append({"row": i, "error": str(e)})
+    """Queue a CSV import, upserting by ISBN. Columns match BookCreate fields.
 
-    await db.flush()
-    return {"created": created, "errors": errors}
+    The upload is spooled to disk and imported in the background in chunks; poll
+    ``GET /import-jobs/{job_id}`` for progress, row errors and the final counts.
+    """
+    job = await import_jobs.create_job(db, file.file, file.filename)
+    await db.commit()
+    background_tasks.add_task(import_jobs.run_import_job, job.id)
+    return {"job_id": job.id, "status": job.status}
+
+
+@router.get("/import-jobs/{job_id}", response_model=ImportJobOut)
+async def get_import_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    _: bool = Depends(verify_admin),
+):
+    """Status and progress of a CSV import job."""
+    job = await db.get(ImportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
+
+@router.post("/import-jobs/{job_id}/cancel", response_model=ImportJobOut)
+async def cancel_import_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    _: bool = Depends(verify_admin),
+):
+    """Ask a queued or running import to stop after its current chunk."""
+    job = await db.get(ImportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    await import_jobs.request_cancel(db, job)
+    await db.commit()
+    return job
 
 
 @router.post("/sources", response_model=SourceOut)
@@ -100,6 +109,8 @@ async def create_source(
     db_source = Source(**source.model_dump())
     db.add(db_source)
     await db.flush()
+    await db.commit()
+    await catalog_events.source_created()
     return SourceOut.model_validate(db_source)
 
 
@@ -113,6 +124,9 @@ async def create_book_link(
     db_link = BookLink(**link.model_dump())
     db.add(db_link)
     await db.flush()
+    await _touch_book(db, db_link.book_id)
+    await db.commit()
+    await catalog_events.book_links_changed(db_link.book_id)
     return {"id": db_link.id}
 
 
@@ -126,6 +140,8 @@ async def create_list(
     db_list = CuratedList(**lst.model_dump())
     db.add(db_list)
     await db.flush()
+    await db.commit()
+    await catalog_events.list_created()
     return CuratedListOut.model_validate(db_list)
 
 
@@ -140,4 +156,38 @@ async def add_list_item(
     db_item = ListItem(list_id=list_id, **item.model_dump())
     db.add(db_item)
     await db.flush()
+    await _touch_book(db, db_item.book_id)
+    # List co-occurrence is a similarity signal
+    await related.refresh_related_for(db, db_item.book_id)
+    await db.commit()
+    await catalog_events.list_items_changed()
     return {"id": db_item.id}
+
+
+@router.post("/rebuild-related", response_model=dict)
+async def rebuild_related(
+    db: AsyncSession = Depends(get_db),
+    _: bool = Depends(verify_admin),
+):
+    """Recompute the related-books neighbor table for the whole catalog. Cron-triggered."""
+    written = await related.rebuild_related_books(db)
+    await db.commit()
+    await catalog_events.related_rebuilt()
+    return {"related_rows": written}
+
+
+@router.post("/rebuild-also-planned", response_model=dict)
+async def rebuild_also_planned(
+    db: AsyncSession = Depends(get_db),
+    _: bool = Depends(verify_admin),
+):
+    """Recompute co-planned neighbors from reading plans and click sessions. Cron-triggered."""
+    written = await also_planned.rebuild_also_planned(db)
+    await db.commit()
+    return {"also_planned_rows": written}
+
+
+@router.get("/librarian-cache", response_model=dict)
+async def librarian_cache_stats(_: bool = Depends(verify_admin)):
+    """Librarian reply cache size and hit/miss counts for this worker."""
+    return librarian_cache.as_dict()
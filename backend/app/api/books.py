@@ -1,14 +1,42 @@
+import base64
+import datetime
+import json
+import re
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select, text
+from sqlalchemy import func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import estimate_row_count, get_db
 from app.models.book import Book, BookLink
+from app.models.related_book import RelatedBook
 from app.models.schemas import BookLinkOut, BookOut, BookSummary, PaginatedBooks
+from app.services.also_planned import also_planned_query
+from app.services.catalog_index import catalog_index
+from app.services.facets import (
+    SCALAR_FACETS,
+    by_frequency,
+    facet_cache,
+    facet_counts_query,
+    rows_to_facets,
+)
 
 router = APIRouter(prefix="/api/v1/books", tags=["books"])
 
+# sort option -> (key column, descending). Book.id breaks ties so the order is total.
+SORT_COLUMNS = {
+    "popularity": (Book.popularity_score, True),
+    "title": (Book.title, False),
+    "author": (Book.author, False),
+    "newest": (Book.created_at, True),
+}
+
+# Exact totals for recently seen filter combinations (count=cached)
+_count_cache = TTLCache(ttl_seconds=settings.search_count_cache_ttl_seconds)
+
 
 def _ensure_cover_url(book: Book) -> str | None:
     """Return cover_image_url, falling back to Open Library if ISBN exists."""
@@ -19,6 +47,98 @@ def _ensure_cover_url(book: Book) -> str | None:
     return None
 
 
+def _search_tsquery(q: str):
+    """Build a prefix-matching tsquery so partial words ("bowd") still hit the index."""
+    terms = re.findall(r"[^\W_]+", q)
+    if not terms:
+        return func.plainto_tsquery("english", q)
+    return func.to_tsquery("english", " & ".join(f"{t}:*" for t in terms))
+
+
+def _fuzzy_match(q: str):
+    """Return a trigram (pg_trgm) predicate and similarity score over title and author.
+
+    ``q <% column`` is word similarity, so a misspelled word ("Bowdich") matches
+    inside a longer title, and the GIN trigram indexes serve the predicate.
+    """
+    term = literal(q)
+    word_similar = term.op("<%", is_comparison=True)
+    predicate = word_similar(Book.title) | word_similar(Book.author)
+    score = func.greatest(
+        func.word_similarity(term, Book.title), func.word_similarity(term, Book.author)
+    )
+    return predicate, score
+
+
+def _encode_cursor(sort: str, book: Book) -> str:
+    """Encode the sort key and id of the last row on a page as an opaque cursor."""
+    column, _ = SORT_COLUMNS[sort]
+    value = getattr(book, column.key)
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, book.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple:
+    """Decode a cursor produced by ``_encode_cursor`` for the same sort order."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, book_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort or not isinstance(book_id, int):
+            raise ValueError("cursor does not match sort order")
+        if sort == "newest":
+            value = datetime.datetime.fromisoformat(value)
+        elif sort == "popularity":
+            value = float(value)
+        elif not isinstance(value, str):
+            raise ValueError("invalid cursor key")
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return value, book_id
+
+
+def _to_summaries(books) -> list[BookSummary]:
+    items = []
+    for b in books:
+        summary = BookSummary.model_validate(b)
+        summary.cover_image_url = _ensure_cover_url(b)
+        items.append(summary)
+    return items
+
+
+async def _search_from_index(
+    db: AsyncSession,
+    filters: dict[str, str | None],
+    sort: str,
+    page: int,
+    per_page: int,
+    count: str | None,
+    facets: bool,
+) -> PaginatedBooks:
+    """Answer a filter+sort+page query from the in-memory catalog index."""
+    index = await catalog_index.get(db)
+    mask = index.match(filters)
+    ids = index.page(mask, sort, (page - 1) * per_page, per_page)
+
+    books = []
+    if ids:
+        result = await db.execute(select(Book).where(Book.id.in_(ids)))
+        by_id = {b.id: b for b in result.scalars().all()}
+        books = [by_id[i] for i in ids if i in by_id]
+
+    total = None if count == "none" else mask.bit_count()
+    return PaginatedBooks(
+        items=_to_summaries(books),
+        total=total,
+        page=page,
+        per_page=per_page,
+        pages=(total + per_page - 1) // per_page if total is not None else None,
+        total_strategy="exact" if total is not None else None,
+        facets=by_frequency(index.facet_counts(mask)) if facets else None,
+    )
+
+
 @router.get("", response_model=PaginatedBooks)
 async def search_books(
     q: str | None = None,
@@ -29,29 +149,68 @@ async def search_books(
     reading_level: str | None = None,
     language: str | None = None,
     sort: str = "popularity",
+    match: str = "fulltext",
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=24, ge=1, le=100),
+    pagination: str = "offset",
+    cursor: str | None = None,
+    count: str | None = Query(default=None, pattern="^(exact|estimated|cached|none)$"),
+    facets: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
-    """Search and filter books with full-text search and pagination."""
-    query = select(Book)
+    """Search and filter books with full-text or fuzzy search and pagination.
 
-    # Full-text search using PostgreSQL ts_vectors for relevance-ranked results
-    if q:
-        # Use plainto_tsquery for safe user input (no special syntax needed)
-        ts_query = func.plainto_tsquery("english", q)
-        ts_vector = func.to_tsvector(
-            "english",
-            Book.title + text("' '") + Book.author + text("' '") + Book.description,
-        )
-        # Match on full-text OR fallback to ILIKE for partial matches
-        search_term = f"%{q}%"
-        query = query.where(
-            ts_vector.op("@@")(ts_query)
-            | (Book.title.ilike(search_term))
-            | (Book.author.ilike(search_term))
+    ``match=fulltext`` (default) searches the weighted tsvector; ``match=fuzzy``
+    uses trigram word similarity on title/author to tolerate misspellings.
+
+    ``pagination=cursor`` (implied by passing ``cursor``) switches from OFFSET to
+    keyset paging: each page returns ``next_cursor`` and seeks past it, so deep
+    pages cost the same as the first.
+
+    ``count`` picks how ``total``/``pages`` are computed (``total_strategy`` says
+    which one was used):
+
+    - ``exact`` (default for offset paging): a ``COUNT(*)`` over the filtered set.
+    - ``estimated``: the planner's row estimate, so ``total``/``pages`` are
+      approximate; ``total_strategy`` is ``estimated``.
+    - ``cached``: an exact total reused from a recent identical search (within
+      ``search_count_cache_ttl_seconds``, so it may lag recent writes); a miss
+      counts exactly and reports ``exact``.
+    - ``none`` (default in cursor mode): no count; ``total``, ``pages`` and
+      ``total_strategy`` are null.
+
+    Totals from the in-memory catalog index or from ``facets=true`` are exact
+    whatever ``count`` asks for, unless it is ``none``.
+    """
+    use_cursor = pagination == "cursor" or cursor is not None
+    if use_cursor and sort not in SORT_COLUMNS:
+        raise HTTPException(
+            status_code=400, detail=f"Cursor pagination does not support sort={sort}"
         )
 
+    if settings.catalog_index_enabled and not q and not use_cursor:
+        filters = {
+            "age_range": age_range,
+            "subjects": subject,
+            "time_period": time_period,
+            "region": region,
+            "reading_level": reading_level,
+            "language": language,
+        }
+        return await _search_from_index(db, filters, sort, page, per_page, count, facets)
+
+    query = select(Book)
+
+    rank = None
+    if q and match == "fuzzy":
+        predicate, rank = _fuzzy_match(q)
+        query = query.where(predicate)
+    elif q:
+        # Full-text search against the stored, GIN-indexed search_vector column
+        ts_query = _search_tsquery(q)
+        query = query.where(Book.search_vector.op("@@")(ts_query))
+        rank = func.ts_rank_cd(Book.search_vector, ts_query)
+
     # Filters
     if age_range:
         query = query.where(Book.age_range == age_range)
@@ -66,88 +225,105 @@ async def search_books(
     if language:
         query = query.where(Book.language == language)
 
+    # Facet counts within the filtered set; they carry the exact total for free
+    facet_counts = None
+    facet_total = None
+    if facets:
+        unfiltered = not any(
+            (q, age_range, subject, time_period, region, reading_level, language)
+        )
+        if unfiltered:
+            cache = await facet_cache.get(db)
+            counts, facet_total = cache.counts, cache.total_books
+        else:
+            # A CTE so the filtered set is scanned once for both halves of the query
+            filtered = query.with_only_columns(
+                *(getattr(Book, f) for f in SCALAR_FACETS), Book.subjects
+            ).cte("filtered_books")
+            rows = (await db.execute(facet_counts_query(filtered))).all()
+            counts, facet_total = rows_to_facets(rows)
+        facet_counts = by_frequency(counts)
+
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+    total = None
+    count_strategy = count or ("none" if use_cursor else "exact")
+    if facet_total is not None and count_strategy != "none":
+        total, count_strategy = facet_total, "exact"
+    elif count_strategy == "estimated":
+        total = await estimate_row_count(db, query)
+    elif count_strategy == "cached":
+        cache_key = (
+            " ".join(q.lower().split()) if q else None,
+            match if q else None,
+            age_range,
+            subject,
+            time_period,
+            region,
+            reading_level,
+            language,
+        )
+        total = _count_cache.get(cache_key)
+    if total is None and count_strategy in ("exact", "cached"):
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await db.execute(count_query)).scalar() or 0
+        if count_strategy == "cached":
+            # Miss: keep the exact count for the next pages of this search
+            _count_cache.set(cache_key, total)
+            count_strategy = "exact"
 
     # Sorting
-    if sort == "popularity":
-        query = query.order_by(Book.popularity_score.desc())
-    elif sort == "title":
-        query = query.order_by(Book.title.asc())
-    elif sort == "author":
-        query = query.order_by(Book.author.asc())
-    elif sort == "newest":
-        query = query.order_by(Book.created_at.desc())
+    if sort == "relevance" and rank is not None:
+        query = query.order_by(rank.desc(), Book.popularity_score.desc(), Book.id.desc())
     else:
-        query = query.order_by(Book.popularity_score.desc())
+        column, descending = SORT_COLUMNS.get(sort, SORT_COLUMNS["popularity"])
+        if descending:
+            query = query.order_by(column.desc(), Book.id.desc())
+        else:
+            query = query.order_by(column.asc(), Book.id.asc())
 
     # Pagination
-    offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
+    if use_cursor:
+        if cursor:
+            value, last_id = _decode_cursor(cursor, sort)
+            key, bound = tuple_(column, Book.id), (value, last_id)
+            query = query.where(key < bound if descending else key > bound)
+        # Fetch one extra row to learn whether another page exists
+        query = query.limit(per_page + 1)
+    else:
+        offset = (page - 1) * per_page
+        query = query.offset(offset).limit(per_page)
 
     result = await db.execute(query)
     books = result.scalars().all()
 
-    items = []
-    for b in books:
-        summary = BookSummary.model_validate(b)
-        summary.cover_image_url = _ensure_cover_url(b)
-        items.append(summary)
+    next_cursor = None
+    if use_cursor and len(books) > per_page:
+        books = books[:per_page]
+        next_cursor = _encode_cursor(sort, books[-1])
 
     return PaginatedBooks(
-        items=items,
+        items=_to_summaries(books),
         total=total,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page if per_page else 1,
+        pages=(total + per_page - 1) // per_page if total is not None else None,
+        next_cursor=next_cursor,
+        total_strategy=count_strategy if total is not None else None,
+        facets=facet_counts,
     )
 
 
 @router.get("/filters")
 async def get_filter_options(db: AsyncSession = Depends(get_db)):
-    """Get available filter values for the UI."""
-    # Get distinct age ranges
-    age_ranges_q = await db.execute(
-        select(Book.age_range).distinct().order_by(Book.age_range)
-    )
-    age_ranges = [r[0] for r in age_ranges_q.all()]
-
-    # Get distinct reading levels
-    levels_q = await db.execute(
-        select(Book.reading_level).where(Book.reading_level.isnot(None)).distinct()
-    )
-    reading_levels = sorted([r[0] for r in levels_q.all()])
-
-    # Get all subjects (flatten arrays)
-    subjects_q = await db.execute(
-        select(func.unnest(Book.subjects)).distinct()
-    )
-    subjects = sorted([r[0] for r in subjects_q.all()])
-
-    # Get distinct time periods
-    periods_q = await db.execute(
-        select(Book.time_period).where(Book.time_period.isnot(None)).distinct()
-    )
-    time_periods = sorted([r[0] for r in periods_q.all()])
-
-    # Get distinct regions
-    regions_q = await db.execute(
-        select(Book.region).where(Book.region.isnot(None)).distinct()
-    )
-    regions = sorted([r[0] for r in regions_q.all()])
-
-    # Get distinct languages
-    langs_q = await db.execute(select(Book.language).distinct())
-    languages = sorted([r[0] for r in langs_q.all()])
-
+    """Get available filter values for the UI (served from the facet cache)."""
+    facets = await facet_cache.get(db)
     return {
-        "age_ranges": age_ranges,
-        "reading_levels": reading_levels,
-        "subjects": subjects,
-        "time_periods": time_periods,
-        "regions": regions,
-        "languages": languages,
+        "age_ranges": facets.values("age_range"),
+        "reading_levels": facets.values("reading_level"),
+        "subjects": facets.values("subjects"),
+        "time_periods": facets.values("time_period"),
+        "regions": facets.values("region"),
+        "languages": facets.values("language"),
     }
 
 
@@ -205,13 +381,25 @@ async def get_book(book_id: int, db: AsyncSession = Depends(get_db)):
 
 @router.get("/{book_id}/related", response_model=list[BookSummary])
 async def get_related_books(book_id: int, limit: int = 6, db: AsyncSession = Depends(get_db)):
-    """Get related books based on shared subjects and age range."""
+    """Get related books from the precomputed neighbor table (see app.services.related)."""
+    result = await db.execute(
+        select(Book)
+        .join(RelatedBook, RelatedBook.related_book_id == Book.id)
+        .where(RelatedBook.book_id == book_id)
+        .order_by(RelatedBook.rank)
+        .limit(limit)
+    )
+    related = result.scalars().all()
+    if related:
+        return _to_summaries(related)
+
+    # Not yet precomputed (e.g. CSV-imported since the last rebuild): fall back to
+    # books sharing subjects or age range, excluding current
     result = await db.execute(select(Book).where(Book.id == book_id))
     book = result.scalar_one_or_none()
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
 
-    # Find books sharing subjects or age range, excluding current
     query = (
         select(Book)
         .where(Book.id != book_id)
@@ -223,10 +411,18 @@ async def get_related_books(book_id: int, limit: int = 6, db: AsyncSession = Dep
         .limit(limit)
     )
     result = await db.execute(query)
-    related = result.scalars().all()
-    items = []
-    for b in related:
-        summary = BookSummary.model_validate(b)
-        summary.cover_image_url = _ensure_cover_url(b)
-        items.append(summary)
-    return items
+    return _to_summaries(result.scalars().all())
+
+
+@router.get("/{book_id}/also-planned", response_model=list[BookSummary])
+async def get_also_planned_books(
+    book_id: int, limit: int = Query(6, ge=1, le=24), db: AsyncSession = Depends(get_db)
+):
+    """Families who planned this book also planned these (see app.services.also_planned)."""
+    result = await db.execute(also_planned_query([book_id], limit))
+    books = result.scalars().all()
+    if not books:
+        result = await db.execute(select(Book.id).where(Book.id == book_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Book not found")
+    return _to_summaries(books)
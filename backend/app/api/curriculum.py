@@ -12,9 +12,16 @@ from app.models.reading_plan import ReadingPlan, ReadingPlanItem
 from app.models.schemas import CurriculumRequest, CurriculumResponse
 from app.models.user import User
 from app.services.ai import generate_curriculum
+from app.services.catalog_context import age_band
+from app.services.retrieval import relevant_context
 
 router = APIRouter(prefix="/api/v1/ai", tags=["ai-curriculum"])
 
+# Books offered to the model (fits the context window): the band's most popular,
+# then up to RETRIEVED_BOOKS picked for the child's interests
+POPULAR_BOOKS = 120
+RETRIEVED_BOOKS = 80
+
 
 @router.post("/curriculum", response_model=CurriculumResponse)
 async def build_curriculum(
@@ -38,32 +45,37 @@ async def build_curriculum(
     current_year = datetime.datetime.now().year
     child_age = current_year - child.birth_year if child.birth_year else 8
 
-    # Build catalog context — filter by approximate age range
-    stmt = select(Book).order_by(Book.popularity_score.desc())
-    all_books = (await db.execute(stmt)).scalars().all()
-
-    # Build condensed catalog string
-    catalog_lines = []
-    for b in all_books[:200]:  # Limit to top 200 for context window
-        subjects = ", ".join(b.subjects) if b.subjects else "general"
-        catalog_lines.append(
-            f"- \"{b.title}\" by {b.author} | Ages {b.age_range} | "
-            f"Level: {b.reading_level or 'unspecified'} | Subjects: {subjects}"
-        )
-    book_catalog = "\n".join(catalog_lines)
+    # Catalog context for the child's age band: its popular books, plus books from
+    # the whole catalog matching their interests and chosen subjects/periods
+    preferences = req.preferences or {}
+    interests = " ".join(
+        [
+            *(child.interests or []),
+            *preferences.get("subjects", []),
+            *preferences.get("time_periods", []),
+        ]
+    )
+    block = await relevant_context(
+        db, interests, POPULAR_BOOKS, RETRIEVED_BOOKS, age_band(child_age)
+    )
 
     # Generate curriculum via Groq
     try:
-        result_data = generate_curriculum(
+        result_data = await generate_curriculum(
             child_name=child.name,
             child_age=child_age,
             interests=child.interests,
             reading_level=child.reading_level,
-            book_catalog=book_catalog,
+            book_catalog=block.text,
             preferences=req.preferences,
         )
     except ValueError as e:
         raise HTTPException(status_code=503, detail=str(e))
+    except TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="Curriculum generation is taking too long. Please try again.",
+        )
     except Exception as e:
         import logging
         logging.getLogger(__name__).error("Curriculum generation failed: %s", e)
@@ -94,11 +106,14 @@ async def build_curriculum(
                 if not title:
                     continue
 
-                # Fuzzy match: try exact, then ILIKE
-                book_result = await db.execute(
-                    select(Book).where(Book.title == title).limit(1)
-                )
-                book = book_result.scalar_one_or_none()
+                # Match against the catalog the model was given, then exact, then ILIKE
+                book = block.find(title)
+
+                if not book:
+                    book_result = await db.execute(
+                        select(Book).where(Book.title == title).limit(1)
+                    )
+                    book = book_result.scalar_one_or_none()
 
                 if not book:
                     book_result = await db.execute(
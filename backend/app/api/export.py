@@ -0,0 +1,162 @@
+import csv
+import datetime
+import hmac
+import io
+import json
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.book import Book, BookLink
+from app.models.list import ListItem
+
+router = APIRouter(prefix="/api/v1/export", tags=["export"])
+
+# Rows fetched per server-side cursor round trip; also the size of each streamed chunk
+EXPORT_BATCH_SIZE = 500
+
+# CSV columns: the import-csv columns first, so an export can be re-imported as is
+CSV_COLUMNS = [
+    "title",
+    "author",
+    "description",
+    "long_description",
+    "reading_level",
+    "age_range",
+    "subjects",
+    "time_period",
+    "region",
+    "isbn",
+    "cover_image_url",
+    "language",
+    "series",
+    "awards",
+    "popularity_score",
+    "page_count",
+    "publication_year",
+    "publisher",
+    "id",
+    "created_at",
+    "updated_at",
+    "links",
+    "lists",
+]
+
+
+def verify_export_access(x_api_key: str = Header(...)):
+    keys = [settings.admin_api_key, *settings.partner_api_keys.split(",")]
+    if not any(key.strip() and hmac.compare_digest(x_api_key, key.strip()) for key in keys):
+        raise HTTPException(status_code=403, detail="Invalid API key")
+    return True
+
+
+def _book_record(book: Book) -> dict:
+    return {
+        "id": book.id,
+        "title": book.title,
+        "author": book.author,
+        "description": book.description,
+        "long_description": book.long_description,
+        "reading_level": book.reading_level,
+        "age_range": book.age_range,
+        "subjects": book.subjects or [],
+        "time_period": book.time_period,
+        "region": book.region,
+        "isbn": book.isbn,
+        "cover_image_url": book.cover_image_url,
+        "language": book.language,
+        "series": book.series,
+        "awards": book.awards or [],
+        "popularity_score": book.popularity_score,
+        "page_count": book.page_count,
+        "publication_year": book.publication_year,
+        "publisher": book.publisher,
+        "created_at": book.created_at.isoformat() if book.created_at else None,
+        "updated_at": book.updated_at.isoformat() if book.updated_at else None,
+        "links": [
+            {
+                "source": link.source.name,
+                "url": link.url,
+                "link_type": link.link_type,
+                "price_hint": link.price_hint,
+            }
+            for link in book.links
+        ],
+        "lists": [
+            {"slug": item.curated_list.slug, "name": item.curated_list.name, "rank": item.rank}
+            for item in book.list_items
+        ],
+    }
+
+
+def _ndjson_chunk(books) -> str:
+    return "".join(json.dumps(_book_record(b), separators=(",", ":")) + "\n" for b in books)
+
+
+def _csv_chunk(books, header: bool = False) -> str:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    for book in books:
+        record = _book_record(book)
+        # Multi-valued fields use the same "|" separator as import-csv
+        record["subjects"] = "|".join(record["subjects"])
+        record["awards"] = "|".join(record["awards"])
+        record["links"] = "|".join(f"{link['source']}={link['url']}" for link in record["links"])
+        record["lists"] = "|".join(lst["slug"] for lst in record["lists"])
+        writer.writerow(record)
+    return out.getvalue()
+
+
+async def stream_catalog(fmt: str, updated_since: datetime.datetime | None):
+    """Yield the catalog in ``fmt`` one batch at a time through a server-side cursor.
+
+    Uses its own session because it runs while the response streams. Each batch's
+    links, sources and list memberships are loaded with one selectin query per
+    relationship, and the batch is expunged once written, so memory stays flat
+    however large the catalog is.
+    """
+    query = (
+        select(Book)
+        .options(
+            selectinload(Book.links).selectinload(BookLink.source),
+            selectinload(Book.list_items).selectinload(ListItem.curated_list),
+        )
+        .order_by(Book.updated_at, Book.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if updated_since is not None:
+        query = query.where(Book.updated_at >= updated_since)
+
+    async with async_session() as session:
+        result = await session.stream_scalars(query)
+        if fmt == "csv":
+            yield _csv_chunk([], header=True)
+        async for books in result.partitions():
+            yield _csv_chunk(books) if fmt == "csv" else _ndjson_chunk(books)
+            session.expunge_all()
+
+
+@router.get("/books")
+async def export_books(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    updated_since: datetime.datetime | None = None,
+    _: bool = Depends(verify_export_access),
+):
+    """Stream every book with its links and list memberships (admin and partner keys).
+
+    Books come in ``updated_at`` order; pass the last ``updated_at`` seen as
+    ``updated_since`` to pull only what changed at or after it (dedupe by ``id``).
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"living-books-catalog.{format}"
+    return StreamingResponse(
+        stream_catalog(format, updated_since),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
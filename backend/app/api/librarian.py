@@ -1,23 +1,39 @@
+import json
+import logging
+
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.books import _ensure_cover_url
+from app.api.books import _fuzzy_match, _to_summaries
 from app.core.auth import get_current_user
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import async_session, get_db
 from app.core.rate_limit import free_librarian_limiter, librarian_limiter
 from app.models.book import Book
 from app.models.child import Child
+from app.models.reading_plan import ReadingPlan, ReadingPlanItem
 from app.models.schemas import BookSummary, LibrarianRequest, LibrarianResponse
 from app.models.user import User
-from app.services.ai import ask_librarian_ai
+from app.services.ai import ask_librarian_ai, stream_librarian_ai
+from app.services.also_planned import also_planned_query
+from app.services.catalog_events import catalog_version
+from app.services.librarian_cache import family_hash, librarian_cache
+from app.services.retrieval import relevant_context
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/librarian", tags=["librarian"])
 
+SUGGESTION_COUNT = 5
+# Books offered to the model: the most popular, then up to RETRIEVED_BOOKS matching the question
+POPULAR_BOOKS = 30
+RETRIEVED_BOOKS = 20
+
 
 async def _deterministic_suggestions(
-    message: str, db: AsyncSession
+    message: str, db: AsyncSession, user: User | None = None
 ) -> tuple[str, list[BookSummary]]:
     """Fallback: return database-driven suggestions without LLM."""
     msg = message.lower()
@@ -25,29 +41,56 @@ async def _deterministic_suggestions(
     # Extract potential subjects/keywords
     query = select(Book)
 
-    # Simple keyword matching against subjects, title, description
+    # Keyword matching against title, author, description (trigram-indexed ILIKE),
+    # plus typo-tolerant word similarity on title/author
     if len(msg) > 2:
         # Escape SQL LIKE wildcards in user input
         escaped = msg.replace("%", r"\%").replace("_", r"\_")
+        fuzzy, score = _fuzzy_match(msg)
         query = query.where(
             (Book.title.ilike(f"%{escaped}%", escape="\\"))
             | (Book.author.ilike(f"%{escaped}%", escape="\\"))
             | (Book.description.ilike(f"%{escaped}%", escape="\\"))
-        )
+            | fuzzy
+        ).order_by(score.desc())
 
-    query = query.order_by(Book.popularity_score.desc()).limit(5)
+    query = query.order_by(Book.popularity_score.desc()).limit(SUGGESTION_COUNT)
     result = await db.execute(query)
-    books = result.scalars().all()
+    books = list(result.scalars().all())
+
+    # Top up with what families who planned the matches (or, with no matches, this
+    # user's own planned books) also planned
+    seeds = [b.id for b in books]
+    if not seeds and user:
+        seeds = (
+            select(ReadingPlanItem.book_id)
+            .join(ReadingPlan, ReadingPlanItem.plan_id == ReadingPlan.id)
+            .where(ReadingPlan.user_id == user.id)
+        )
+    co_planned = []
+    if len(books) < SUGGESTION_COUNT and (user or books):
+        result = await db.execute(
+            also_planned_query(seeds, SUGGESTION_COUNT - len(books), exclude=[b.id for b in books])
+        )
+        seen = {b.id for b in books}
+        co_planned = [b for b in result.scalars().all() if b.id not in seen]
 
     if books:
         reply = (
             f"Based on your interest in \"{message}\", here are some living books "
             f"I'd recommend from our collection:"
         )
+        books += co_planned
+    elif co_planned:
+        books = co_planned
+        reply = (
+            "I couldn't find an exact match, but here are books that families with "
+            "reading plans like yours have loved:"
+        )
     else:
         # Fallback to top popular books
         result = await db.execute(
-            select(Book).order_by(Book.popularity_score.desc()).limit(5)
+            select(Book).order_by(Book.popularity_score.desc()).limit(SUGGESTION_COUNT)
         )
         books = result.scalars().all()
         reply = (
@@ -55,12 +98,48 @@ async def _deterministic_suggestions(
             "living books that families love:"
         )
 
-    items = []
-    for b in books:
-        summary = BookSummary.model_validate(b)
-        summary.cover_image_url = _ensure_cover_url(b)
-        items.append(summary)
-    return reply, items
+    return reply, _to_summaries(books)
+
+
+def _mentioned_books(books, reply: str) -> list[BookSummary]:
+    """Catalog books the reply names, or the top three if it names none."""
+    lowered = reply.lower()
+    mentioned = [b for b in books if b.title.lower() in lowered]
+    return _to_summaries(mentioned or books[:3])
+
+
+async def _check_limits(request: Request, user: User | None) -> bool:
+    """Apply the librarian rate limits; returns whether the user is premium."""
+    librarian_limiter.check(request)
+
+    # Free tier: 5 requests/day. Premium: unlimited.
+    is_premium = bool(user and user.subscription_tier == "premium" and user.subscription_active)
+    if user and not is_premium:
+        await free_librarian_limiter.check(user.id)
+    return is_premium
+
+
+async def _family_context(db: AsyncSession, user: User | None, is_premium: bool) -> str | None:
+    """Build family context (premium only — personalized recommendations)."""
+    if not (user and is_premium):
+        return None
+    children_result = await db.execute(select(Child).where(Child.user_id == user.id))
+    children = children_result.scalars().all()
+    if not children:
+        return None
+    parts = []
+    for c in children:
+        interests = ", ".join(c.interests) if c.interests else "various"
+        parts.append(
+            f"- {c.name}: grade {c.grade_level or 'unspecified'}, "
+            f"reading level {c.reading_level or 'unspecified'}, "
+            f"interests: {interests}"
+        )
+    return "Children:\n" + "\n".join(parts)
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 
 @router.post("", response_model=LibrarianResponse)
@@ -73,67 +152,103 @@ async def ask_librarian(
     """
     Ask the Librarian — an intelligent book recommendation endpoint.
     Uses Groq Llama 3.3 70B when available, with family context if logged in.
+    Repeated (or near-identical) questions are answered from ``librarian_cache``.
     Falls back to deterministic database-driven recommendations.
     """
-    librarian_limiter.check(request)
-
-    # Free tier: 5 requests/day. Premium: unlimited.
-    is_premium = user and user.subscription_tier == "premium" and user.subscription_active
-    if user and not is_premium:
-        await free_librarian_limiter.check(user.id)
+    is_premium = await _check_limits(request, user)
 
     if settings.groq_enabled and settings.groq_api_key:
         try:
-            # Get books for context
-            result = await db.execute(
-                select(Book).order_by(Book.popularity_score.desc()).limit(50)
+            family_context = await _family_context(db, user, is_premium)
+            version, family = catalog_version(), family_hash(family_context)
+            cached = librarian_cache.get(req.message, version, family)
+            if cached is not None:
+                return cached
+
+            block = await relevant_context(
+                db, req.message, POPULAR_BOOKS, RETRIEVED_BOOKS
             )
-            books = result.scalars().all()
-            book_catalog = "\n".join(
-                f"- \"{b.title}\" by {b.author} (ages {b.age_range}, "
-                f"subjects: {', '.join(b.subjects)})"
-                for b in books
+            reply = await ask_librarian_ai(req.message, block.text, family_context)
+            response = LibrarianResponse(
+                reply=reply, suggested_books=_mentioned_books(block.books, reply)
             )
-
-            # Build family context (premium only — personalized recommendations)
-            family_context = None
-            if user and is_premium:
-                children_result = await db.execute(
-                    select(Child).where(Child.user_id == user.id)
-                )
-                children = children_result.scalars().all()
-                if children:
-                    parts = []
-                    for c in children:
-                        interests = ", ".join(c.interests) if c.interests else "various"
-                        parts.append(
-                            f"- {c.name}: grade {c.grade_level or 'unspecified'}, "
-                            f"reading level {c.reading_level or 'unspecified'}, "
-                            f"interests: {interests}"
-                        )
-                    family_context = "Children:\n" + "\n".join(parts)
-
-            reply = ask_librarian_ai(req.message, book_catalog, family_context)
-
-            # Find mentioned books
-            mentioned = []
-            for b in books:
-                if b.title.lower() in reply.lower():
-                    summary = BookSummary.model_validate(b)
-                    summary.cover_image_url = _ensure_cover_url(b)
-                    mentioned.append(summary)
-
-            if not mentioned:
-                for b in books[:3]:
-                    summary = BookSummary.model_validate(b)
-                    summary.cover_image_url = _ensure_cover_url(b)
-                    mentioned.append(summary)
-
-            return LibrarianResponse(reply=reply, suggested_books=mentioned)
+            librarian_cache.set(req.message, version, family, response)
+            return response
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning("Groq librarian failed, falling back: %s", e)
+            logger.warning("Groq librarian failed, falling back: %s", e)
 
     # Fallback to deterministic
-    reply, suggested = await _deterministic_suggestions(req.message, db)
+    reply, suggested = await _deterministic_suggestions(req.message, db, user)
     return LibrarianResponse(reply=reply, suggested_books=suggested)
+
+
+@router.post("/stream")
+async def stream_librarian(
+    request: Request,
+    req: LibrarianRequest,
+    db: AsyncSession = Depends(get_db),
+    user: User | None = Depends(get_current_user),
+):
+    """
+    Ask the Librarian as Server-Sent Events: ``token`` events carry pieces of the
+    reply as the model writes them, then one ``done`` event carries the full
+    ``reply`` and ``suggested_books`` (the ``LibrarianResponse`` shape).
+
+    Cached replies, and the deterministic answer (without Groq, or if building
+    the context or the stream fails before the first token), are sent as a
+    single token.
+    """
+    is_premium = await _check_limits(request, user)
+
+    use_ai = bool(settings.groq_enabled and settings.groq_api_key)
+    cached = None
+    if use_ai:
+        try:
+            family_context = await _family_context(db, user, is_premium)
+            version, family = catalog_version(), family_hash(family_context)
+            cached = librarian_cache.get(req.message, version, family)
+            if cached is None:
+                block = await relevant_context(
+                    db, req.message, POPULAR_BOOKS, RETRIEVED_BOOKS
+                )
+        except Exception as e:
+            logger.warning("Librarian context failed, falling back: %s", e)
+            use_ai, cached = False, None
+
+    async def events():
+        if cached is not None:
+            yield _sse("token", {"text": cached.reply})
+            yield _sse("done", cached.model_dump(mode="json"))
+            return
+
+        reply = ""
+        if use_ai:
+            try:
+                async for piece in stream_librarian_ai(req.message, block.text, family_context):
+                    reply += piece
+                    yield _sse("token", {"text": piece})
+                complete = True
+            except Exception as e:
+                logger.warning("Groq librarian stream failed: %s", e)
+                complete = False
+            if reply:
+                response = LibrarianResponse(
+                    reply=reply, suggested_books=_mentioned_books(block.books, reply)
+                )
+                if complete:
+                    librarian_cache.set(req.message, version, family, response)
+                yield _sse("done", response.model_dump(mode="json"))
+                return
+
+        # The request's session has been handed back by now; use a fresh one
+        async with async_session() as session:
+            reply, suggested = await _deterministic_suggestions(req.message, session, user)
+        yield _sse("token", {"text": reply})
+        response = LibrarianResponse(reply=reply, suggested_books=suggested)
+        yield _sse("done", response.model_dump(mode="json"))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
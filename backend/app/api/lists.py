@@ -17,8 +17,12 @@ async def get_lists(
     category: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all curated lists with book counts."""
-    query = select(CuratedList)
+    """Get all curated lists with book counts (one aggregate query)."""
+    query = (
+        select(CuratedList, func.count(ListItem.id))
+        .outerjoin(ListItem, ListItem.list_id == CuratedList.id)
+        .group_by(CuratedList.id)
+    )
 
     if featured is not None:
         query = query.where(CuratedList.is_featured == featured)
@@ -27,13 +31,9 @@ async def get_lists(
 
     query = query.order_by(CuratedList.is_featured.desc(), CuratedList.name)
     result = await db.execute(query)
-    lists = result.scalars().all()
 
-    # Get book counts
     out = []
-    for lst in lists:
-        count_q = select(func.count()).select_from(ListItem).where(ListItem.list_id == lst.id)
-        count = (await db.execute(count_q)).scalar() or 0
+    for lst, count in result.all():
         lst_dict = CuratedListOut.model_validate(lst)
         lst_dict.book_count = count
         out.append(lst_dict)
@@ -18,6 +18,7 @@ from app.models.schemas import (
     NewsletterSubscribeResponse,
 )
 from app.models.subscriber import EmailSubscriber
+from app.services import catalog_events
 
 
 def _unsubscribe_sig(email: str) -> str:
@@ -52,6 +53,7 @@ async def subscribe(
         )
         await db.execute(stmt)
         await db.commit()
+        await catalog_events.subscribers_changed()
 
         # Send welcome email (non-blocking — failures don't affect subscription)
         try:
@@ -0,0 +1,98 @@
+import math
+from email.utils import format_datetime
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.book import Book
+from app.models.list import CuratedList
+from app.models.schemas import SitemapIndex
+
+router = APIRouter(prefix="/api/v1/sitemap", tags=["sitemap"])
+
+# Sitemap protocol limit of URLs per sitemap file
+SITEMAP_PAGE_SIZE = 50_000
+
+
+async def _summary(db: AsyncSession, column, timestamp) -> tuple[int, object]:
+    """Row count and latest timestamp: the validator for a feed's conditional GETs."""
+    result = await db.execute(select(func.count(column), func.max(timestamp)))
+    count, latest = result.one()
+    return count or 0, latest
+
+
+def _not_modified(request: Request, response: Response, count: int, latest, page: int):
+    """Set ETag/Last-Modified; return a 304 response if the client's copy is current."""
+    etag = f'W/"{count}-{latest.timestamp() if latest else 0}-{page}"'
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    if latest is not None:
+        response.headers["Last-Modified"] = format_datetime(latest, usegmt=True)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=dict(response.headers))
+    return None
+
+
+@router.get("", response_model=SitemapIndex)
+async def sitemap_index(db: AsyncSession = Depends(get_db)):
+    """How many sitemap pages of books and lists there are."""
+    result = await db.execute(
+        select(
+            select(func.count(Book.id)).scalar_subquery(),
+            select(func.count(CuratedList.id)).scalar_subquery(),
+        )
+    )
+    books, lists = result.one()
+    return SitemapIndex(
+        page_size=SITEMAP_PAGE_SIZE,
+        books=books,
+        lists=lists,
+        book_pages=max(1, math.ceil(books / SITEMAP_PAGE_SIZE)),
+        list_pages=max(1, math.ceil(lists / SITEMAP_PAGE_SIZE)),
+    )
+
+
+@router.get("/books")
+async def sitemap_books(
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1),
+    db: AsyncSession = Depends(get_db),
+):
+    """One page of ``[id, updated_at]`` pairs in id order."""
+    count, latest = await _summary(db, Book.id, Book.updated_at)
+    not_modified = _not_modified(request, response, count, latest, page)
+    if not_modified:
+        return not_modified
+
+    result = await db.execute(
+        select(Book.id, Book.updated_at)
+        .order_by(Book.id)
+        .offset((page - 1) * SITEMAP_PAGE_SIZE)
+        .limit(SITEMAP_PAGE_SIZE)
+    )
+    return {"page": page, "items": [[book_id, updated] for book_id, updated in result.all()]}
+
+
+@router.get("/lists")
+async def sitemap_lists(
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1),
+    db: AsyncSession = Depends(get_db),
+):
+    """One page of ``[slug, created_at]`` pairs in slug order."""
+    count, latest = await _summary(db, CuratedList.id, CuratedList.created_at)
+    not_modified = _not_modified(request, response, count, latest, page)
+    if not_modified:
+        return not_modified
+
+    result = await db.execute(
+        select(CuratedList.slug, CuratedList.created_at)
+        .order_by(CuratedList.slug)
+        .offset((page - 1) * SITEMAP_PAGE_SIZE)
+        .limit(SITEMAP_PAGE_SIZE)
+    )
+    return {"page": page, "items": [[slug, created] for slug, created in result.all()]}
@@ -27,6 +27,7 @@ async def track_click(
             link_id=req.link_id,
             source_name=req.source_name,
             referrer=req.referrer,
+            session_id=req.session_id,
         )
         db.add(event)
         await db.commit()
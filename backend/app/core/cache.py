@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+MAX_CACHE_ENTRIES = 4_096
+
+
+class TTLCache:
+    """Simple in-memory LRU cache with per-entry expiry. Per-process, like RateLimiter."""
+
+    def __init__(self, ttl_seconds: float = 60, max_entries: int = MAX_CACHE_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        # Evict least recently used entries if exceeding cap
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def items(self):
+        """Unexpired ``(key, value)`` pairs, least recently used first (order unchanged)."""
+        now = time.monotonic()
+        return [
+            (key, value)
+            for key, (expires_at, value) in self._entries.items()
+            if expires_at > now
+        ]
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,4 +1,5 @@
 import warnings
+from typing import Literal
 
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
@@ -18,15 +19,40 @@ class Settings(BaseSettings):
     anthropic_api_key: str = ""
 
     admin_api_key: str = ""
+    # Comma-separated keys that may use the bulk catalog export (admins always can)
+    partner_api_keys: str = ""
+    # Where CSV uploads are spooled while their import job runs
+    import_spool_dir: str = "/tmp/living-books-imports"
 
     # Auth
     jwt_secret_key: str = ""
     jwt_access_token_expire_minutes: int = 60 * 24  # 24 hours
 
+    # Startup seeding: "check" runs the seed only if the app_meta seed marker is
+    # missing or stale; "skip" does no database work at boot (start.sh seeds first)
+    startup_seed: Literal["check", "skip"] = "check"
+
     # Debug mode (controls /docs exposure)
     debug: bool = False
     magic_link_expire_minutes: int = 15
 
+    # Catalog search
+    search_count_cache_ttl_seconds: int = 60
+    facet_cache_ttl_seconds: int = 300
+    # Answer filter+sort+page from an in-memory bitmap index (Postgres only hydrates)
+    catalog_index_enabled: bool = False
+    catalog_index_ttl_seconds: int = 300
+    # Prompt blocks of popular books the LLM endpoints recommend from
+    catalog_context_ttl_seconds: int = 300
+
+    # Response cache for public catalog GETs; "redis://..." shares it across workers
+    response_cache_enabled: bool = True
+    response_cache_url: str = ""
+    response_cache_ttl_seconds: int = 300
+    response_cache_max_entries: int = 4096
+    # Cache-Control max-age sent to browsers and CDNs
+    response_cache_max_age_seconds: int = 60
+
     # Email (Resend)
     resend_api_key: str = ""
     from_email: str = "Living Books Hub <noreply@livingbookshub.com>"
@@ -34,6 +60,15 @@ class Settings(BaseSettings):
     # Groq AI
     groq_api_key: str = ""
     groq_enabled: bool = False
+    # LLM calls in flight per worker; more wait for a slot (within their timeout)
+    groq_max_concurrency: int = 32
+    groq_librarian_timeout_seconds: float = 20.0
+    groq_curriculum_timeout_seconds: float = 90.0
+    # Librarian replies reused for the same (or a near-identical) question
+    librarian_cache_ttl_seconds: int = 3600
+    librarian_cache_max_entries: int = 2048
+    # Minimum word overlap (Jaccard) for a near-identical question to reuse a reply
+    librarian_cache_similarity: float = 0.8
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
@@ -1,8 +1,16 @@
+import json
 import ssl as ssl_module
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import ClauseElement, Executable, Select
 
 from app.core.config import settings
 
@@ -21,6 +29,68 @@ engine = create_async_engine(
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+@dataclass
+class QueryStats:
+    """SQL statements run while a ``track_queries()`` block was active."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+    parent: "QueryStats | None" = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            if elapsed_ms >= stats.slowest_ms:
+                stats.slowest_ms = elapsed_ms
+                stats.slowest_statement = statement
+            stats = stats.parent
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count and time the statements this task runs inside the block.
+
+    Blocks nest: an inner block's statements also count toward the outer one.
+    SQLAlchemy runs driver calls in a greenlet that shares the caller's
+    context, so async code is attributed to the request that awaited it.
+    """
+    stats = QueryStats(parent=_query_stats.get())
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start"].pop()
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute: drop its start time so
+    # it can't pair with a later statement or pile up on a pooled connection
+    conn = context.connection
+    if context.cursor is not None and conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -33,3 +103,28 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <statement>``, keeping the statement's bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_row_count(db: AsyncSession, statement: Select) -> int:
+    """Return the planner's row estimate for a query without executing it."""
+    plan = (await db.execute(Explain(statement))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0
@@ -0,0 +1,71 @@
+import logging
+
+from app.core.config import settings
+from app.core.database import track_queries
+
+logger = logging.getLogger(__name__)
+
+# Longest slowest-statement text written to logs
+MAX_LOGGED_STATEMENT = 500
+
+
+def server_timing(stats) -> bytes:
+    """``Server-Timing`` value: total DB time with the query count, and the slowest query."""
+    return (
+        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_ms:.1f}"
+    ).encode()
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware recording SQL query count and time per HTTP request.
+
+    Every request is logged with ``db_queries``/``db_ms``/``db_slowest_ms``/
+    ``db_slowest_sql`` fields (for JSON log formatters); in debug mode the
+    totals are also sent as a ``Server-Timing`` header. Queries run after the
+    response headers (e.g. a dependency's commit) reach the log but not the header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = {}
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                if settings.debug:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", server_timing(stats)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status.get("code"), stats)
+
+    @staticmethod
+    def _log(scope, status_code, stats) -> None:
+        logger.info(
+            "%s %s %s: %d queries in %.1fms",
+            scope["method"],
+            scope["path"],
+            status_code,
+            stats.count,
+            stats.total_ms,
+            extra={
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "db_queries": stats.count,
+                "db_ms": round(stats.total_ms, 2),
+                "db_slowest_ms": round(stats.slowest_ms, 2),
+                "db_slowest_sql": (stats.slowest_statement or "")[:MAX_LOGGED_STATEMENT] or None,
+            },
+        )
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import re
+from urllib.parse import parse_qsl, urlencode
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+CATALOG_TAG = "catalog"
+
+# Public catalog GETs that are cached, and the tags whose invalidation expires them.
+# Path parameters can be interpolated into tags, e.g. "book:{id}". Every entry is
+# also tagged CATALOG_TAG, which bulk reloads invalidate.
+CACHE_RULES: list[tuple[re.Pattern, tuple[str, ...]]] = [
+    (re.compile(r"^/api/v1/books/filters$"), ("books",)),
+    (re.compile(r"^/api/v1/books/(?P<id>\d+)$"), ("book:{id}", "sources")),
+    (re.compile(r"^/api/v1/books/(?P<id>\d+)/related$"), ("books", "lists", "related")),
+    (re.compile(r"^/api/v1/lists$"), ("lists",)),
+    (re.compile(r"^/api/v1/lists/[^/]+$"), ("lists",)),
+    (re.compile(r"^/api/v1/stats$"), ("books", "lists", "subscribers")),
+]
+
+
+def match_tags(path: str) -> tuple[str, ...] | None:
+    """Tags for a cacheable path, or None if the path isn't cached."""
+    for pattern, tags in CACHE_RULES:
+        match = pattern.match(path)
+        if match:
+            return (CATALOG_TAG, *(tag.format(**match.groupdict()) for tag in tags))
+    return None
+
+
+def cache_key(path: str, query_string: bytes) -> str:
+    """Path plus query parameters in sorted order, so ``?a=1&b=2`` == ``?b=2&a=1``."""
+    params = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+    return f"{path}?{urlencode(params)}" if params else path
+
+
+# Response headers not replayed from a cached entry: hop-by-hop headers, and the
+# ones the middleware computes itself for every response
+_UNCACHED_HEADERS = frozenset({
+    b"connection", b"keep-alive", b"proxy-authenticate", b"proxy-authorization", b"te",
+    b"trailer", b"trailers", b"transfer-encoding", b"upgrade",
+    b"content-length", b"etag", b"x-cache",
+})
+
+
+def _pack(etag: str, headers: list[tuple[bytes, bytes]], body: bytes) -> bytes:
+    pairs = [[k.decode("latin-1"), v.decode("latin-1")] for k, v in headers]
+    return json.dumps({"etag": etag, "headers": pairs}).encode() + b"\n" + body
+
+
+def _unpack(entry: bytes) -> tuple[str, list[tuple[bytes, bytes]], bytes]:
+    meta, _, body = entry.partition(b"\n")
+    fields = json.loads(meta)
+    # Entries written before headers were stored carry only their content type
+    pairs = fields.get("headers") or [["content-type", fields["content_type"]]]
+    headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in pairs]
+    return fields["etag"], headers, body
+
+
+class MemoryBackend:
+    """Per-process LRU with TTL; tag versions are plain counters."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._entries = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self._versions: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._entries.set(key, value, ttl_seconds)
+
+    async def tag_versions(self, tags) -> list[int]:
+        return [self._versions.get(tag, 0) for tag in tags]
+
+    async def bump(self, tags) -> None:
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    async def clear(self) -> None:
+        # Versions are kept: an in-flight miss must not land on a reused version
+        self._entries.clear()
+
+
+class RedisBackend:
+    """Shared cache for multi-worker deployments.
+
+    ``client`` is any object with the async ``get``/``set``/``mget``/``incr``
+    subset of the redis-py API (``redis.asyncio.Redis``, or a local stand-in).
+    """
+
+    def __init__(self, client, prefix: str = "lbh:response:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self.client.set(self.prefix + key, value, ex=int(ttl_seconds))
+
+    async def tag_versions(self, tags) -> list[int]:
+        values = await self.client.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        return [int(v or 0) for v in values]
+
+    async def bump(self, tags) -> None:
+        for tag in tags:
+            await self.client.incr(f"{self.prefix}tag:{tag}")
+
+    async def clear(self) -> None:
+        await self.bump([CATALOG_TAG])
+
+
+class ResponseCache:
+    """Caches public GET responses, keyed on path + normalized query + tag versions.
+
+    Invalidating a tag bumps its version, so every entry stored under the old
+    version stops matching and ages out of the backend on its own. A response
+    computed while its tags are invalidated is stored under the versions read
+    before it ran, so it can never be served afterwards.
+    """
+
+    def __init__(self, backend, ttl_seconds: float = 300, max_age: int = 60):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.max_age = max_age
+
+    async def invalidate(self, *tags: str) -> None:
+        await self.backend.bump(tags)
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+    @property
+    def cache_control(self) -> bytes:
+        return f"public, max-age={self.max_age}, stale-while-revalidate={self.max_age}".encode()
+
+
+def _make_backend():
+    url = settings.response_cache_url
+    if url.startswith(("redis://", "rediss://")):
+        import redis.asyncio as redis  # optional dependency: pip install ".[redis]"
+
+        return RedisBackend(redis.from_url(url))
+    return MemoryBackend(settings.response_cache_ttl_seconds, settings.response_cache_max_entries)
+
+
+response_cache = ResponseCache(
+    _make_backend(),
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    max_age=settings.response_cache_max_age_seconds,
+)
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving CACHE_RULES paths from ``response_cache``.
+
+    Emits ``ETag``/``Cache-Control`` and answers matching ``If-None-Match``
+    requests with 304, on hits and misses alike.
+    """
+
+    def __init__(self, app, cache: ResponseCache | None = None):
+        self.app = app
+        self.cache = cache or response_cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+        if not settings.response_cache_enabled:
+            return await self.app(scope, receive, send)
+        tags = match_tags(scope["path"])
+        if tags is None:
+            return await self.app(scope, receive, send)
+
+        versions = await self.cache.backend.tag_versions(tags)
+        key = f"{cache_key(scope['path'], scope['query_string'])}|{','.join(map(str, versions))}"
+        if_none_match = dict(scope["headers"]).get(b"if-none-match", b"").decode("latin-1")
+
+        entry = await self.cache.backend.get(key)
+        if entry is not None:
+            etag, headers, body = _unpack(entry)
+            return await self._respond(send, etag, headers, body, if_none_match, b"HIT")
+
+        start, chunks = {}, []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        body = b"".join(chunks)
+        raw_headers = [(k.lower(), v) for k, v in start.get("headers", [])]
+        if start.get("status") != 200 or any(k == b"set-cookie" for k, _ in raw_headers):
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        headers = [(k, v) for k, v in raw_headers if k not in _UNCACHED_HEADERS]
+        await self.cache.backend.set(key, _pack(etag, headers, body), self.cache.ttl_seconds)
+        await self._respond(send, etag, headers, body, if_none_match, b"MISS")
+
+    async def _respond(self, send, etag, headers, body, if_none_match, status):
+        """Send the endpoint's own ``headers`` (its Cache-Control wins over ours)."""
+        own = [(b"etag", etag.encode()), (b"x-cache", status)]
+        if not any(k == b"cache-control" for k, _ in headers):
+            own.append((b"cache-control", self.cache.cache_control))
+        if etag in (t.strip() for t in if_none_match.split(",")) or if_none_match.strip() == "*":
+            kept = [(k, v) for k, v in headers if not k.startswith(b"content-")]
+            await send({"type": "http.response.start", "status": 304, "headers": own + kept})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        own.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": own + headers})
+        await send({"type": "http.response.body", "body": body})
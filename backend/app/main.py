@@ -12,28 +12,41 @@ from app.api import (
     children,
     curriculum,
     drip,
+    export,
     librarian,
     lists,
     newsletter,
     plans,
     reviews,
+    sitemap,
     stats,
     stripe_routes,
     tracking,
 )
 from app.core.config import settings
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.response_cache import ResponseCacheMiddleware
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Run seed on startup if DB is empty
+    # Seed on startup only if the seed marker is missing or stale; STARTUP_SEED=skip
+    # leaves boot free of database work when start.sh has already seeded
+    if settings.startup_seed == "check":
+        try:
+            from scripts.seed import startup_check
+            await startup_check()
+        except Exception as e:
+            logger.warning("Startup seed check failed: %s", e)
+    # CSV import jobs run in-process; any left queued/running died with the old process
     try:
-        from scripts.seed import seed
-        await seed()
+        from app.services.import_jobs import fail_interrupted_jobs
+        if failed := await fail_interrupted_jobs():
+            logger.warning("Marked %d interrupted import job(s) failed", failed)
     except Exception as e:
-        logger.warning("Seed on startup failed: %s", e)
+        logger.warning("Import job cleanup failed: %s", e)
     yield
 
 
@@ -50,6 +63,12 @@ app = FastAPI(
     openapi_url="/openapi.json" if settings.debug else None,
 )
 
+# Response cache for public catalog GETs (added first so CORS wraps cached responses)
+app.add_middleware(ResponseCacheMiddleware)
+
+# Per-request SQL query count/time: logged, and a Server-Timing header in debug
+app.add_middleware(QueryStatsMiddleware)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -63,9 +82,11 @@ app.add_middleware(
 app.include_router(books.router)
 app.include_router(lists.router)
 app.include_router(stats.router)
+app.include_router(sitemap.router)
 app.include_router(librarian.router)
 app.include_router(stripe_routes.router)
 app.include_router(admin.router)
+app.include_router(export.router)
 app.include_router(newsletter.router)
 app.include_router(drip.router)
 app.include_router(tracking.router)
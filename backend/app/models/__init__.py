@@ -1,10 +1,13 @@
+from app.models.app_meta import AppMeta
 from app.models.book import Book, BookLink, Source
 from app.models.child import Child
 from app.models.click_event import ClickEvent
 from app.models.drip_event import EmailDripEvent
+from app.models.import_job import ImportJob
 from app.models.list import CuratedList, ListItem
 from app.models.newsletter_send import NewsletterSend
 from app.models.reading_plan import ReadingPlan, ReadingPlanItem
+from app.models.related_book import CoPlannedBook, RelatedBook
 from app.models.review import BookReview
 from app.models.subscriber import EmailSubscriber
 from app.models.user import User
@@ -24,4 +27,8 @@ __all__ = [
     "ReadingPlan",
     "ReadingPlanItem",
     "BookReview",
+    "RelatedBook",
+    "CoPlannedBook",
+    "ImportJob",
+    "AppMeta",
 ]
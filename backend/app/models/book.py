@@ -1,14 +1,56 @@
 import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
+# Weighted search document: title matches outrank author matches, which outrank
+# description matches. Postgres keeps the stored column current on every write.
+BOOK_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(author, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
 
 class Book(Base):
     __tablename__ = "books"
+    __table_args__ = (
+        Index("ix_books_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram indexes (pg_trgm) back fuzzy matching and substring ILIKE
+        Index(
+            "ix_books_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_books_author_trgm",
+            "author",
+            postgresql_using="gin",
+            postgresql_ops={"author": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_books_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        # (sort key, id) indexes serve keyset pagination seeks for each sort option
+        Index("ix_books_popularity_id", "popularity_score", "id"),
+        Index("ix_books_title_id", "title", "id"),
+        Index("ix_books_author_id", "author", "id"),
+        Index("ix_books_created_at_id", "created_at", "id"),
+        # Incremental export (updated_since) scans in (updated_at, id) order
+        Index("ix_books_updated_at_id", "updated_at", "id"),
+        # Sitemap feed pages through (id, updated_at) with an index-only scan
+        Index("ix_books_id_updated_at", "id", postgresql_include=["updated_at"]),
+        # Related-books candidates: books sharing a subject or the series
+        Index("ix_books_subjects", "subjects", postgresql_using="gin"),
+        Index("ix_books_series", "series"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
@@ -35,6 +77,9 @@ class Book(Base):
     updated_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(BOOK_SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
 
     links: Mapped[list["BookLink"]] = relationship(back_populates="book", cascade="all, delete")
     list_items: Mapped[list["ListItem"]] = relationship(back_populates="book")
@@ -12,4 +12,5 @@ class ClickEvent(Base):
     link_id = Column(Integer, nullable=True)
     source_name = Column(String, nullable=False)
     referrer = Column(String, nullable=True)
+    session_id = Column(String(64), nullable=True, index=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
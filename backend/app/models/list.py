@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class CuratedList(Base):
     __tablename__ = "curated_lists"
+    __table_args__ = (
+        # Sitemap feed reads (slug, created_at) with an index-only scan
+        Index("ix_curated_lists_slug_created_at", "slug", postgresql_include=["created_at"]),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(300), nullable=False)
@@ -27,6 +31,10 @@ class CuratedList(Base):
 
 class ListItem(Base):
     __tablename__ = "list_items"
+    __table_args__ = (
+        Index("ix_list_items_list_id", "list_id"),
+        Index("ix_list_items_book_id", "book_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     list_id: Mapped[int] = mapped_column(
@@ -149,10 +149,13 @@ class ListItemCreate(BaseModel):
 # --- Pagination ---
 class PaginatedBooks(BaseModel):
     items: list[BookSummary]
-    total: int
+    total: int | None  # None when the count was skipped (cursor pagination)
     page: int
     per_page: int
-    pages: int
+    pages: int | None
+    next_cursor: str | None = None
+    total_strategy: str | None = None  # "exact", "estimated" or "cached"
+    facets: dict[str, dict[str, int]] | None = None  # facet -> value -> book count
 
 
 # --- Librarian Chat ---
@@ -188,6 +191,35 @@ class CatalogStats(BaseModel):
     reading_levels: list[str]
 
 
+# --- Import jobs ---
+class ImportJobOut(BaseModel):
+    id: int
+    status: str
+    filename: str | None
+    file_size: int
+    rows: int
+    created_count: int
+    updated_count: int
+    error_count: int
+    errors: list[dict]
+    error_message: str | None
+    cancel_requested: bool
+    created_at: datetime | None
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
+
+# --- Sitemap ---
+class SitemapIndex(BaseModel):
+    page_size: int
+    books: int
+    lists: int
+    book_pages: int
+    list_pages: int
+
+
 # --- Newsletter ---
 class NewsletterSubscribeRequest(BaseModel):
     email: EmailStr
@@ -216,6 +248,7 @@ class ClickTrackRequest(BaseModel):
     link_id: int | None = None
     source_name: str
     referrer: str | None = None
+    session_id: str | None = Field(None, max_length=64)
 
 
 class ClickTrackResponse(BaseModel):
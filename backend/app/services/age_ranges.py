@@ -0,0 +1,38 @@
+import re
+
+from sqlalchemy import Integer, case, cast, func
+
+from app.models.book import Book
+
+# Upper bound given to open-ended ranges such as "12+" or "12-adult"
+ADULT_AGE = 18
+
+# age_range is free text like "8-12", "8", "12+" or "12-adult". The same
+# patterns drive the Python parser and its SQL twin, so both read a range alike.
+_LOW = r"^\s*(\d+)"
+_HIGH = r"^\s*\d+\s*-\s*(\d+)"
+_BARE = r"^\s*\d+\s*$"
+
+_LOW_RE, _HIGH_RE, _BARE_RE = re.compile(_LOW), re.compile(_HIGH), re.compile(_BARE)
+
+
+def parse_age_range(age_range: str | None) -> tuple[int, int] | None:
+    """Parse "6-10", "8", "12+" or "12-adult" into an inclusive (low, high) age
+    span; open-ended ranges run to ADULT_AGE. None if there's no leading age."""
+    low = _LOW_RE.search(age_range or "")
+    if low is None:
+        return None
+    high = _HIGH_RE.search(age_range)
+    if high:
+        return int(low.group(1)), int(high.group(1))
+    if _BARE_RE.search(age_range):
+        return int(low.group(1)), int(low.group(1))
+    return int(low.group(1)), ADULT_AGE
+
+
+# SQL twin of parse_age_range: NULL age_from where the Python side returns None
+age_from = cast(func.substring(Book.age_range, _LOW), Integer)
+age_to = func.coalesce(
+    cast(func.substring(Book.age_range, _HIGH), Integer),
+    case((Book.age_range.regexp_match(_BARE), age_from), else_=ADULT_AGE),
+)
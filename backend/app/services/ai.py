@@ -1,18 +1,55 @@
+import asyncio
 import json
+from collections.abc import AsyncIterator
 
-from groq import Groq
+import httpx
+from groq import AsyncGroq
 
 from app.core.config import settings
 
+MODEL = "llama-3.3-70b-versatile"
 
-def get_groq_client() -> Groq | None:
-    """Get Groq client if configured."""
+_client: AsyncGroq | None = None
+_limiter: asyncio.Semaphore | None = None
+
+
+def get_groq_client() -> AsyncGroq | None:
+    """Shared async Groq client (one pooled HTTP connection pool per worker), if configured."""
+    global _client
     if not settings.groq_enabled or not settings.groq_api_key:
         return None
-    return Groq(api_key=settings.groq_api_key)
+    if _client is None:
+        _client = AsyncGroq(
+            api_key=settings.groq_api_key,
+            max_retries=1,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.groq_max_concurrency,
+                    max_keepalive_connections=settings.groq_max_concurrency,
+                ),
+            ),
+        )
+    return _client
+
+
+def _get_limiter() -> asyncio.Semaphore:
+    global _limiter
+    if _limiter is None:
+        _limiter = asyncio.Semaphore(settings.groq_max_concurrency)
+    return _limiter
+
+
+async def _complete(client: AsyncGroq, timeout: float, **kwargs):
+    """One chat completion, holding a limiter slot; the timeout covers queueing too.
+
+    Raises TimeoutError when the slot or the completion takes longer than ``timeout``.
+    """
+    async with asyncio.timeout(timeout):
+        async with _get_limiter():
+            return await client.chat.completions.create(model=MODEL, timeout=timeout, **kwargs)
 
 
-def generate_curriculum(
+async def generate_curriculum(
     child_name: str,
     child_age: int,
     interests: list[str],
@@ -82,8 +119,9 @@ Guidelines:
 
 Make it wonderful — this parent is trusting you to craft their child's literary year."""
 
-    response = client.chat.completions.create(
-        model="llama-3.3-70b-versatile",
+    response = await _complete(
+        client,
+        settings.groq_curriculum_timeout_seconds,
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
@@ -96,19 +134,9 @@ Make it wonderful — this parent is trusting you to craft their child's literar
     return json.loads(response.choices[0].message.content)
 
 
-def ask_librarian_ai(
-    message: str,
-    book_catalog: str,
-    family_context: str | None = None,
-) -> str:
-    """
-    AI librarian chat using Groq Llama 3.3 70B.
-    Returns a text response with book recommendations.
-    """
-    client = get_groq_client()
-    if not client:
-        raise ValueError("Groq AI is not configured")
-
+def _librarian_messages(
+    message: str, book_catalog: str, family_context: str | None
+) -> list[dict]:
     family_section = ""
     if family_context:
         family_section = f"""
@@ -128,14 +156,77 @@ Be warm, specific, and helpful. Explain why each book is special and who it's pe
 Keep responses concise — 2-3 book recommendations max with brief explanations.
 Always use the exact title and author from the catalog."""
 
-    response = client.chat.completions.create(
-        model="llama-3.3-70b-versatile",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": message},
-        ],
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": message},
+    ]
+
+
+async def ask_librarian_ai(
+    message: str,
+    book_catalog: str,
+    family_context: str | None = None,
+) -> str:
+    """
+    AI librarian chat using Groq Llama 3.3 70B.
+    Returns a text response with book recommendations.
+    """
+    client = get_groq_client()
+    if not client:
+        raise ValueError("Groq AI is not configured")
+
+    response = await _complete(
+        client,
+        settings.groq_librarian_timeout_seconds,
+        messages=_librarian_messages(message, book_catalog, family_context),
         temperature=0.7,
         max_tokens=500,
     )
 
     return response.choices[0].message.content
+
+
+async def stream_librarian_ai(
+    message: str,
+    book_catalog: str,
+    family_context: str | None = None,
+) -> AsyncIterator[str]:
+    """
+    Same as ``ask_librarian_ai`` but yields the reply in pieces as Groq produces them.
+
+    The limiter slot is held until the stream ends; the librarian timeout bounds
+    the whole stream (raises TimeoutError).
+    """
+    client = get_groq_client()
+    if not client:
+        raise ValueError("Groq AI is not configured")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.groq_librarian_timeout_seconds
+    limiter = _get_limiter()
+    await asyncio.wait_for(limiter.acquire(), deadline - loop.time())
+    stream = None
+    try:
+        stream = await asyncio.wait_for(
+            client.chat.completions.create(
+                model=MODEL,
+                messages=_librarian_messages(message, book_catalog, family_context),
+                temperature=0.7,
+                max_tokens=500,
+                stream=True,
+                timeout=settings.groq_librarian_timeout_seconds,
+            ),
+            deadline - loop.time(),
+        )
+        chunks = aiter(stream)
+        while True:
+            try:
+                chunk = await asyncio.wait_for(anext(chunks), deadline - loop.time())
+            except StopAsyncIteration:
+                break
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        if stream is not None:
+            await stream.close()
+        limiter.release()
@@ -0,0 +1,146 @@
+import array
+import asyncio
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import Select, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.book import Book
+from app.models.click_event import ClickEvent
+from app.models.reading_plan import ReadingPlan, ReadingPlanItem
+from app.models.related_book import CoPlannedBook
+
+TOP_N = 12
+
+# A family's reading plans are a stronger signal than one browsing session's clicks
+PLAN_WEIGHT = 1.0
+CLICK_WEIGHT = 0.5
+
+# Baskets touching more books than this (bulk imports, crawlers) are dropped: they
+# say little about taste and their pairs would dominate X.T @ X.
+MAX_BASKET_SIZE = 200
+
+# Minimum weighted co-occurrence for a pair to count: one shared family plan, or
+# two shared click sessions.
+MIN_CO_WEIGHT = 1.0
+
+STREAM_BATCH_SIZE = 50_000
+
+
+async def load_baskets(db: AsyncSession, statement: Select) -> tuple[np.ndarray, np.ndarray]:
+    """Stream ``(basket key, book_id)`` rows into dense basket indexes and book ids.
+
+    Rows are read in server-side batches into compact int arrays, so millions of
+    events never materialise as ORM objects or Python tuples all at once.
+    """
+    keys: dict = {}
+    baskets, books = array.array("q"), array.array("q")
+    result = await db.stream(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+    async for rows in result.partitions():
+        for key, book_id in rows:
+            baskets.append(keys.setdefault(key, len(keys)))
+            books.append(book_id)
+    return np.frombuffer(baskets, dtype=np.int64), np.frombuffer(books, dtype=np.int64)
+
+
+def _basket_matrix(baskets: np.ndarray, cols: np.ndarray, n_books: int, weight: float):
+    """Binary basket x book CSR matrix scaled so that X.T @ X sums ``weight`` per basket."""
+    m = sparse.csr_matrix(
+        (np.ones(len(cols), dtype=np.float32), (baskets, cols)),
+        shape=(int(baskets.max()) + 1, n_books),
+    )
+    m.sum_duplicates()
+    m.data[:] = np.sqrt(weight)
+    sizes = np.diff(m.indptr)
+    return m[(sizes >= 2) & (sizes <= MAX_BASKET_SIZE)]
+
+
+def co_occurrence_neighbors(
+    sources: list[tuple[np.ndarray, np.ndarray, float]], top_n: int = TOP_N
+) -> dict[int, list[tuple[int, float]]]:
+    """Item-item cosine neighbors from weighted ``(baskets, book_ids, weight)`` sources.
+
+    Stacks every source into one sparse basket x book matrix X; X.T @ X is the
+    weighted co-occurrence matrix, normalised by each book's own weight into
+    cosine similarity. Work and memory scale with the number of co-occurring
+    pairs, not books squared.
+    """
+    sources = [s for s in sources if len(s[1])]
+    if not sources:
+        return {}
+    book_ids = np.unique(np.concatenate([books for _, books, _ in sources]))
+    x = sparse.vstack([
+        _basket_matrix(baskets, np.searchsorted(book_ids, books), len(book_ids), weight)
+        for baskets, books, weight in sources
+    ]).tocsr()
+
+    co = (x.T @ x).tocsr()
+    weights = co.diagonal()
+    co.setdiag(0)
+    co.data[co.data < MIN_CO_WEIGHT - 1e-4] = 0  # float32 tolerance
+    co.eliminate_zeros()
+    inv_norm = np.zeros_like(weights)
+    np.divide(1.0, np.sqrt(weights), out=inv_norm, where=weights > 0)
+    sim = (sparse.diags(inv_norm) @ co @ sparse.diags(inv_norm)).tocsr()
+
+    neighbors = {}
+    for row in range(sim.shape[0]):
+        start, end = sim.indptr[row], sim.indptr[row + 1]
+        if start == end:
+            continue
+        scores, cols = sim.data[start:end], sim.indices[start:end]
+        if len(scores) > top_n:
+            keep = np.argpartition(-scores, top_n)[:top_n]
+            scores, cols = scores[keep], cols[keep]
+        order = np.lexsort((book_ids[cols], -scores))
+        neighbors[int(book_ids[row])] = [
+            (int(book_ids[cols[i]]), float(scores[i])) for i in order
+        ]
+    return neighbors
+
+
+async def rebuild_also_planned(db: AsyncSession, top_n: int = TOP_N) -> int:
+    """Batch job: recompute the co-planned neighbor table. Returns rows written."""
+    plans = await load_baskets(
+        db,
+        select(ReadingPlan.user_id, ReadingPlanItem.book_id).join(
+            ReadingPlan, ReadingPlanItem.plan_id == ReadingPlan.id
+        ),
+    )
+    clicks = await load_baskets(
+        db,
+        # click_events.book_id has no FK; skip clicks on books since deleted
+        select(ClickEvent.session_id, ClickEvent.book_id)
+        .join(Book, Book.id == ClickEvent.book_id)
+        .where(ClickEvent.session_id.isnot(None)),
+    )
+    # Sparse products and the per-row ranking are CPU-bound: keep them off the event loop
+    neighbors = await asyncio.to_thread(
+        co_occurrence_neighbors, [(*plans, PLAN_WEIGHT), (*clicks, CLICK_WEIGHT)], top_n
+    )
+
+    await db.execute(delete(CoPlannedBook))
+    rows = [
+        {"book_id": book_id, "related_book_id": other_id, "rank": rank, "score": score}
+        for book_id, ranked in neighbors.items()
+        for rank, (other_id, score) in enumerate(ranked, start=1)
+    ]
+    for start in range(0, len(rows), STREAM_BATCH_SIZE):
+        await db.execute(insert(CoPlannedBook), rows[start:start + STREAM_BATCH_SIZE])
+    return len(rows)
+
+
+def also_planned_query(seed_book_ids, limit: int, exclude=()) -> Select:
+    """Books most co-planned with any of ``seed_book_ids`` (a list or subquery)."""
+    query = (
+        select(Book)
+        .join(CoPlannedBook, CoPlannedBook.related_book_id == Book.id)
+        .where(CoPlannedBook.book_id.in_(seed_book_ids))
+        .group_by(Book.id)
+        .order_by(func.max(CoPlannedBook.score).desc(), Book.id)
+        .limit(limit)
+    )
+    if exclude:
+        query = query.where(Book.id.not_in(exclude))
+    return query
@@ -0,0 +1,111 @@
+import asyncio
+from dataclasses import dataclass, field
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.book import Book
+from app.services.age_ranges import ADULT_AGE, age_from, age_to, parse_age_range
+from app.services.catalog_events import catalog_version
+
+# Age bands the curriculum builder's context is sliced by (inclusive)
+AGE_BANDS = ((0, 5), (6, 8), (9, 11), (12, 14), (15, 18))
+
+# Columns a prompt line or a suggested-book summary needs
+CONTEXT_COLUMNS = (
+    Book.id,
+    Book.title,
+    Book.author,
+    Book.description,
+    Book.age_range,
+    Book.subjects,
+    Book.cover_image_url,
+    Book.isbn,
+    Book.reading_level,
+    Book.popularity_score,
+)
+
+
+def age_span(age_range: str | None) -> tuple[int, int]:
+    """Age span for the band test, as the SQL one reads it: unparseable ranges
+    match every band."""
+    return parse_age_range(age_range) or (0, ADULT_AGE)
+
+
+def age_band(age: int) -> tuple[int, int]:
+    """The band containing ``age`` (clamped to the youngest/oldest band)."""
+    for band in AGE_BANDS:
+        if age <= band[1]:
+            return band if age >= band[0] else AGE_BANDS[0]
+    return AGE_BANDS[-1]
+
+
+def catalog_line(book) -> str:
+    subjects = ", ".join(book.subjects) if book.subjects else "general"
+    return (
+        f"- \"{book.title}\" by {book.author} | Ages {book.age_range} | "
+        f"Level: {book.reading_level or 'unspecified'} | Subjects: {subjects}"
+    )
+
+
+@dataclass
+class CatalogBlock:
+    """A prompt-ready slice of the catalog: its rows (CONTEXT_COLUMNS) and their text."""
+
+    version: int
+    books: list = field(default_factory=list)
+    text: str = ""
+
+    def find(self, title: str):
+        """The book in this block titled ``title`` (case-insensitive), if any."""
+        wanted = title.strip().lower()
+        return next((b for b in self.books if b.title.lower() == wanted), None)
+
+
+class CatalogContext:
+    """Per-process cache of catalog prompt blocks, keyed on the catalog version.
+
+    A block is the most popular ``limit`` books, optionally within an age band,
+    built with one LIMITed query and then reused until the catalog version moves
+    (an admin write in this worker) or ``ttl_seconds`` pass (writes elsewhere).
+    Identical text across requests also keeps the prompt prefix cacheable by the
+    LLM provider.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self._blocks = TTLCache(ttl_seconds=ttl_seconds, max_entries=64)
+        self._lock = asyncio.Lock()
+
+    async def get(
+        self, db: AsyncSession, limit: int, band: tuple[int, int] | None = None
+    ) -> CatalogBlock:
+        key = (catalog_version(), band, limit)
+        block = self._blocks.get(key)
+        if block is None:
+            async with self._lock:
+                block = self._blocks.get(key)
+                if block is None:
+                    block = await self._build(db, key)
+                    self._blocks.set(key, block)
+        return block
+
+    async def _build(self, db: AsyncSession, key) -> CatalogBlock:
+        version, band, limit = key
+        stmt = select(*CONTEXT_COLUMNS)
+        if band is not None:
+            stmt = stmt.where(
+                or_(age_from.is_(None), and_(age_from <= band[1], age_to >= band[0]))
+            )
+        result = await db.execute(stmt.order_by(Book.popularity_score.desc()).limit(limit))
+        books = list(result.all())
+        return CatalogBlock(
+            version=version, books=books, text="\n".join(catalog_line(b) for b in books)
+        )
+
+    def invalidate(self) -> None:
+        self._blocks.clear()
+
+
+catalog_context = CatalogContext(ttl_seconds=settings.catalog_context_ttl_seconds)
@@ -0,0 +1,66 @@
+# Keeps catalog caches in step with catalog writes. Admin routes and the seed
+# call these after committing, so every cache derived from the catalog (in-process
+# indexes and the shared response cache) is patched or invalidated in one place.
+
+from app.core.response_cache import response_cache
+from app.models.book import Book
+from app.services.catalog_index import catalog_index
+from app.services.facets import facet_cache
+
+_version = 0
+
+
+def catalog_version() -> int:
+    """Counter bumped whenever the books themselves change (per process).
+
+    Caches built from book content (LLM prompts, librarian replies) key on it.
+    Other workers see a write only when their own entries expire.
+    """
+    return _version
+
+
+def _bump_version() -> None:
+    global _version
+    _version += 1
+
+
+async def books_created(books: list[Book]) -> None:
+    _bump_version()
+    for book in books:
+        facet_cache.add_book(book)
+        catalog_index.upsert(book)
+    await response_cache.invalidate("books")
+
+
+async def book_links_changed(book_id: int) -> None:
+    await response_cache.invalidate(f"book:{book_id}")
+
+
+async def source_created() -> None:
+    await response_cache.invalidate("sources")
+
+
+async def list_created() -> None:
+    facet_cache.add_list()
+    await response_cache.invalidate("lists")
+
+
+async def list_items_changed() -> None:
+    await response_cache.invalidate("lists")
+
+
+async def related_rebuilt() -> None:
+    await response_cache.invalidate("related")
+
+
+async def subscribers_changed() -> None:
+    # The landing-page stats include the subscriber count
+    await response_cache.invalidate("subscribers")
+
+
+async def catalog_reloaded() -> None:
+    """Bulk changes (CSV import, seed): drop derived state and rebuild lazily."""
+    _bump_version()
+    facet_cache.invalidate()
+    catalog_index.invalidate()
+    await response_cache.clear()
@@ -0,0 +1,185 @@
+import asyncio
+import datetime
+import heapq
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.book import Book
+from app.services.facets import FACET_FIELDS, SCALAR_FACETS
+
+# sort option -> (Book attribute, descending); mirrors SORT_COLUMNS in app.api.books
+SORT_KEYS = {
+    "popularity": ("popularity_score", True),
+    "title": ("title", False),
+    "author": ("author", False),
+    "newest": ("created_at", True),
+}
+
+_EPOCH = datetime.datetime.min.replace(tzinfo=datetime.UTC)
+
+
+class CatalogIndex:
+    """In-memory bitmap index over book facets, with presorted orders per sort option.
+
+    Every book gets a dense position. Each facet value keeps a bitset (a Python
+    int) of the positions that have it, so a filter combination is a handful of
+    big-int ANDs and its size is ``bit_count()``. Pages are read off presorted
+    position lists; Postgres is only used to hydrate the page's rows.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self._reset()
+        self._lock = asyncio.Lock()
+
+    def _reset(self) -> None:
+        self._ids: list[int] = []  # position -> book id
+        self._positions: dict[int, int] = {}  # book id -> position
+        self._live = 0  # bitset of positions holding a current book
+        self._postings: dict[str, dict[str, int]] = {f: {} for f in FACET_FIELDS}
+        self._values: list[dict] = []  # position -> {facet: values} for patching
+        self._keys: dict[str, list] = {sort: [] for sort in SORT_KEYS}
+        self._orders: dict[str, list[int]] = {}
+        self._ranks: dict[str, list[int]] = {}
+        self._loaded_at: float | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def get(self, db: AsyncSession) -> "CatalogIndex":
+        """Return the index, rebuilding it in one query if it is cold or stale."""
+        if not self.is_fresh:
+            async with self._lock:
+                if not self.is_fresh:
+                    await self._build(db)
+        return self
+
+    async def _build(self, db: AsyncSession) -> None:
+        result = await db.execute(
+            select(
+                Book.id,
+                *(getattr(Book, f) for f in FACET_FIELDS),
+                *(getattr(Book, attr) for attr, _ in SORT_KEYS.values()),
+            )
+        )
+        self._reset()
+        for row in result.all():
+            self._add(row._mapping)
+        self._loaded_at = time.monotonic()
+
+    def _add(self, book) -> None:
+        """Assign ``book`` (a row mapping or attribute dict) the next position."""
+        pos = len(self._ids)
+        self._ids.append(book["id"])
+        self._positions[book["id"]] = pos
+        self._live |= 1 << pos
+
+        values = {f: ([book[f]] if book[f] is not None else []) for f in SCALAR_FACETS}
+        values["subjects"] = sorted(set(book["subjects"] or []))
+        self._values.append(values)
+        for field, field_values in values.items():
+            postings = self._postings[field]
+            for value in field_values:
+                postings[value] = postings.get(value, 0) | (1 << pos)
+
+        for sort, (attr, _) in SORT_KEYS.items():
+            key = book[attr]
+            if key is None:
+                key = _EPOCH if attr == "created_at" else ""
+            self._keys[sort].append(key)
+        self._orders.clear()
+
+    def remove(self, book_id: int) -> None:
+        pos = self._positions.pop(book_id, None)
+        if pos is None:
+            return
+        bit = 1 << pos
+        self._live &= ~bit
+        for field, field_values in self._values[pos].items():
+            for value in field_values:
+                self._postings[field][value] &= ~bit
+        self._orders.clear()
+
+    def upsert(self, book: Book) -> None:
+        """Patch the index after a book is created or edited (no-op while cold)."""
+        if self._loaded_at is None:
+            return
+        self.remove(book.id)
+        attrs = dict(vars(book))
+        # Server defaults aren't loaded on a freshly flushed object
+        attrs.setdefault("created_at", datetime.datetime.now(datetime.UTC))
+        attrs.setdefault("popularity_score", 0.0)
+        for field in FACET_FIELDS:
+            attrs.setdefault(field, None)
+        self._add(attrs)
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def _order(self, sort: str) -> tuple[list[int], list[int]]:
+        """Positions in ``sort`` order (ties broken by id) and each position's rank."""
+        if sort not in self._orders:
+            _, descending = SORT_KEYS[sort]
+            keys, ids = self._keys[sort], self._ids
+            order = sorted(range(len(ids)), key=lambda p: (keys[p], ids[p]), reverse=descending)
+            ranks = [0] * len(order)
+            for rank, pos in enumerate(order):
+                ranks[pos] = rank
+            self._orders[sort], self._ranks[sort] = order, ranks
+        return self._orders[sort], self._ranks[sort]
+
+    def match(self, filters: dict[str, str | None]) -> int:
+        """Bitset of books matching every given ``facet -> value`` filter."""
+        mask = self._live
+        for field, value in filters.items():
+            if value is not None:
+                mask &= self._postings[field].get(value, 0)
+        return mask
+
+    def page(self, mask: int, sort: str, offset: int, limit: int) -> list[int]:
+        """Book ids of one page of ``mask`` in ``sort`` order."""
+        order, ranks = self._order(sort if sort in SORT_KEYS else "popularity")
+        matches = mask.bit_count()
+        wanted = offset + limit
+
+        if wanted * len(order) < matches * matches:
+            # Broad filter: walking the presorted order fills the page quickly
+            bits = mask.to_bytes((len(self._ids) + 7) // 8 or 1, "little")
+            hits = []
+            for pos in order:
+                if bits[pos >> 3] >> (pos & 7) & 1:
+                    hits.append(pos)
+                    if len(hits) == wanted:
+                        break
+        else:
+            # Selective filter: pull out the few matching positions and rank them
+            binary = bin(mask)[:1:-1]  # little-endian: character i is position i
+            positions = []
+            pos = binary.find("1")
+            while pos != -1:
+                positions.append(pos)
+                pos = binary.find("1", pos + 1)
+            hits = heapq.nsmallest(wanted, positions, key=ranks.__getitem__)
+        return [self._ids[pos] for pos in hits[offset:]]
+
+    def facet_counts(self, mask: int) -> dict[str, dict[str, int]]:
+        """Per-value counts of every facet within ``mask``."""
+        counts = {}
+        for field, postings in self._postings.items():
+            field_counts = {}
+            for value, posting in postings.items():
+                n = (mask & posting).bit_count()
+                if n:
+                    field_counts[value] = n
+            counts[field] = field_counts
+        return counts
+
+
+catalog_index = CatalogIndex(ttl_seconds=settings.catalog_index_ttl_seconds)
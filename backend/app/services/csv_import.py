@@ -0,0 +1,190 @@
+import csv
+import io
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from sqlalchemy import Column, MetaData, String, Table, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+
+from app.models.book import Book
+
+# Columns an import row may set, in COPY order (the import-csv / export CSV columns)
+IMPORT_COLUMNS = (
+    "title",
+    "author",
+    "description",
+    "long_description",
+    "reading_level",
+    "age_range",
+    "subjects",
+    "time_period",
+    "region",
+    "isbn",
+    "cover_image_url",
+    "language",
+    "series",
+    "awards",
+    "popularity_score",
+    "page_count",
+    "publication_year",
+    "publisher",
+)
+REQUIRED_COLUMNS = ("title", "author", "description", "age_range")
+
+CHUNK_ROWS = 5_000
+MAX_REPORTED_ERRORS = 1_000
+
+# Session-local staging table shaped like the import columns of books; COPY lands
+# here and one INSERT ... SELECT moves each chunk into books.
+staging = Table(
+    "book_import_staging",
+    MetaData(),
+    *(Column(name, Book.__table__.c[name].type) for name in IMPORT_COLUMNS),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+_MAX_LENGTHS = {
+    name: Book.__table__.c[name].type.length
+    for name in IMPORT_COLUMNS
+    if isinstance(Book.__table__.c[name].type, String) and Book.__table__.c[name].type.length
+}
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    error_count: int = 0
+    errors: list[dict] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+
+    def add_error(self, row: int, error: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": error})
+
+    def as_dict(self) -> dict:
+        seconds = time.monotonic() - self.started_at
+        return {
+            "rows": self.rows,
+            "created": self.created,
+            "updated": self.updated,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(self.rows / seconds) if seconds > 0 else self.rows,
+        }
+
+
+def parse_row(row: dict) -> tuple:
+    """Validate one CSV row and return it as a staging record (raises ValueError)."""
+    missing = [c for c in REQUIRED_COLUMNS if not (row.get(c) or "").strip()]
+    if missing:
+        raise ValueError(f"missing required column(s): {', '.join(missing)}")
+
+    values = {
+        "title": row["title"].strip(),
+        "author": row["author"].strip(),
+        "description": row["description"],
+        "long_description": row.get("long_description") or None,
+        "reading_level": row.get("reading_level") or None,
+        "age_range": row["age_range"].strip(),
+        "subjects": [s.strip() for s in (row.get("subjects") or "").split("|") if s.strip()],
+        "time_period": row.get("time_period") or None,
+        "region": row.get("region") or None,
+        "isbn": (row.get("isbn") or "").strip() or None,
+        "cover_image_url": row.get("cover_image_url") or None,
+        "language": row.get("language") or "English",
+        "series": row.get("series") or None,
+        "awards": [a.strip() for a in (row.get("awards") or "").split("|") if a.strip()] or None,
+        "popularity_score": float(row.get("popularity_score") or 0),
+        "page_count": int(row["page_count"]) if row.get("page_count") else None,
+        "publication_year": (
+            int(row["publication_year"]) if row.get("publication_year") else None
+        ),
+        "publisher": row.get("publisher") or None,
+    }
+    for name, length in _MAX_LENGTHS.items():
+        if values[name] is not None and len(values[name]) > length:
+            raise ValueError(f"{name} is longer than {length} characters")
+    return tuple(values[name] for name in IMPORT_COLUMNS)
+
+
+def _upsert_from_staging():
+    insert = pg_insert(Book).from_select(
+        list(IMPORT_COLUMNS), select(*(staging.c[name] for name in IMPORT_COLUMNS))
+    )
+    return insert.on_conflict_do_update(
+        index_elements=[Book.isbn],
+        set_={
+            **{name: insert.excluded[name] for name in IMPORT_COLUMNS if name != "isbn"},
+            "updated_at": func.now(),
+        },
+    ).returning(literal_column("xmax = 0").label("created"))
+
+
+async def load_chunk(db: AsyncSession, records: list[tuple]) -> tuple[int, int]:
+    """COPY ``records`` into staging and upsert them into books by ISBN.
+
+    Returns ``(created, updated)``. Rows without an ISBN are always inserted.
+    """
+    await db.execute(CreateTable(staging, if_not_exists=True))
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        staging.name, records=records, columns=list(IMPORT_COLUMNS)
+    )
+    result = await db.execute(_upsert_from_staging())
+    flags = result.scalars().all()
+    await db.execute(text(f"TRUNCATE {staging.name}"))
+    created = sum(1 for f in flags if f)
+    return created, len(flags) - created
+
+
+async def import_csv(
+    db: AsyncSession,
+    binary: BinaryIO,
+    on_chunk: Callable[[ImportStats], Awaitable[None]] | None = None,
+) -> ImportStats:
+    """Stream a CSV upload through parse -> validate -> COPY -> upsert, chunk by chunk.
+
+    ``binary`` is read incrementally, so only one chunk of rows is in memory at a
+    time. Within a chunk the last row for an ISBN wins (Postgres can't upsert
+    the same key twice in one statement). ``on_chunk`` runs after each chunk,
+    e.g. to report progress.
+    """
+    stats = ImportStats()
+    reader = csv.DictReader(io.TextIOWrapper(binary, encoding="utf-8-sig", newline=""))
+    rows = enumerate(reader, start=2)  # row 1 is the header
+    try:
+        while chunk := list(itertools.islice(rows, CHUNK_ROWS)):
+            by_isbn, without_isbn = {}, []
+            for line, row in chunk:
+                stats.rows += 1
+                try:
+                    record = parse_row(row)
+                except (KeyError, ValueError) as e:
+                    stats.add_error(line, str(e))
+                    continue
+                isbn = record[IMPORT_COLUMNS.index("isbn")]
+                if isbn:
+                    by_isbn[isbn] = record
+                else:
+                    without_isbn.append(record)
+            records = [*by_isbn.values(), *without_isbn]
+            if records:
+                created, updated = await load_chunk(db, records)
+                stats.created += created
+                stats.updated += updated
+            if on_chunk is not None:
+                await on_chunk(stats)
+    except (UnicodeDecodeError, csv.Error) as e:
+        stats.add_error(reader.line_num, f"unreadable CSV: {e}")
+    return stats
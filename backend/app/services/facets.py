@@ -0,0 +1,126 @@
+import asyncio
+import time
+from collections import Counter
+
+from sqlalchemy import FromClause, String, case, func, literal, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.book import Book
+from app.models.list import CuratedList
+
+# Facet name -> Book attribute. "subjects" is an array and counts once per element.
+FACET_FIELDS = ("age_range", "subjects", "time_period", "region", "reading_level", "language")
+SCALAR_FACETS = tuple(f for f in FACET_FIELDS if f != "subjects")
+
+
+def facet_counts_query(source: FromClause):
+    """Per-value counts for every facet over ``source`` in a single statement.
+
+    ``source`` is the books table or a filtered CTE/subquery of it. Scalar facets are
+    computed with GROUPING SETS (the empty set yields the row total under the
+    facet name ``"books"``) and subjects with a lateral unnest, joined by UNION ALL.
+    Rows are ``(facet, value, count)``.
+    """
+    cols = [source.c[f] for f in SCALAR_FACETS]
+    facet = case(*[(func.grouping(c) == 0, c.name) for c in cols], else_="books")
+    scalar_counts = (
+        select(facet.label("facet"), func.coalesce(*cols).label("value"), func.count())
+        .select_from(source)
+        .group_by(func.grouping_sets(*[tuple_(c) for c in cols], tuple_()))
+    )
+    subject = func.unnest(source.c.subjects).table_valued("value").render_derived()
+    subject_counts = (
+        select(literal("subjects", String), subject.c.value, func.count())
+        .select_from(source, subject)
+        .group_by(subject.c.value)
+    )
+    return union_all(scalar_counts, subject_counts)
+
+
+def rows_to_facets(rows) -> tuple[dict[str, Counter], int]:
+    """Fold ``(facet, value, count)`` rows into per-facet counters and a row total."""
+    counts = {f: Counter() for f in FACET_FIELDS}
+    total = 0
+    for facet, value, n in rows:
+        if facet == "books":
+            total = n
+        elif facet in counts and value is not None:
+            counts[facet][value] = n
+    return counts, total
+
+
+def by_frequency(counts: dict[str, Counter]) -> dict[str, dict[str, int]]:
+    """Order each facet's values by descending count, then value, for responses."""
+    return {
+        field: dict(sorted(values.items(), key=lambda kv: (-kv[1], kv[0])))
+        for field, values in counts.items()
+    }
+
+
+class FacetCache:
+    """Per-value facet counts and catalog totals, held in process.
+
+    Loaded with one query on first use, patched incrementally by admin writes,
+    and reloaded after ``ttl_seconds`` so writes on other workers show up.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self.counts: dict[str, Counter] = {f: Counter() for f in FACET_FIELDS}
+        self.total_books = 0
+        self.total_lists = 0
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def get(self, db: AsyncSession) -> "FacetCache":
+        """Return the cache, loading it in one round trip if it is cold or stale."""
+        if not self.is_fresh:
+            async with self._lock:
+                if not self.is_fresh:
+                    await self._load(db)
+        return self
+
+    async def _load(self, db: AsyncSession) -> None:
+        list_total = select(
+            literal("lists", String), literal(None, String), func.count(CuratedList.id)
+        )
+        result = await db.execute(
+            union_all(*facet_counts_query(Book.__table__).selects, list_total)
+        )
+        rows = result.all()
+        self.counts, self.total_books = rows_to_facets(rows)
+        self.total_lists = next((n for facet, _, n in rows if facet == "lists"), 0)
+        self._loaded_at = time.monotonic()
+
+    def values(self, field: str) -> list[str]:
+        """Sorted values of a facet that at least one book has."""
+        return sorted(v for v, n in self.counts[field].items() if n > 0)
+
+    def add_book(self, book: Book) -> None:
+        if self._loaded_at is None:
+            return
+        self.total_books += 1
+        for field in SCALAR_FACETS:
+            value = getattr(book, field)
+            if value is not None:
+                self.counts[field][value] += 1
+        for subject in set(book.subjects or []):
+            self.counts["subjects"][subject] += 1
+
+    def add_list(self) -> None:
+        if self._loaded_at is not None:
+            self.total_lists += 1
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+
+facet_cache = FacetCache(ttl_seconds=settings.facet_cache_ttl_seconds)
@@ -0,0 +1,141 @@
+import asyncio
+import datetime
+import logging
+import os
+import shutil
+import uuid
+from typing import BinaryIO
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.import_job import ImportJob
+from app.services import catalog_events, csv_import
+
+logger = logging.getLogger(__name__)
+
+SPOOL_CHUNK_BYTES = 1024 * 1024
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+
+class ImportCancelledError(Exception):
+    pass
+
+
+def spool_upload(upload: BinaryIO) -> tuple[str, int]:
+    """Copy an upload to the spool directory in fixed-size chunks; return (path, bytes)."""
+    os.makedirs(settings.import_spool_dir, exist_ok=True)
+    path = os.path.join(settings.import_spool_dir, f"{uuid.uuid4().hex}.csv")
+    with open(path, "wb") as out:
+        shutil.copyfileobj(upload, out, SPOOL_CHUNK_BYTES)
+        size = out.tell()
+    return path, size
+
+
+async def create_job(db: AsyncSession, upload: BinaryIO, filename: str | None) -> ImportJob:
+    """Spool ``upload`` to disk (in a worker thread) and record a queued job for it
+    (caller commits)."""
+    path, size = await asyncio.to_thread(spool_upload, upload)
+    job = ImportJob(status="queued", filename=filename, file_path=path, file_size=size)
+    db.add(job)
+    await db.flush()
+    return job
+
+
+def _record_progress(job: ImportJob, stats: csv_import.ImportStats) -> None:
+    job.rows = stats.rows
+    job.created_count = stats.created
+    job.updated_count = stats.updated
+    job.error_count = stats.error_count
+    job.errors = list(stats.errors)
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+async def run_import_job(job_id: int) -> None:
+    """Process a queued job's spooled file, committing progress after every chunk.
+
+    Each chunk commits on its own, so a failed or cancelled job keeps the rows
+    imported before it stopped; re-running the same file is safe because rows
+    upsert by ISBN.
+    """
+    async with async_session() as db:
+        job = await db.get(ImportJob, job_id)
+        if job is None or job.status != "queued":
+            return
+        if job.cancel_requested:
+            job.status, job.finished_at = "cancelled", _now()
+            await db.commit()
+            _remove_spool(job.file_path)
+            return
+        job.status, job.started_at = "running", _now()
+        await db.commit()
+
+        async def on_chunk(stats: csv_import.ImportStats) -> None:
+            _record_progress(job, stats)
+            await db.commit()
+            cancelled = await db.scalar(
+                select(ImportJob.cancel_requested).where(ImportJob.id == job_id)
+            )
+            if cancelled:
+                raise ImportCancelledError
+
+        try:
+            with open(job.file_path, "rb") as f:
+                stats = await csv_import.import_csv(db, f, on_chunk=on_chunk)
+            _record_progress(job, stats)
+            job.status = "succeeded"
+        except ImportCancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            logger.exception("Import job %s failed", job_id)
+            await db.rollback()
+            job = await db.get(ImportJob, job_id)
+            job.status, job.error_message = "failed", str(e)[:1000]
+        job.finished_at = _now()
+        await db.commit()
+
+    _remove_spool(job.file_path)
+    if job.rows:
+        await catalog_events.catalog_reloaded()
+
+
+async def fail_interrupted_jobs() -> int:
+    """Mark jobs left queued or running by a previous process as failed.
+
+    Jobs run as in-process background tasks, so after a restart nothing will
+    pick them up again. Called at startup (this assumes workers start together,
+    as with a single uvicorn process); returns how many jobs were failed.
+    """
+    async with async_session() as db:
+        result = await db.execute(
+            update(ImportJob)
+            .where(ImportJob.status.in_(("queued", "running")))
+            .values(
+                status="failed",
+                error_message="Interrupted by a server restart; upload the file again "
+                "to finish (rows already imported upsert by ISBN)",
+                finished_at=_now(),
+            )
+        )
+        await db.commit()
+    return result.rowcount
+
+
+def _remove_spool(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def request_cancel(db: AsyncSession, job: ImportJob) -> ImportJob:
+    """Flag a job for cancellation; the worker stops after its current chunk."""
+    if job.status not in FINISHED_STATUSES:
+        job.cancel_requested = True
+        await db.flush()
+    return job
@@ -0,0 +1,115 @@
+import hashlib
+import re
+from dataclasses import dataclass
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.schemas import LibrarianResponse
+
+# Words that don't change what a librarian question is asking for
+STOP_WORDS = frozenset(
+    "a an and any are about for good great i in is me my of on or our please "
+    "recommend recommendations some suggest the to with".split()
+)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize(message: str) -> tuple[str, ...]:
+    """Sorted content words of ``message``: lowercase, no punctuation, stop words
+    and plural ``s`` dropped. Questions that differ only in those share a key."""
+    words = set()
+    for word in _WORD.findall(message.lower()):
+        if word in STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.add(word)
+    return tuple(sorted(words))
+
+
+def family_hash(family_context: str | None) -> str:
+    if not family_context:
+        return ""
+    return hashlib.sha256(family_context.encode()).hexdigest()[:16]
+
+
+def similarity(a: tuple[str, ...], b: tuple[str, ...]) -> float:
+    """Jaccard overlap of two normalized questions; 0 unless their numbers match
+    (so "for a 5 year old" never answers "for a 9 year old")."""
+    if {w for w in a if w.isdigit()} != {w for w in b if w.isdigit()}:
+        return 0.0
+    union = len(set(a) | set(b))
+    return len(set(a) & set(b)) / union if union else 0.0
+
+
+@dataclass
+class LibrarianCacheStats:
+    hits: int = 0
+    similar_hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.hits + self.similar_hits + self.misses
+        return {
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.similar_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+
+class LibrarianCache:
+    """Per-process cache of LLM librarian replies.
+
+    Entries are keyed on ``(catalog version, family hash, normalized question)``,
+    so a catalog write or a different family never reuses a reply. A miss on the
+    exact key falls back to the most similar cached question in the same
+    catalog version and family, if it clears ``min_similarity``.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, min_similarity: float):
+        self._entries = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.min_similarity = min_similarity
+        self.stats = LibrarianCacheStats()
+
+    def get(self, message: str, version: int, family: str) -> LibrarianResponse | None:
+        words = normalize(message)
+        if not words:
+            self.stats.misses += 1
+            return None
+        response = self._entries.get((version, family, words))
+        if response is not None:
+            self.stats.hits += 1
+            return response
+
+        best, best_score = None, self.min_similarity
+        for (v, f, cached_words), cached in self._entries.items():
+            if v == version and f == family:
+                score = similarity(words, cached_words)
+                if score >= best_score:
+                    best, best_score = cached, score
+        if best is not None:
+            self.stats.similar_hits += 1
+            return best
+        self.stats.misses += 1
+        return None
+
+    def set(self, message: str, version: int, family: str, response: LibrarianResponse) -> None:
+        words = normalize(message)
+        if words:
+            self._entries.set((version, family, words), response)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.stats = LibrarianCacheStats()
+
+    def as_dict(self) -> dict:
+        return {"entries": len(self._entries), **self.stats.as_dict()}
+
+
+librarian_cache = LibrarianCache(
+    ttl_seconds=settings.librarian_cache_ttl_seconds,
+    max_entries=settings.librarian_cache_max_entries,
+    min_similarity=settings.librarian_cache_similarity,
+)
@@ -0,0 +1,267 @@
+import asyncio
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass
+
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.book import Book
+from app.models.list import ListItem
+from app.models.related_book import RelatedBook
+from app.services.age_ranges import parse_age_range
+
+TOP_K = 12
+
+# Weights of each similarity signal; they sum to 1.0 so scores stay in [0, 1].
+WEIGHTS = {
+    "subjects": 0.40,
+    "age": 0.20,
+    "lists": 0.15,
+    "series": 0.10,
+    "time_period": 0.10,
+    "region": 0.05,
+}
+
+# Subjects shared by more books than this don't generate candidates on their own
+# (they still count towards the Jaccard score of candidates found another way, so
+# a partial scorer over a book's candidates ranks them exactly as the full one).
+MAX_CANDIDATE_POSTING = 2_000
+
+
+def age_similarity(a: tuple[int, int] | None, b: tuple[int, int] | None) -> float:
+    """Overlap of two age spans over their union; adjacent spans get partial credit."""
+    if a is None or b is None:
+        return 0.0
+    overlap = min(a[1], b[1]) - max(a[0], b[0]) + 1
+    if overlap > 0:
+        return overlap / (max(a[1], b[1]) - min(a[0], b[0]) + 1)
+    return 0.25 if overlap >= -1 else 0.0
+
+
+@dataclass
+class _BookFeatures:
+    id: int
+    subjects: frozenset[str]
+    ages: tuple[int, int] | None
+    time_period: str | None
+    region: str | None
+    series: str | None
+    lists: frozenset[int]
+    popularity: float
+
+
+class RelatedScorer:
+    """Scores book-to-book similarity over an in-memory snapshot of the catalog.
+
+    Candidates for a book are the books sharing a (not too common) subject, a
+    series or a curated list with it, found through inverted indexes, so a book
+    is never compared against the whole catalog.
+    """
+
+    def __init__(self, books: list[_BookFeatures]):
+        self.books = {b.id: b for b in books}
+        self._by_subject: dict[str, list[int]] = defaultdict(list)
+        self._by_series: dict[str, list[int]] = defaultdict(list)
+        self._by_list: dict[int, list[int]] = defaultdict(list)
+        for b in books:
+            for subject in b.subjects:
+                self._by_subject[subject].append(b.id)
+            if b.series:
+                self._by_series[b.series].append(b.id)
+            for list_id in b.lists:
+                self._by_list[list_id].append(b.id)
+
+    def score(self, a: _BookFeatures, b: _BookFeatures) -> float:
+        shared_subjects = len(a.subjects & b.subjects)
+        union = len(a.subjects) + len(b.subjects) - shared_subjects
+        shared_lists = len(a.lists & b.lists)
+        return (
+            WEIGHTS["subjects"] * (shared_subjects / union if union else 0.0)
+            + WEIGHTS["age"] * age_similarity(a.ages, b.ages)
+            + WEIGHTS["lists"] * min(shared_lists / 2, 1.0)
+            + WEIGHTS["series"] * (a.series is not None and a.series == b.series)
+            + WEIGHTS["time_period"]
+            * (a.time_period is not None and a.time_period == b.time_period)
+            + WEIGHTS["region"] * (a.region is not None and a.region == b.region)
+        )
+
+    def neighbors(self, book_id: int, k: int = TOP_K) -> list[tuple[int, float]]:
+        """Top ``k`` ``(book_id, score)`` neighbors of a book, best first."""
+        book = self.books.get(book_id)
+        if book is None:
+            return []
+
+        candidates = set()
+        for subject in book.subjects:
+            posting = self._by_subject[subject]
+            if len(posting) <= MAX_CANDIDATE_POSTING:
+                candidates.update(posting)
+        if book.series:
+            candidates.update(self._by_series[book.series])
+        for list_id in book.lists:
+            candidates.update(self._by_list[list_id])
+        candidates.discard(book_id)
+
+        scored = []
+        for other_id in candidates:
+            other = self.books[other_id]
+            s = self.score(book, other)
+            if s > 0:
+                scored.append((s, other.popularity, other_id))
+        return [(other_id, s) for s, _, other_id in heapq.nlargest(k, scored)]
+
+
+_FEATURE_COLUMNS = (
+    Book.id,
+    Book.subjects,
+    Book.age_range,
+    Book.time_period,
+    Book.region,
+    Book.series,
+    Book.popularity_score,
+)
+
+
+def _to_features(rows, memberships: dict[int, set[int]]) -> list[_BookFeatures]:
+    return [
+        _BookFeatures(
+            id=r.id,
+            subjects=frozenset(r.subjects or []),
+            ages=parse_age_range(r.age_range),
+            time_period=r.time_period,
+            region=r.region,
+            series=r.series,
+            lists=frozenset(memberships.get(r.id, ())),
+            popularity=r.popularity_score or 0.0,
+        )
+        for r in rows
+    ]
+
+
+async def _memberships(db: AsyncSession, book_ids=None) -> dict[int, set[int]]:
+    """List ids per book, for ``book_ids`` (or every book)."""
+    stmt = select(ListItem.list_id, ListItem.book_id)
+    if book_ids is not None:
+        stmt = stmt.where(ListItem.book_id.in_(book_ids))
+    memberships: dict[int, set[int]] = defaultdict(set)
+    for list_id, book_id in (await db.execute(stmt)).all():
+        memberships[book_id].add(list_id)
+    return memberships
+
+
+async def load_scorer(db: AsyncSession) -> RelatedScorer:
+    """Snapshot the catalog features needed for scoring in two queries."""
+    memberships = await _memberships(db)
+    rows = await db.execute(select(*_FEATURE_COLUMNS))
+    return RelatedScorer(_to_features(rows.all(), memberships))
+
+
+async def load_neighborhood(db: AsyncSession, book_id: int) -> RelatedScorer | None:
+    """Scorer over one book and its candidates only (books sharing a subject, the
+    series or a list with it), found through the subjects GIN and series/list_items
+    indexes. Its neighbors match what ``load_scorer`` would give. None if the book
+    doesn't exist.
+    """
+    rows = (await db.execute(select(*_FEATURE_COLUMNS).where(Book.id == book_id))).all()
+    if not rows:
+        return None
+    (target,) = _to_features(rows, await _memberships(db, [book_id]))
+
+    # Subjects too common to generate candidates (see MAX_CANDIDATE_POSTING); each
+    # count stops at the cap, so this reads at most cap + 1 index entries per subject
+    subjects = sorted(target.subjects)
+    common = set()
+    if subjects:
+        capped = [
+            select(func.count())
+            .select_from(
+                select(Book.id)
+                .where(Book.subjects.contains([subject]))
+                .limit(MAX_CANDIDATE_POSTING + 1)
+                .subquery()
+            )
+            .scalar_subquery()
+            for subject in subjects
+        ]
+        counts = (await db.execute(select(*capped))).one()
+        common = {s for s, n in zip(subjects, counts) if n > MAX_CANDIDATE_POSTING}
+
+    conditions = []
+    if rare := [s for s in subjects if s not in common]:
+        conditions.append(Book.subjects.overlap(rare))
+    if target.series:
+        conditions.append(Book.series == target.series)
+    if target.lists:
+        conditions.append(
+            Book.id.in_(select(ListItem.book_id).where(ListItem.list_id.in_(target.lists)))
+        )
+    if not conditions:
+        return RelatedScorer([target])
+
+    rows = (
+        await db.execute(
+            select(*_FEATURE_COLUMNS).where(or_(*conditions), Book.id != book_id)
+        )
+    ).all()
+    candidates = _to_features(rows, await _memberships(db, [r.id for r in rows]))
+    return RelatedScorer([target, *candidates])
+
+
+def _neighbor_rows(neighbors: dict[int, list[tuple[int, float]]]) -> list[dict]:
+    return [
+        {"book_id": book_id, "related_book_id": other_id, "rank": rank, "score": score}
+        for book_id, ranked in neighbors.items()
+        for rank, (other_id, score) in enumerate(ranked, start=1)
+    ]
+
+
+async def rebuild_related_books(db: AsyncSession, k: int = TOP_K, batch_size: int = 1_000) -> int:
+    """Batch job: recompute the neighbor table for every book. Returns rows written.
+
+    Scoring is CPU-bound and runs in a worker thread, off the event loop.
+    """
+    scorer = await load_scorer(db)
+    neighbors = await asyncio.to_thread(
+        lambda: {book_id: scorer.neighbors(book_id, k) for book_id in scorer.books}
+    )
+    await db.execute(delete(RelatedBook))
+    rows = _neighbor_rows(neighbors)
+    for start in range(0, len(rows), batch_size):
+        await db.execute(insert(RelatedBook), rows[start:start + batch_size])
+    return len(rows)
+
+
+async def refresh_related_for(db: AsyncSession, book_id: int, k: int = TOP_K) -> None:
+    """Incremental refresh after a book is created or edited.
+
+    Recomputes the book's own neighbors from its candidates only, then merges
+    the book into the stored lists of each book it now ranks near, since the
+    change may push it into (or out of) their top-K.
+    """
+    scorer = await load_neighborhood(db, book_id)
+    if scorer is None:
+        return
+    target = scorer.books[book_id]
+    ranked = scorer.neighbors(book_id, k)
+    updates = {book_id: ranked}
+
+    if ranked:
+        others = [other_id for other_id, _ in ranked]
+        stored: dict[int, list[tuple[int, float]]] = {other_id: [] for other_id in others}
+        result = await db.execute(
+            select(RelatedBook.book_id, RelatedBook.related_book_id, RelatedBook.score)
+            .where(RelatedBook.book_id.in_(others))
+            .order_by(RelatedBook.book_id, RelatedBook.rank)
+        )
+        for other_id, related_id, score in result.all():
+            if related_id != book_id:
+                stored[other_id].append((related_id, score))
+        for other_id in others:
+            merged = stored[other_id] + [(book_id, scorer.score(scorer.books[other_id], target))]
+            updates[other_id] = sorted(merged, key=lambda pair: -pair[1])[:k]
+
+    await db.execute(delete(RelatedBook).where(RelatedBook.book_id.in_(list(updates))))
+    rows = _neighbor_rows(updates)
+    if rows:
+        await db.execute(insert(RelatedBook), rows)
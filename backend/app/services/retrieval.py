@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.book import Book
+from app.services.catalog_context import (
+    CONTEXT_COLUMNS,
+    CatalogBlock,
+    age_span,
+    catalog_context,
+    catalog_line,
+)
+from app.services.catalog_events import catalog_version
+
+logger = logging.getLogger(__name__)
+
+# How much each field's words count towards a book's vector
+FIELD_WEIGHTS = {"title": 3, "subjects": 2, "author": 1, "description": 1}
+
+# Popularity nudges ties and near-ties; it never lifts a book with no matching words
+POPULARITY_BOOST = 0.1
+
+STOP_WORDS = frozenset(
+    "a about after all also an and any are as at be book books by can for from good "
+    "great had has have he her his how i in into is it its kid kids me more my not "
+    "of on or our out recommend she some suggest than that the their them there "
+    "they this to was we what when who will with year years you your".split()
+)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase content words with a plural ``s`` dropped, for books and questions alike."""
+    words = []
+    for word in _WORD.findall(text.lower()):
+        if word in STOP_WORDS or len(word) < 2:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+def _book_terms(book) -> Counter:
+    terms = Counter()
+    for name, weight in FIELD_WEIGHTS.items():
+        value = getattr(book, name)
+        text = " ".join(value) if isinstance(value, list) else value or ""
+        for word in tokenize(text):
+            terms[word] += weight
+    return terms
+
+
+@dataclass
+class _TfIdf:
+    ids: np.ndarray  # row -> book id
+    vocab: dict[str, int]  # word -> column
+    idf: np.ndarray
+    matrix: sparse.csc_matrix  # L2-normalised book x word weights
+    boost: np.ndarray  # row -> popularity multiplier
+    ages: np.ndarray  # row -> (from, to) age span
+
+
+def build_tfidf(rows) -> _TfIdf:
+    """Vectorise ``rows`` (id, title, author, description, subjects, age_range,
+    popularity_score) into a TF-IDF index. CPU-bound; callers run it in a thread."""
+    vocab: dict[str, int] = {}
+    indptr, indices, counts = [0], [], []
+    for row in rows:
+        for word, count in _book_terms(row).items():
+            indices.append(vocab.setdefault(word, len(vocab)))
+            counts.append(count)
+        indptr.append(len(indices))
+
+    tf = sparse.csr_matrix(
+        (np.array(counts, dtype=np.float32), np.array(indices, dtype=np.int32), indptr),
+        shape=(len(rows), len(vocab)),
+    )
+    df = np.bincount(tf.indices, minlength=len(vocab))
+    idf = (np.log((1 + len(rows)) / (1 + df)) + 1).astype(np.float32)
+    tf.data = 1 + np.log(tf.data)  # sublinear term frequency
+    weighted = (tf @ sparse.diags(idf)).tocsr()
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    inv_norm = np.zeros_like(norms)
+    np.divide(1.0, norms, out=inv_norm, where=norms > 0)
+
+    popularity = np.array([r.popularity_score or 0 for r in rows], dtype=np.float32)
+    top = popularity.max() if len(rows) else 0
+    return _TfIdf(
+        ids=np.array([r.id for r in rows], dtype=np.int64),
+        vocab=vocab,
+        idf=idf,
+        matrix=(sparse.diags(inv_norm) @ weighted).astype(np.float32).tocsc(),
+        boost=1 + POPULARITY_BOOST * (popularity / top if top > 0 else popularity),
+        ages=np.array([age_span(r.age_range) for r in rows], dtype=np.int16).reshape(-1, 2),
+    )
+
+
+class BookRetriever:
+    """TF-IDF retrieval over title, subjects, author and description of every book.
+
+    Vectors are L2-normalised rows of a sparse float32 book x word matrix, kept in
+    CSC form so a query only reads the postings of its own words: scoring is a
+    cosine over the books sharing at least one word, not the whole catalog.
+    Rebuilt (in the background, vectorised off the event loop) when the catalog
+    version moves or after ``ttl_seconds``.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self._lock = asyncio.Lock()
+        self._index = build_tfidf([])
+        self._version: int | None = None
+        self._loaded_at: float | None = None
+        self._refresh: asyncio.Task | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return (
+            self._version == catalog_version()
+            and self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def get(self, db: AsyncSession) -> "BookRetriever":
+        """Return the index. A cold index is built here, in one query; a stale one
+        keeps serving while a background task rebuilds it."""
+        if self._loaded_at is None:
+            async with self._lock:
+                if self._loaded_at is None:
+                    await self._rebuild(db)
+        elif not self.is_fresh and self._refresh is None:
+            self._refresh = asyncio.create_task(self._refresh_in_background())
+        return self
+
+    async def _rebuild(self, db: AsyncSession) -> None:
+        version = catalog_version()
+        result = await db.execute(
+            select(
+                Book.id,
+                Book.title,
+                Book.author,
+                Book.description,
+                Book.subjects,
+                Book.age_range,
+                Book.popularity_score,
+            )
+        )
+        # Swapped in whole, so searches never see a half-built index
+        self._index = await asyncio.to_thread(build_tfidf, result.all())
+        self._version = version
+        self._loaded_at = time.monotonic()
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            async with self._lock, async_session() as db:
+                await self._rebuild(db)
+        except Exception:
+            logger.exception("Book retrieval index rebuild failed")
+        finally:
+            self._refresh = None
+
+    def search(self, query: str, k: int, band: tuple[int, int] | None = None) -> list[int]:
+        """Ids of up to ``k`` books sharing words with ``query``, most similar first."""
+        index = self._index
+        counts = Counter(w for w in tokenize(query) if w in index.vocab)
+        if not counts or k <= 0:
+            return []
+        cols = np.array([index.vocab[w] for w in counts], dtype=np.int32)
+        weights = np.array([1 + math.log(c) for c in counts.values()], dtype=np.float32)
+        weights *= index.idf[cols]
+        weights /= np.linalg.norm(weights)
+
+        scores = np.asarray(index.matrix[:, cols] @ weights).ravel() * index.boost
+        if band is not None:
+            outside = (index.ages[:, 0] > band[1]) | (index.ages[:, 1] < band[0])
+            scores[outside] = 0
+        matches = np.flatnonzero(scores > 0)
+        if len(matches) > k:
+            matches = matches[np.argpartition(-scores[matches], k)[:k]]
+        order = np.lexsort((index.ids[matches], -scores[matches]))
+        return [int(i) for i in index.ids[matches[order]]]
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+
+book_retriever = BookRetriever(ttl_seconds=settings.catalog_context_ttl_seconds)
+
+
+async def relevant_context(
+    db: AsyncSession,
+    query: str,
+    popular: int,
+    retrieved: int,
+    band: tuple[int, int] | None = None,
+) -> CatalogBlock:
+    """The cached block of ``popular`` most popular books, followed by a section of
+    up to ``retrieved`` other books matching ``query`` from anywhere in the catalog.
+
+    The popular block comes first and is byte-identical across questions, so it
+    stays a cacheable prompt prefix; prompt size is bounded however large the
+    catalog grows. With no matching words this is just the popular block.
+    """
+    block = await catalog_context.get(db, popular, band)
+    retriever = await book_retriever.get(db)
+    shown = {b.id for b in block.books}
+    ids = [i for i in retriever.search(query, retrieved + len(shown), band) if i not in shown]
+    ids = ids[:retrieved]
+    if not ids:
+        return block
+
+    result = await db.execute(select(*CONTEXT_COLUMNS).where(Book.id.in_(ids)))
+    by_id = {row.id: row for row in result.all()}
+    matches = [by_id[i] for i in ids if i in by_id]
+    text = "\n".join(catalog_line(b) for b in matches)
+    return CatalogBlock(
+        version=block.version,
+        books=[*block.books, *matches],
+        text=f"{block.text}\n\nMore books matching this request:\n{text}",
+    )
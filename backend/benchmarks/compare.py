@@ -0,0 +1,60 @@
+"""
+Compare two benchmark result files and flag latency regressions.
+
+Usage:
+    cd backend
+    python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+
+Exits 1 if any endpoint's p95 grew by more than --threshold (default 20%) or
+it issues more queries per request than before.
+"""
+
+import argparse
+import json
+import sys
+
+
+def compare(old: dict, new: dict, threshold: float = 0.2) -> tuple[list[str], list[str]]:
+    """Return (report lines, regressions) for sizes and endpoints present in both runs."""
+    lines, regressions = [], []
+    for size, endpoints in new["sizes"].items():
+        before = old["sizes"].get(size)
+        if before is None:
+            continue
+        lines.append(f"Catalog of {size} books ({old['commit']} -> {new['commit']}):")
+        for name, stats in sorted(endpoints.items()):
+            prev = before.get(name)
+            if prev is None:
+                continue
+            change = (stats["p95_ms"] - prev["p95_ms"]) / prev["p95_ms"] if prev["p95_ms"] else 0.0
+            queries = ""
+            if prev["queries_per_request"] is not None and stats["queries_per_request"] is not None:
+                queries = f"  q/req {prev['queries_per_request']} -> {stats['queries_per_request']}"
+                if stats["queries_per_request"] > prev["queries_per_request"]:
+                    regressions.append(f"{size}:{name} queries")
+            lines.append(
+                f"  {name:<22} p95 {prev['p95_ms']:>8.2f} -> {stats['p95_ms']:>8.2f}ms "
+                f"({change:+.0%}){queries}"
+            )
+            if change > threshold:
+                regressions.append(f"{size}:{name} p95")
+    return lines, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    with open(args.old) as f_old, open(args.new) as f_new:
+        lines, regressions = compare(json.load(f_old), json.load(f_new), args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
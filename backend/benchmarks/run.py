@@ -0,0 +1,368 @@
+"""
+HTTP latency benchmark: drives the real app (in-process, over ASGI) against a
+local Postgres and reports p50/p95/p99 latency, throughput and SQL queries
+per request for each endpoint.
+
+Usage:
+    cd backend
+    # Benchmark whatever is in DATABASE_URL now
+    python -m benchmarks.run
+    # Rebuild the local database at each catalog size first (destructive; local only)
+    python -m benchmarks.run --sizes 10000,100000 --reset
+    # Compare two stored runs
+    python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+
+Results are written to benchmarks/results/<utc time>-<commit>.json.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import secrets
+import subprocess
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+import numpy as np
+from sqlalchemy import func, select, text
+
+from app.core.auth import create_access_token
+from app.core.config import settings
+from app.core.database import async_session, engine, track_queries
+from app.main import app
+from app.models.book import Book
+from app.models.list import CuratedList
+from app.models.user import User
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Tables emptied by --reset, children first
+RESET_TABLES = (
+    "click_events", "book_reviews", "reading_plan_items", "reading_plans", "children",
+    "users", "email_drip_events", "newsletter_sends", "email_subscribers",
+    "co_planned_books", "related_books", "list_items", "curated_lists", "book_links",
+    "sources", "books", "import_jobs", "app_meta",
+)
+
+
+# --- Recording --------------------------------------------------------------
+
+@dataclass
+class EndpointStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    db_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, wall_seconds: float) -> dict:
+        lat = np.array(self.latencies_ms) if self.latencies_ms else np.zeros(1)
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+        return {
+            "requests": len(self.latencies_ms),
+            "errors": self.errors,
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "mean_ms": round(float(lat.mean()), 2),
+            "rps": round(len(self.latencies_ms) / wall_seconds, 1) if wall_seconds else 0.0,
+            "queries_per_request": round(float(np.mean(self.queries)), 2) if self.queries else None,
+            "db_ms_per_request": round(float(np.mean(self.db_ms)), 2) if self.db_ms else None,
+        }
+
+
+class Recorder:
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.stats: dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.wall: dict[str, float] = defaultdict(float)
+
+    async def request(self, name: str, method: str, url: str, **kwargs) -> httpx.Response:
+        with track_queries() as queries:
+            start = time.perf_counter()
+            response = await self.client.request(method, url, **kwargs)
+            elapsed = (time.perf_counter() - start) * 1000
+        stats = self.stats[name]
+        stats.latencies_ms.append(elapsed)
+        stats.queries.append(queries.count)
+        stats.db_ms.append(queries.total_ms)
+        if response.status_code >= 400:
+            stats.errors += 1
+        return response
+
+
+# --- Scenarios --------------------------------------------------------------
+
+@dataclass
+class Fixtures:
+    book_ids: list[int]
+    slugs: list[str]
+    subjects: list[str]
+    age_ranges: list[str]
+    words: list[str]
+    user_id: int
+
+
+Scenario = Callable[[Recorder, Fixtures, random.Random], Awaitable[None]]
+
+
+async def search(rec: Recorder, fx: Fixtures, rng: random.Random) -> None:
+    variants = [
+        ("search.popular", {}),
+        ("search.subject", {"subject": rng.choice(fx.subjects)}),
+        ("search.age_title", {"age_range": rng.choice(fx.age_ranges), "sort": "title"}),
+        ("search.fulltext", {"q": rng.choice(fx.words)}),
+        ("search.fuzzy", {"q": rng.choice(fx.words)[:-1], "match": "fuzzy"}),
+        ("search.deep_offset", {"page": rng.randint(50, 200)}),
+        ("search.cursor", {"pagination": "cursor", "sort": "newest"}),
+        ("search.facets", {"subject": rng.choice(fx.subjects), "facets": "true"}),
+    ]
+    name, params = rng.choice(variants)
+    await rec.request(name, "GET", "/api/v1/books", params=params)
+
+
+async def book_detail(rec: Recorder, fx: Fixtures, rng: random.Random) -> None:
+    book_id = rng.choice(fx.book_ids)
+    await rec.request("books.get", "GET", f"/api/v1/books/{book_id}")
+    await rec.request("books.related", "GET", f"/api/v1/books/{book_id}/related")
+
+
+async def catalog_pages(rec: Recorder, fx: Fixtures, rng: random.Random) -> None:
+    await rec.request("lists.index", "GET", "/api/v1/lists")
+    await rec.request("lists.detail", "GET", f"/api/v1/lists/{rng.choice(fx.slugs)}")
+    await rec.request("stats", "GET", "/api/v1/stats")
+    await rec.request("books.filters", "GET", "/api/v1/books/filters")
+
+
+async def plan_crud(rec: Recorder, fx: Fixtures, rng: random.Random) -> None:
+    resp = await rec.request("plans.create", "POST", "/api/v1/plans", json={"name": "Bench plan"})
+    if resp.status_code != 201:
+        return
+    plan_id = resp.json()["id"]
+    resp = await rec.request(
+        "plans.add_item", "POST", f"/api/v1/plans/{plan_id}/items",
+        json={"book_id": rng.choice(fx.book_ids), "week_number": 1},
+    )
+    if resp.status_code == 201:
+        await rec.request(
+            "plans.update_item", "PATCH", f"/api/v1/plans/{plan_id}/items/{resp.json()['id']}",
+            json={"status": "reading"},
+        )
+    await rec.request("plans.get", "GET", f"/api/v1/plans/{plan_id}")
+    await rec.request("plans.list", "GET", "/api/v1/plans")
+    await rec.request("plans.delete", "DELETE", f"/api/v1/plans/{plan_id}")
+
+
+async def track_click(rec: Recorder, fx: Fixtures, rng: random.Random) -> None:
+    await rec.request(
+        "tracking.click", "POST", "/api/v1/tracking/click",
+        json={
+            "book_id": rng.choice(fx.book_ids),
+            "source_name": "Amazon",
+            "session_id": f"bench-{rng.getrandbits(64):016x}",
+        },
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "search": search,
+    "book_detail": book_detail,
+    "catalog_pages": catalog_pages,
+    "plan_crud": plan_crud,
+    "track_click": track_click,
+}
+
+
+# --- Setup ------------------------------------------------------------------
+
+def _is_local_database() -> bool:
+    url = settings.async_database_url
+    return "localhost" in url or "127.0.0.1" in url
+
+
+async def reset_database(books: int, seed: int) -> None:
+    """Empty the catalog and load the seed plus ``books`` synthetic books."""
+    from app.services.also_planned import rebuild_also_planned
+    from app.services.related import rebuild_related_books
+    from scripts.seed import seed as load_seed
+    from scripts.synthetic import SyntheticScale, load_synthetic
+
+    async with async_session() as session:
+        await session.execute(text(f"TRUNCATE {', '.join(RESET_TABLES)} RESTART IDENTITY CASCADE"))
+        await session.commit()
+    await load_seed()
+    await load_synthetic(SyntheticScale(books=books), seed)
+    async with async_session() as session:
+        await rebuild_related_books(session)
+        await rebuild_also_planned(session)
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+
+
+async def load_fixtures(rng: random.Random) -> tuple[Fixtures, int]:
+    """Sample ids, slugs and filter values from the database; create the bench user."""
+    async with async_session() as session:
+        total = (await session.execute(select(func.count(Book.id)))).scalar() or 0
+        if not total:
+            raise SystemExit("No books in the database; run the seed or pass --reset.")
+        rows = (
+            await session.execute(
+                select(Book.id, Book.title, Book.subjects, Book.age_range)
+                .order_by(func.random())
+                .limit(500)
+            )
+        ).all()
+        slugs = (await session.execute(select(CuratedList.slug).limit(500))).scalars().all()
+        email = f"bench-{secrets.token_hex(4)}@example.com"
+        user = User(
+            email=email, name="Bench", subscription_tier="premium", subscription_active=True
+        )
+        session.add(user)
+        await session.commit()
+    words = [w for _, title, _, _ in rows for w in title.split() if len(w) > 4]
+    return (
+        Fixtures(
+            book_ids=[r[0] for r in rows],
+            slugs=list(slugs),
+            subjects=sorted({s for r in rows for s in r[2]}),
+            age_ranges=sorted({r[3] for r in rows}),
+            words=words or ["river"],
+            user_id=user.id,
+        ),
+        total,
+    )
+
+
+async def cleanup_fixtures(fx: Fixtures) -> None:
+    async with async_session() as session:
+        await session.execute(text("DELETE FROM users WHERE id = :id"), {"id": fx.user_id})
+        await session.execute(text("DELETE FROM click_events WHERE session_id LIKE 'bench-%'"))
+        await session.commit()
+
+
+# --- Running ----------------------------------------------------------------
+
+async def run_scenario(
+    rec: Recorder, scenario: Scenario, fx: Fixtures, iterations: int, concurrency: int, seed: int
+) -> float:
+    """Run ``iterations`` of ``scenario`` across ``concurrency`` workers; returns wall seconds."""
+    queue = iter(range(iterations))
+
+    async def worker(n: int) -> None:
+        rng = random.Random(seed * 1000 + n)
+        for _ in queue:
+            await scenario(rec, fx, rng)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def benchmark(args, fx: Fixtures) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    cookies = {"access_token": create_access_token(fx.user_id, "bench@example.com")}
+    results = {}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", cookies=cookies
+    ) as client:
+        for name in args.scenarios:
+            scenario = SCENARIOS[name]
+            warmup = Recorder(client)
+            await run_scenario(warmup, scenario, fx, args.warmup, args.concurrency, args.seed)
+            rec = Recorder(client)
+            wall = await run_scenario(
+                rec, scenario, fx, args.iterations, args.concurrency, args.seed
+            )
+            for endpoint, stats in sorted(rec.stats.items()):
+                results[endpoint] = stats.summary(wall)
+                print(_format_row(endpoint, results[endpoint]))
+    return results
+
+
+def _format_row(name: str, s: dict) -> str:
+    queries = "-" if s["queries_per_request"] is None else f"{s['queries_per_request']:.1f}"
+    return (
+        f"  {name:<22} p50 {s['p50_ms']:>8.2f}ms  p95 {s['p95_ms']:>8.2f}ms  "
+        f"p99 {s['p99_ms']:>8.2f}ms  {s['rps']:>7.1f} req/s  {queries:>5} q/req"
+        + (f"  {s['errors']} errors" if s["errors"] else "")
+    )
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def main(args) -> Path:
+    if args.reset and not _is_local_database():
+        raise SystemExit("--reset only runs against a localhost DATABASE_URL.")
+    settings.response_cache_enabled = args.response_cache
+    if not settings.jwt_secret_key:
+        settings.jwt_secret_key = secrets.token_hex(32)
+
+    commit = _git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+        "config": {
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "response_cache": args.response_cache,
+            "catalog_index": settings.catalog_index_enabled,
+        },
+        "sizes": {},
+    }
+    for size in args.sizes or [None]:
+        if size is not None and args.reset:
+            print(f"Loading {size} synthetic books...")
+            await reset_database(size, args.seed)
+        fx, total = await load_fixtures(random.Random(args.seed))
+        print(f"Catalog of {total} books:")
+        try:
+            report["sizes"][str(total)] = await benchmark(args, fx)
+        finally:
+            await cleanup_fixtures(fx)
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    stamp = datetime.datetime.now(datetime.UTC).strftime("%Y%m%dT%H%M%SZ")
+    path = RESULTS_DIR / f"{stamp}-{commit}.json"
+    path.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {path}")
+    await engine.dispose()
+    return path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark API latency against local Postgres.")
+    parser.add_argument(
+        "--sizes", type=lambda v: [int(x) for x in v.split(",")],
+        help="comma-separated synthetic catalog sizes (needs --reset)",
+    )
+    parser.add_argument("--reset", action="store_true", help="truncate and reload per size")
+    parser.add_argument("--iterations", type=int, default=200, help="iterations per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--scenarios", type=lambda v: v.split(","), default=list(SCENARIOS),
+        help=f"comma-separated subset of {','.join(SCENARIOS)}",
+    )
+    parser.add_argument(
+        "--response-cache", action="store_true", help="leave the GET response cache on"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -11,13 +11,16 @@ from app.core.database import Base
 
 # Import all models so they're registered
 from app.models import (  # noqa: F401
+    app_meta,
     book,
     child,
     click_event,
     drip_event,
+    import_job,
     list,
     newsletter_send,
     reading_plan,
+    related_book,
     review,
     subscriber,
     user,
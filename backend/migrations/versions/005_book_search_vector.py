@@ -0,0 +1,35 @@
+"""Add stored, weighted search_vector column with GIN index to books
+
+Revision ID: 005_book_search_vector
+Revises: 004_drip_newsletter_unsub
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "005_book_search_vector"
+down_revision = "004_drip_newsletter_unsub"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A stored generated column is backfilled for existing rows by ADD COLUMN
+    # and recomputed by Postgres on every INSERT/UPDATE (including CSV import).
+    op.execute(
+        """
+        ALTER TABLE books ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(author, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED
+        """
+    )
+    op.create_index(
+        "ix_books_search_vector", "books", ["search_vector"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_books_search_vector", table_name="books")
+    op.drop_column("books", "search_vector")
@@ -0,0 +1,29 @@
+"""Enable pg_trgm and add trigram GIN indexes on book title, author, description
+
+Revision ID: 006_book_trigram_indexes
+Revises: 005_book_search_vector
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "006_book_trigram_indexes"
+down_revision = "005_book_search_vector"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in ("title", "author", "description"):
+        op.create_index(
+            f"ix_books_{column}_trgm",
+            "books",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in ("title", "author", "description"):
+        op.drop_index(f"ix_books_{column}_trgm", table_name="books")
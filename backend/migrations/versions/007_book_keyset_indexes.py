@@ -0,0 +1,29 @@
+"""Add (sort key, id) indexes on books for keyset pagination
+
+Revision ID: 007_book_keyset_indexes
+Revises: 006_book_trigram_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "007_book_keyset_indexes"
+down_revision = "006_book_trigram_indexes"
+branch_labels = None
+depends_on = None
+
+KEYSET_INDEXES = {
+    "ix_books_popularity_id": ["popularity_score", "id"],
+    "ix_books_title_id": ["title", "id"],
+    "ix_books_author_id": ["author", "id"],
+    "ix_books_created_at_id": ["created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in KEYSET_INDEXES.items():
+        op.create_index(name, "books", columns)
+
+
+def downgrade() -> None:
+    for name in KEYSET_INDEXES:
+        op.drop_index(name, table_name="books")
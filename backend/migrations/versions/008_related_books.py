@@ -0,0 +1,34 @@
+"""Add related_books table of precomputed top-K book neighbors
+
+Revision ID: 008_related_books
+Revises: 007_book_keyset_indexes
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "008_related_books"
+down_revision = "007_book_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "related_books",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("related_book_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["related_book_id"], ["books.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_related_books_book_rank", "related_books", ["book_id", "rank"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_related_books_book_rank", table_name="related_books")
+    op.drop_table("related_books")
@@ -0,0 +1,39 @@
+"""Add click_events.session_id and co_planned_books table of item-item neighbors
+
+Revision ID: 009_co_planned_books
+Revises: 008_related_books
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "009_co_planned_books"
+down_revision = "008_related_books"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("click_events", sa.Column("session_id", sa.String(64), nullable=True))
+    op.create_index("ix_click_events_session_id", "click_events", ["session_id"])
+
+    op.create_table(
+        "co_planned_books",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("related_book_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["related_book_id"], ["books.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_co_planned_books_book_rank", "co_planned_books", ["book_id", "rank"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_co_planned_books_book_rank", table_name="co_planned_books")
+    op.drop_table("co_planned_books")
+    op.drop_index("ix_click_events_session_id", table_name="click_events")
+    op.drop_column("click_events", "session_id")
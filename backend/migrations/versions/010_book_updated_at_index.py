@@ -0,0 +1,20 @@
+"""Add (updated_at, id) index on books for incremental exports
+
+Revision ID: 010_book_updated_at_index
+Revises: 009_co_planned_books
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "010_book_updated_at_index"
+down_revision = "009_co_planned_books"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_books_updated_at_id", "books", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_books_updated_at_id", table_name="books")
@@ -0,0 +1,29 @@
+"""Add covering indexes so the sitemap feed is served by index-only scans
+
+Revision ID: 011_sitemap_covering_indexes
+Revises: 010_book_updated_at_index
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "011_sitemap_covering_indexes"
+down_revision = "010_book_updated_at_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_books_id_updated_at", "books", ["id"], postgresql_include=["updated_at"]
+    )
+    op.create_index(
+        "ix_curated_lists_slug_created_at",
+        "curated_lists",
+        ["slug"],
+        postgresql_include=["created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_curated_lists_slug_created_at", table_name="curated_lists")
+    op.drop_index("ix_books_id_updated_at", table_name="books")
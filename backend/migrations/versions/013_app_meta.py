@@ -0,0 +1,27 @@
+"""Add app_meta key/value table for seed version markers
+
+Revision ID: 013_app_meta
+Revises: 012_import_jobs
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "013_app_meta"
+down_revision = "012_import_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "app_meta",
+        sa.Column("key", sa.String(100), nullable=False),
+        sa.Column("value", sa.String(200), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("app_meta")
@@ -0,0 +1,26 @@
+"""Index the related-books candidate lookups (shared subject, series, list)
+
+Revision ID: 014_related_candidate_indexes
+Revises: 013_app_meta
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "014_related_candidate_indexes"
+down_revision = "013_app_meta"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_books_subjects", "books", ["subjects"], postgresql_using="gin")
+    op.create_index("ix_books_series", "books", ["series"])
+    op.create_index("ix_list_items_list_id", "list_items", ["list_id"])
+    op.create_index("ix_list_items_book_id", "list_items", ["book_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_list_items_book_id", table_name="list_items")
+    op.drop_index("ix_list_items_list_id", table_name="list_items")
+    op.drop_index("ix_books_series", table_name="books")
+    op.drop_index("ix_books_subjects", table_name="books")
@@ -0,0 +1,69 @@
+"""
+Bulk-loading helpers shared by the seed and synthetic-data scripts.
+
+Rows go in with COPY (asyncpg ``copy_records_to_table``) or multi-row
+``INSERT ... RETURNING``, so loading N rows costs a handful of round trips
+rather than N. These are for offline loading only: ``reserve_ids`` assumes
+nothing else is inserting into the table at the same time.
+"""
+
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+COPY_BATCH_ROWS = 50_000
+
+
+async def reserve_ids(session: AsyncSession, table: Table, count: int) -> int:
+    """Advance ``table``'s id sequence by ``count`` and return the first reserved id."""
+    if count <= 0:
+        return 0
+    last = (
+        await session.execute(
+            text(
+                "SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+                "nextval(pg_get_serial_sequence(:table, 'id')) + :count - 1)"
+            ),
+            {"table": table.name, "count": count},
+        )
+    ).scalar_one()
+    return last - count + 1
+
+
+async def release_ids(session: AsyncSession, table: Table, last_used: int) -> None:
+    """Rewind ``table``'s id sequence to ``last_used`` after over-reserving with reserve_ids."""
+    await session.execute(
+        text("SELECT setval(pg_get_serial_sequence(:table, 'id'), :last, :called)"),
+        {"table": table.name, "last": max(last_used, 1), "called": last_used >= 1},
+    )
+
+
+async def copy_rows(
+    session: AsyncSession, table: Table, columns: Sequence[str], records: Iterable[tuple]
+) -> int:
+    """COPY ``records`` (tuples in ``columns`` order) into ``table``; returns rows copied."""
+    conn = await session.connection()
+    raw = (await conn.get_raw_connection()).driver_connection
+    total, batch = 0, []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= COPY_BATCH_ROWS:
+            await raw.copy_records_to_table(table.name, records=batch, columns=list(columns))
+            total += len(batch)
+            batch = []
+    if batch:
+        await raw.copy_records_to_table(table.name, records=batch, columns=list(columns))
+        total += len(batch)
+    return total
+
+
+async def insert_returning(session: AsyncSession, model, rows: list[dict], key: str) -> dict:
+    """Multi-row INSERT of ``rows``; returns ``{row[key]: id}`` for the new rows."""
+    if not rows:
+        return {}
+    key_column = getattr(model, key)
+    result = await session.execute(
+        insert(model).returning(model.id, key_column, sort_by_parameter_order=True), rows
+    )
+    return {row_key: row_id for row_id, row_key in result.all()}
@@ -1,3151 +1,214 @@
 """
 Seed script: populates the database with 150+ living books (including
 Christian living books), sources (vendors), book links, and curated lists.
+The data lives in seed_data.json; an app_meta marker records which version
+of it has been loaded, so re-running against a seeded database is one query.
 
 Usage:
     cd backend
     python -m scripts.seed
+    python -m scripts.seed --synthetic 100000   # append synthetic data (see scripts/synthetic.py)
 """
 
 import asyncio
-import sys
+import functools
+import hashlib
+import json
+import logging
 import os
+import sys
+from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import text
-from app.core.database import async_session, engine, Base
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.database import Base, async_session, engine
+from app.models.app_meta import AppMeta
 from app.models.book import Book, BookLink, Source
 from app.models.list import CuratedList, ListItem
+from app.services import catalog_events
+from app.services.related import rebuild_related_books
+from scripts.bulk_load import insert_returning
+
+logger = logging.getLogger(__name__)
+
+SEED_DATA_PATH = Path(__file__).with_name("seed_data.json")
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+SEED_VERSION_KEY = "seed_version"
+
+
+@functools.cache
+def load_seed_data() -> dict:
+    """The hand-curated catalog: ``{"books": [...], "sources": [...], "curated_lists": [...]}``."""
+    return json.loads(SEED_DATA_PATH.read_bytes())
+
+
+@functools.cache
+def seed_version() -> str:
+    """Content hash of the seed data; recorded in app_meta once the seed has run."""
+    return hashlib.sha256(SEED_DATA_PATH.read_bytes()).hexdigest()[:16]
+
+
+async def _table_exists(session, name: str) -> bool:
+    result = await session.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+    return bool(result.scalar())
+
+
+async def read_seed_marker(session) -> str | None:
+    """The seed version recorded in app_meta, or None if unseeded (or not migrated)."""
+    if not await _table_exists(session, "app_meta"):
+        return None
+    return (
+        await session.execute(select(AppMeta.value).where(AppMeta.key == SEED_VERSION_KEY))
+    ).scalar()
+
+
+async def read_schema_revision(session) -> str | None:
+    """The alembic revision the database is at, or None if it isn't alembic-managed."""
+    if not await _table_exists(session, "alembic_version"):
+        return None
+    return (await session.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+
+
+def schema_head() -> str | None:
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory(str(MIGRATIONS_DIR)).get_current_head()
+
+
+async def startup_check() -> None:
+    """Boot-time check for the API: a few catalog lookups, and a seed only when stale.
 
+    Warns (rather than migrating) if the schema is behind the newest migration.
+    """
+    async with async_session() as session:
+        revision = await read_schema_revision(session)
+        seeded = await read_seed_marker(session)
+    head = schema_head()
+    if revision is not None and revision != head:
+        logger.warning("Database schema is at %s but the newest migration is %s", revision, head)
+    if seeded != seed_version():
+        await seed()
+
+
+async def write_seed_marker(session) -> None:
+    stmt = pg_insert(AppMeta).values(key=SEED_VERSION_KEY, value=seed_version())
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AppMeta.key],
+            set_={"value": stmt.excluded.value, "updated_at": func.now()},
+        )
+    )
+    await session.commit()
+
+
+# Optional book fields; every row of a multi-row INSERT needs the same keys
+OPTIONAL_BOOK_FIELDS = (
+    "long_description", "reading_level", "time_period", "region", "isbn",
+    "cover_image_url", "series", "awards", "page_count", "publication_year", "publisher",
+)
 
-BOOKS = [
-    {
-        "title": "Carry On, Mr. Bowditch",
-        "author": "Jean Lee Latham",
-        "description": "The true story of Nathaniel Bowditch, a self-taught mathematical genius who revolutionized ocean navigation in the early days of American sailing.",
-        "long_description": "This Newbery Medal winner brings to vivid life the incredible story of Nat Bowditch, who overcame poverty and lack of formal education to become one of America's greatest navigators. Through determination and a love of learning, young Nat taught himself mathematics, astronomy, and multiple languages, eventually writing The New American Practical Navigator — a book still used by sailors today.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["history", "biography", "mathematics", "science", "adventure"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780618250745",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 95,
-        "page_count": 256,
-        "publication_year": 1955,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Paddle-to-the-Sea",
-        "author": "Holling C. Holling",
-        "description": "A carved wooden canoe journeys from Lake Nipigon through the Great Lakes to the Atlantic Ocean, teaching geography through an unforgettable adventure.",
-        "long_description": "An Indian boy carves a small canoe with a figure and sets it on a journey from a hilltop north of Lake Superior. Through ice, rapids, storms, and the industrialized waterways of the Great Lakes, the little canoe makes its way to the sea. With gorgeous full-color paintings and detailed marginal illustrations, this book is geography made living and beautiful.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-12",
-        "subjects": ["geography", "nature", "adventure"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780395292037",
-        "language": "English",
-        "awards": ["Caldecott Honor"],
-        "popularity_score": 92,
-        "page_count": 64,
-        "publication_year": 1941,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "The Story of the World, Volume 1: Ancient Times",
-        "author": "Susan Wise Bauer",
-        "description": "History told as an engaging story from the earliest nomads through the fall of Rome, written specifically for young listeners and readers.",
-        "reading_level": "read-aloud",
-        "age_range": "5-10",
-        "subjects": ["history", "ancient civilizations"],
-        "time_period": "Ancient",
-        "region": "World",
-        "isbn": "9781933339009",
-        "language": "English",
-        "series": "Story of the World",
-        "popularity_score": 98,
-        "page_count": 362,
-        "publication_year": 2006,
-        "publisher": "Peace Hill Press",
-    },
-    {
-        "title": "Charlotte's Web",
-        "author": "E.B. White",
-        "description": "The beloved tale of a pig named Wilbur and his devoted friend Charlotte, a wise spider who saves his life through her extraordinary weaving.",
-        "long_description": "In this timeless classic, Fern saves a runt piglet and names him Wilbur. When Wilbur moves to the Zuckerman barn, he befriends Charlotte, a beautiful grey spider. When Wilbur's life is threatened, Charlotte weaves messages in her web to save him. A profound meditation on friendship, mortality, and the cycles of life — told with warmth, humor, and perfect simplicity.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["literature", "nature", "friendship"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780061124952",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 99,
-        "page_count": 184,
-        "publication_year": 1952,
-        "publisher": "Harper & Brothers",
-    },
-    {
-        "title": "Beautiful Stories from Shakespeare",
-        "author": "E. Nesbit",
-        "description": "Shakespeare's greatest plays retold as vivid, accessible stories for young readers by the masterful children's author E. Nesbit.",
-        "reading_level": "intermediate",
-        "age_range": "8-14",
-        "subjects": ["literature", "drama", "classics"],
-        "time_period": "Renaissance",
-        "region": "Europe",
-        "isbn": "9781514684474",
-        "language": "English",
-        "popularity_score": 78,
-        "page_count": 180,
-        "publication_year": 1907,
-        "publisher": "Various",
-    },
-    {
-        "title": "This Country of Ours",
-        "author": "H.E. Marshall",
-        "description": "American history from the Norse discoveries through the early 20th century, told as a gripping narrative that brings the past alive.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "American history"],
-        "time_period": "Multiple periods",
-        "region": "North America",
-        "isbn": "9781599152622",
-        "language": "English",
-        "popularity_score": 85,
-        "page_count": 480,
-        "publication_year": 1917,
-        "publisher": "Yesterday's Classics",
-    },
-    {
-        "title": "Understood Betsy",
-        "author": "Dorothy Canfield Fisher",
-        "description": "An over-protected city girl discovers independence, confidence, and the joy of learning when she goes to live with Vermont relatives.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-11",
-        "subjects": ["literature", "character", "farm life"],
-        "time_period": "Early 20th century",
-        "region": "North America",
-        "isbn": "9780805005806",
-        "language": "English",
-        "popularity_score": 88,
-        "page_count": 224,
-        "publication_year": 1917,
-        "publisher": "Henry Holt",
-    },
-    {
-        "title": "The Wind in the Willows",
-        "author": "Kenneth Grahame",
-        "description": "The eternal story of Mole, Ratty, Badger, and the irrepressible Mr. Toad — a masterpiece of English literature bursting with nature and friendship.",
-        "reading_level": "intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "nature", "friendship", "classics"],
-        "time_period": "Edwardian era",
-        "region": "Europe",
-        "isbn": "9780143039099",
-        "language": "English",
-        "popularity_score": 93,
-        "page_count": 272,
-        "publication_year": 1908,
-        "publisher": "Methuen",
-    },
-    {
-        "title": "Pilgrim's Progress",
-        "author": "John Bunyan (retold by Mary Godolphin)",
-        "description": "The allegorical masterpiece retold in simple one-syllable words, making this profound journey accessible to even young readers.",
-        "reading_level": "early",
-        "age_range": "6-10",
-        "subjects": ["literature", "religion", "classics", "allegory"],
-        "time_period": "17th century",
-        "region": "Europe",
-        "isbn": "9781882514502",
-        "language": "English",
-        "popularity_score": 76,
-        "page_count": 128,
-        "publication_year": 1884,
-        "publisher": "Yesterday's Classics",
-    },
-    {
-        "title": "Blueberries for Sal",
-        "author": "Robert McCloskey",
-        "description": "Little Sal and her mother pick blueberries on one side of Blueberry Hill while a bear and her cub eat on the other — with a delightful mix-up.",
-        "reading_level": "early",
-        "age_range": "3-7",
-        "subjects": ["nature", "family", "picture book"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780140501698",
-        "language": "English",
-        "awards": ["Caldecott Honor"],
-        "popularity_score": 90,
-        "page_count": 56,
-        "publication_year": 1948,
-        "publisher": "Viking Press",
-    },
-    {
-        "title": "The Burgess Bird Book for Children",
-        "author": "Thornton W. Burgess",
-        "description": "Through delightful stories of Peter Rabbit and his woodland friends, children learn to identify and appreciate dozens of North American birds.",
-        "reading_level": "read-aloud",
-        "age_range": "5-10",
-        "subjects": ["nature", "science", "birds", "wildlife"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780486428406",
-        "language": "English",
-        "popularity_score": 82,
-        "page_count": 336,
-        "publication_year": 1919,
-        "publisher": "Dover Publications",
-    },
-    {
-        "title": "Little House in the Big Woods",
-        "author": "Laura Ingalls Wilder",
-        "description": "The first book in the beloved Little House series, bringing pioneer life in 1870s Wisconsin alive through the eyes of young Laura.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["history", "pioneer life", "family", "American frontier"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780064400015",
-        "language": "English",
-        "series": "Little House",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 97,
-        "page_count": 238,
-        "publication_year": 1932,
-        "publisher": "Harper & Brothers",
-    },
-    {
-        "title": "Anne of Green Gables",
-        "author": "L.M. Montgomery",
-        "description": "Red-haired, imaginative orphan Anne Shirley transforms the lives of everyone in Avonlea with her irrepressible spirit and love of beauty.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["literature", "character", "family", "classics"],
-        "time_period": "Late 19th century",
-        "region": "Canada",
-        "isbn": "9780141321592",
-        "language": "English",
-        "series": "Anne of Green Gables",
-        "popularity_score": 96,
-        "page_count": 320,
-        "publication_year": 1908,
-        "publisher": "L.C. Page & Co.",
-    },
-    {
-        "title": "The Secret Garden",
-        "author": "Frances Hodgson Burnett",
-        "description": "A spoiled, neglected girl discovers a hidden garden and, through nurturing it back to life, heals herself and those around her.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "nature", "character", "classics"],
-        "time_period": "Edwardian era",
-        "region": "Europe",
-        "isbn": "9780064401883",
-        "language": "English",
-        "popularity_score": 94,
-        "page_count": 288,
-        "publication_year": 1911,
-        "publisher": "Frederick A. Stokes",
-    },
-    {
-        "title": "Treasure Island",
-        "author": "Robert Louis Stevenson",
-        "description": "Young Jim Hawkins finds a treasure map and sails into the adventure of a lifetime with the cunning pirate Long John Silver.",
-        "reading_level": "advanced",
-        "age_range": "10-15",
-        "subjects": ["literature", "adventure", "classics"],
-        "time_period": "18th century",
-        "region": "Europe",
-        "isbn": "9780141321004",
-        "language": "English",
-        "popularity_score": 91,
-        "page_count": 311,
-        "publication_year": 1883,
-        "publisher": "Cassell and Company",
-    },
-    {
-        "title": "The Handbook of Nature Study",
-        "author": "Anna Botsford Comstock",
-        "description": "The indispensable guide for nature study — covering birds, insects, plants, rocks, and weather with detailed lessons and gorgeous illustrations.",
-        "reading_level": "teacher-reference",
-        "age_range": "6-adult",
-        "subjects": ["nature", "science", "teacher resource"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780801493843",
-        "language": "English",
-        "popularity_score": 88,
-        "page_count": 887,
-        "publication_year": 1911,
-        "publisher": "Comstock Publishing",
-    },
-    {
-        "title": "A Child's Geography of the World",
-        "author": "V.M. Hillyer",
-        "description": "A conversational tour of the entire world that makes geography irresistibly fascinating for young minds.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["geography", "world cultures"],
-        "time_period": "20th century",
-        "region": "World",
-        "isbn": "9781882514199",
-        "language": "English",
-        "series": "Calvert School",
-        "popularity_score": 80,
-        "page_count": 318,
-        "publication_year": 1929,
-        "publisher": "Yesterday's Classics",
-    },
-    {
-        "title": "A Child's History of the World",
-        "author": "V.M. Hillyer",
-        "description": "World history told as one great story — from cavemen to the modern age — in a warm, conversational voice that captivates young listeners.",
-        "reading_level": "read-aloud",
-        "age_range": "6-10",
-        "subjects": ["history", "world history"],
-        "time_period": "Multiple periods",
-        "region": "World",
-        "isbn": "9781882514205",
-        "language": "English",
-        "series": "Calvert School",
-        "popularity_score": 82,
-        "page_count": 382,
-        "publication_year": 1924,
-        "publisher": "Yesterday's Classics",
-    },
-    {
-        "title": "The Door in the Wall",
-        "author": "Marguerite de Angeli",
-        "description": "A crippled boy in medieval England discovers that courage and determination can open doors that seem forever closed.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["history", "medieval", "character", "disability"],
-        "time_period": "Medieval",
-        "region": "Europe",
-        "isbn": "9780440402831",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 84,
-        "page_count": 128,
-        "publication_year": 1949,
-        "publisher": "Doubleday",
-    },
-    {
-        "title": "Island of the Blue Dolphins",
-        "author": "Scott O'Dell",
-        "description": "Based on a true story: a Native American girl survives alone for eighteen years on an island off the California coast.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["history", "survival", "nature", "Native American"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780547328614",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 90,
-        "page_count": 192,
-        "publication_year": 1960,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Number the Stars",
-        "author": "Lois Lowry",
-        "description": "Ten-year-old Annemarie must find the courage to help shelter her Jewish friend from the Nazis in occupied Copenhagen.",
-        "reading_level": "intermediate",
-        "age_range": "9-12",
-        "subjects": ["history", "World War II", "courage", "friendship"],
-        "time_period": "World War II",
-        "region": "Europe",
-        "isbn": "9780547577098",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 89,
-        "page_count": 160,
-        "publication_year": 1989,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Heidi",
-        "author": "Johanna Spyri",
-        "description": "A joyful orphan girl brought to live with her gruff grandfather in the Swiss Alps transforms everyone she meets with her innocent goodness.",
-        "reading_level": "intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "nature", "character", "classics"],
-        "time_period": "19th century",
-        "region": "Europe",
-        "isbn": "9780140620986",
-        "language": "English",
-        "popularity_score": 91,
-        "page_count": 352,
-        "publication_year": 1881,
-        "publisher": "Various",
-    },
-    {
-        "title": "The Moffats",
-        "author": "Eleanor Estes",
-        "description": "Warm, funny, and utterly real stories of the four Moffat children growing up in a small Connecticut town during World War I.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-11",
-        "subjects": ["literature", "family", "humor"],
-        "time_period": "World War I era",
-        "region": "North America",
-        "isbn": "9780152025359",
-        "language": "English",
-        "series": "The Moffats",
-        "popularity_score": 79,
-        "page_count": 304,
-        "publication_year": 1941,
-        "publisher": "Harcourt",
-    },
-    {
-        "title": "Misty of Chincoteague",
-        "author": "Marguerite Henry",
-        "description": "Two children dream of owning a wild pony from the island of Chincoteague — based on the real annual pony penning tradition.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-11",
-        "subjects": ["nature", "animals", "adventure"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9781416927839",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 87,
-        "page_count": 176,
-        "publication_year": 1947,
-        "publisher": "Rand McNally",
-    },
-    {
-        "title": "Amos Fortune, Free Man",
-        "author": "Elizabeth Yates",
-        "description": "The true story of an African prince who was captured, enslaved, and eventually bought his freedom and the freedom of others in colonial New England.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["history", "biography", "slavery", "freedom", "character"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780140341584",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 83,
-        "page_count": 192,
-        "publication_year": 1950,
-        "publisher": "Dutton",
-    },
-    {
-        "title": "Rascal",
-        "author": "Sterling North",
-        "description": "A boy's year-long friendship with a mischievous baby raccoon in rural Wisconsin — one of the most charming nature memoirs ever written.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["nature", "animals", "memoir", "friendship"],
-        "time_period": "World War I era",
-        "region": "North America",
-        "isbn": "9780140341454",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 81,
-        "page_count": 189,
-        "publication_year": 1963,
-        "publisher": "Dutton",
-    },
-    {
-        "title": "The Trumpeter of Krakow",
-        "author": "Eric P. Kelly",
-        "description": "A young boy and his family guard a priceless jewel in 15th-century Krakow while the boy takes up the ancient duty of the trumpeter.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["history", "medieval", "adventure", "Poland"],
-        "time_period": "15th century",
-        "region": "Europe",
-        "isbn": "9780689715716",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 75,
-        "page_count": 208,
-        "publication_year": 1928,
-        "publisher": "Macmillan",
-    },
-    {
-        "title": "D'Aulaires' Book of Greek Myths",
-        "author": "Ingri and Edgar Parin d'Aulaire",
-        "description": "The definitive introduction to Greek mythology for children, with magnificent lithograph illustrations and masterful retellings.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-12",
-        "subjects": ["mythology", "ancient Greece", "classics"],
-        "time_period": "Ancient",
-        "region": "Europe",
-        "isbn": "9780440406945",
-        "language": "English",
-        "popularity_score": 94,
-        "page_count": 192,
-        "publication_year": 1962,
-        "publisher": "Doubleday",
-    },
-    {
-        "title": "The Story of Mankind",
-        "author": "Hendrik Willem van Loon",
-        "description": "The first Newbery Medal winner: a sweeping narrative of human civilization from prehistoric times to the modern era.",
-        "reading_level": "advanced",
-        "age_range": "10-15",
-        "subjects": ["history", "world history", "civilization"],
-        "time_period": "Multiple periods",
-        "region": "World",
-        "isbn": "9780871401540",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 77,
-        "page_count": 480,
-        "publication_year": 1921,
-        "publisher": "Boni & Liveright",
-    },
-    {
-        "title": "Pagoo",
-        "author": "Holling C. Holling",
-        "description": "The life cycle of a hermit crab explored through stunning illustrations and a narrative that makes marine biology unforgettable.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["nature", "science", "marine biology"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780395539644",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 88,
-        "publication_year": 1957,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Tree in the Trail",
-        "author": "Holling C. Holling",
-        "description": "A cottonwood tree along the Santa Fe Trail witnesses two hundred years of American history from Native Americans to westward expansion.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["history", "nature", "American frontier", "geography"],
-        "time_period": "Multiple periods",
-        "region": "North America",
-        "isbn": "9780395546826",
-        "language": "English",
-        "popularity_score": 81,
-        "page_count": 64,
-        "publication_year": 1942,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Minn of the Mississippi",
-        "author": "Holling C. Holling",
-        "description": "A snapping turtle's journey down the Mississippi River becomes a rich lesson in geography, natural history, and American culture.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["geography", "nature", "science"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780395273999",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 82,
-        "page_count": 88,
-        "publication_year": 1951,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Seabird",
-        "author": "Holling C. Holling",
-        "description": "A carved ivory gull accompanies four generations of seafarers from whaling ships to modern aircraft, tracing the evolution of transportation.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["history", "adventure", "maritime", "transportation"],
-        "time_period": "Multiple periods",
-        "region": "North America",
-        "isbn": "9780395266816",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 79,
-        "page_count": 64,
-        "publication_year": 1948,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Robin Hood",
-        "author": "Howard Pyle",
-        "description": "The classic retelling of Robin Hood and his merry men in Sherwood Forest — swashbuckling adventure paired with Pyle's magnificent illustrations.",
-        "reading_level": "advanced",
-        "age_range": "10-15",
-        "subjects": ["literature", "adventure", "medieval", "classics"],
-        "time_period": "Medieval",
-        "region": "Europe",
-        "isbn": "9780486220437",
-        "language": "English",
-        "popularity_score": 86,
-        "page_count": 312,
-        "publication_year": 1883,
-        "publisher": "Charles Scribner's Sons",
-    },
-    {
-        "title": "King of the Wind",
-        "author": "Marguerite Henry",
-        "description": "The true story of the Godolphin Arabian, one of the three founding sires of the Thoroughbred breed, and his devoted mute stable boy.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["history", "animals", "biography"],
-        "time_period": "18th century",
-        "region": "Africa",
-        "isbn": "9781416927860",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 83,
-        "page_count": 176,
-        "publication_year": 1948,
-        "publisher": "Rand McNally",
-    },
-    {
-        "title": "The Twenty-One Balloons",
-        "author": "William Pène du Bois",
-        "description": "Professor Sherman's hot-air balloon adventure leads him to the secret, fantastical civilization on the volcanic island of Krakatoa.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["adventure", "science", "humor", "invention"],
-        "time_period": "19th century",
-        "region": "Asia",
-        "isbn": "9780140320978",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 82,
-        "page_count": 180,
-        "publication_year": 1947,
-        "publisher": "Viking Press",
-    },
-    {
-        "title": "Caddie Woodlawn",
-        "author": "Carol Ryrie Brink",
-        "description": "Based on her grandmother's stories, the adventures of a spirited tomboy growing up on the Wisconsin frontier in the 1860s.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["history", "pioneer life", "family", "American frontier"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9781416940289",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 86,
-        "page_count": 275,
-        "publication_year": 1935,
-        "publisher": "Macmillan",
-    },
-    {
-        "title": "The Wheel on the School",
-        "author": "Meindert DeJong",
-        "description": "Six schoolchildren in a Dutch fishing village work together to bring the storks back to nest on their school roof.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "nature", "community", "Netherlands"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780064402101",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 78,
-        "page_count": 298,
-        "publication_year": 1954,
-        "publisher": "Harper",
-    },
-    {
-        "title": "The Matchlock Gun",
-        "author": "Walter D. Edmonds",
-        "description": "A ten-year-old boy must defend his mother and baby sister with an ancient Spanish matchlock gun during a raid on their colonial home.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-11",
-        "subjects": ["history", "colonial America", "courage"],
-        "time_period": "Colonial era",
-        "region": "North America",
-        "isbn": "9780698116801",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 74,
-        "page_count": 64,
-        "publication_year": 1941,
-        "publisher": "Dodd, Mead",
-    },
-    {
-        "title": "Watership Down",
-        "author": "Richard Adams",
-        "description": "A band of rabbits flee their doomed warren and embark on an epic journey to find a new home — a sweeping tale of courage, leadership, and myth.",
-        "reading_level": "advanced",
-        "age_range": "12-adult",
-        "subjects": ["literature", "adventure", "nature", "leadership", "classics"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780743277709",
-        "language": "English",
-        "awards": ["Carnegie Medal"],
-        "popularity_score": 92,
-        "page_count": 478,
-        "publication_year": 1972,
-        "publisher": "Rex Collings",
-    },
-    {
-        "title": "The Hobbit",
-        "author": "J.R.R. Tolkien",
-        "description": "Bilbo Baggins leaves his comfortable hobbit-hole and joins thirteen dwarves on a quest to reclaim their mountain home from a dragon.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["literature", "fantasy", "adventure", "classics"],
-        "time_period": "Fantasy",
-        "region": "Fantasy World",
-        "isbn": "9780547928227",
-        "language": "English",
-        "popularity_score": 97,
-        "page_count": 310,
-        "publication_year": 1937,
-        "publisher": "George Allen & Unwin",
-    },
-    {
-        "title": "The Chronicles of Narnia: The Lion, the Witch and the Wardrobe",
-        "author": "C.S. Lewis",
-        "description": "Four children enter a magical world through a wardrobe and join the great lion Aslan in the battle against the White Witch's eternal winter.",
-        "reading_level": "intermediate",
-        "age_range": "8-13",
-        "subjects": ["literature", "fantasy", "allegory", "classics"],
-        "time_period": "Fantasy",
-        "region": "Fantasy World",
-        "isbn": "9780064471046",
-        "language": "English",
-        "series": "Chronicles of Narnia",
-        "popularity_score": 98,
-        "page_count": 208,
-        "publication_year": 1950,
-        "publisher": "Geoffrey Bles",
-    },
-    {
-        "title": "A Wrinkle in Time",
-        "author": "Madeleine L'Engle",
-        "description": "Meg Murry, her brother Charles Wallace, and friend Calvin travel through a wrinkle in time to rescue her father from a dark force.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["literature", "science fiction", "family", "courage"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780312367541",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "series": "Time Quintet",
-        "popularity_score": 93,
-        "page_count": 256,
-        "publication_year": 1962,
-        "publisher": "Farrar, Straus and Giroux",
-    },
-    {
-        "title": "Johnny Tremain",
-        "author": "Esther Forbes",
-        "description": "A young silversmith's apprentice in Boston becomes a key player in the events leading up to the American Revolution.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["history", "American Revolution", "coming of age"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780547614328",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 87,
-        "page_count": 256,
-        "publication_year": 1943,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Little Britches: Father and I Were Ranchers",
-        "author": "Ralph Moody",
-        "description": "A boy's adventures growing up on a Colorado ranch in the early 1900s — hardship, humor, and the making of character.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["memoir", "ranch life", "character", "American West"],
-        "time_period": "Early 20th century",
-        "region": "North America",
-        "isbn": "9780803281783",
-        "language": "English",
-        "series": "Little Britches",
-        "popularity_score": 88,
-        "page_count": 260,
-        "publication_year": 1950,
-        "publisher": "W.W. Norton",
-    },
-    {
-        "title": "The Good Master",
-        "author": "Kate Seredy",
-        "description": "A spirited city girl is sent to live on her uncle's ranch on the Hungarian plains, where she discovers a world of horses, folk traditions, and family.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "culture", "Hungary", "family", "horses"],
-        "time_period": "Early 20th century",
-        "region": "Europe",
-        "isbn": "9780140301335",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 77,
-        "page_count": 210,
-        "publication_year": 1935,
-        "publisher": "Viking Press",
-    },
-    {
-        "title": "Where the Red Fern Grows",
-        "author": "Wilson Rawls",
-        "description": "A boy in the Ozarks saves for two coonhound pups and together they become the finest hunting team in the valley — a story of love, loyalty, and loss.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["literature", "nature", "animals", "coming of age"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780440412670",
-        "language": "English",
-        "popularity_score": 93,
-        "page_count": 249,
-        "publication_year": 1961,
-        "publisher": "Doubleday",
-    },
-    {
-        "title": "The Bronze Bow",
-        "author": "Elizabeth George Speare",
-        "description": "A young Jewish rebel in first-century Palestine is consumed by hatred of the Romans until he encounters Jesus of Nazareth.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["history", "biblical era", "character", "religion"],
-        "time_period": "Ancient",
-        "region": "Middle East",
-        "isbn": "9780395137192",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 82,
-        "page_count": 254,
-        "publication_year": 1961,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "The Witch of Blackbird Pond",
-        "author": "Elizabeth George Speare",
-        "description": "Kit Tyler, raised in tropical Barbados, struggles to fit into Puritan Connecticut — and her friendship with a Quaker woman leads to accusations of witchcraft.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "colonial America", "character", "religious freedom"],
-        "time_period": "Colonial era",
-        "region": "North America",
-        "isbn": "9780547550299",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 89,
-        "page_count": 249,
-        "publication_year": 1958,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Make Way for Ducklings",
-        "author": "Robert McCloskey",
-        "description": "Mr. and Mrs. Mallard search for the perfect place to raise their family in Boston — a joyful picture book classic.",
-        "reading_level": "early",
-        "age_range": "3-7",
-        "subjects": ["nature", "picture book", "family"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780140564341",
-        "language": "English",
-        "awards": ["Caldecott Medal"],
-        "popularity_score": 91,
-        "page_count": 68,
-        "publication_year": 1941,
-        "publisher": "Viking Press",
-    },
-    {
-        "title": "Ox-Cart Man",
-        "author": "Donald Hall",
-        "description": "The cycle of a New England farming family through the seasons — planting, harvesting, selling, and beginning again. Illustrated by Barbara Cooney.",
-        "reading_level": "early",
-        "age_range": "4-8",
-        "subjects": ["history", "farm life", "picture book", "seasons"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780140504415",
-        "language": "English",
-        "awards": ["Caldecott Medal"],
-        "popularity_score": 84,
-        "page_count": 40,
-        "publication_year": 1979,
-        "publisher": "Viking Press",
-    },
-    # === SCIENCE & MATH ===
-    {
-        "title": "The Story of Science: Aristotle Leads the Way",
-        "author": "Joy Hakim",
-        "description": "The epic story of how humans learned to think scientifically — from ancient Mesopotamia through the Greek golden age.",
-        "long_description": "Joy Hakim does for science what the best historical novelists do for history: she makes it a story you can't put down. From Thales to Aristotle, this book traces the birth of scientific thinking with clarity, wit, and a gift for making abstract ideas tangible for young minds.",
-        "reading_level": "intermediate",
-        "age_range": "10-15",
-        "subjects": ["science", "history of science", "philosophy"],
-        "time_period": "Ancient",
-        "region": "World",
-        "isbn": "9781588341600",
-        "language": "English",
-        "series": "The Story of Science",
-        "popularity_score": 85,
-        "page_count": 282,
-        "publication_year": 2004,
-        "publisher": "Smithsonian Books",
-    },
-    {
-        "title": "Archimedes and the Door of Science",
-        "author": "Jeanne Bendick",
-        "description": "The life and discoveries of Archimedes — levers, pulleys, pi, and the famous bathtub 'Eureka!' — told with charm and clarity.",
-        "reading_level": "early-intermediate",
-        "age_range": "8-12",
-        "subjects": ["science", "biography", "mathematics", "ancient Greece"],
-        "time_period": "Ancient",
-        "region": "Europe",
-        "isbn": "9781883937126",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 143,
-        "publication_year": 1962,
-        "publisher": "Bethlehem Books",
-    },
-    {
-        "title": "The Mystery of the Periodic Table",
-        "author": "Benjamin D. Wiker",
-        "description": "The thrilling detective story of how scientists discovered the elements — from ancient alchemy to Mendeleev's breakthrough.",
-        "reading_level": "intermediate",
-        "age_range": "10-15",
-        "subjects": ["science", "chemistry", "history of science"],
-        "time_period": "Multiple periods",
-        "region": "World",
-        "isbn": "9781883937713",
-        "language": "English",
-        "popularity_score": 78,
-        "page_count": 168,
-        "publication_year": 2003,
-        "publisher": "Bethlehem Books",
-    },
-    {
-        "title": "Discovering Great Artists",
-        "author": "MaryAnn F. Kohl",
-        "description": "Hands-on art activities inspired by the great masters — from Da Vinci to Pollock — making art history a living, creative experience.",
-        "reading_level": "teacher-reference",
-        "age_range": "4-12",
-        "subjects": ["art", "art history", "hands-on activities"],
-        "time_period": "Multiple periods",
-        "region": "World",
-        "isbn": "9780935607093",
-        "language": "English",
-        "popularity_score": 82,
-        "page_count": 144,
-        "publication_year": 1996,
-        "publisher": "Bright Ring Publishing",
-    },
-    {
-        "title": "Mathematician's Delight",
-        "author": "W.W. Sawyer",
-        "description": "A masterful introduction to mathematical thinking that makes algebra, geometry, and calculus genuinely exciting and intuitive.",
-        "reading_level": "advanced",
-        "age_range": "12-adult",
-        "subjects": ["mathematics", "logic"],
-        "time_period": "20th century",
-        "region": "World",
-        "isbn": "9780486462400",
-        "language": "English",
-        "popularity_score": 72,
-        "page_count": 238,
-        "publication_year": 1943,
-        "publisher": "Dover Publications",
-    },
-    {
-        "title": "The Life of Fred: Fractions",
-        "author": "Stanley F. Schmidt",
-        "description": "Five-year-old Fred teaches fractions through hilarious misadventures at KITTENS University — math has never been this fun.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-11",
-        "subjects": ["mathematics", "humor"],
-        "time_period": "Contemporary",
-        "region": "North America",
-        "isbn": "9780979107214",
-        "language": "English",
-        "series": "Life of Fred",
-        "popularity_score": 88,
-        "page_count": 192,
-        "publication_year": 2007,
-        "publisher": "Polka Dot Publishing",
-    },
-    {
-        "title": "Fabre's Book of Insects",
-        "author": "Jean-Henri Fabre",
-        "description": "The legendary entomologist's observations retold for young readers — each insect portrait so vivid you can almost hear the buzzing.",
-        "reading_level": "intermediate",
-        "age_range": "8-13",
-        "subjects": ["science", "nature", "insects", "biology"],
-        "time_period": "19th century",
-        "region": "Europe",
-        "isbn": "9780486401522",
-        "language": "English",
-        "popularity_score": 76,
-        "page_count": 200,
-        "publication_year": 1921,
-        "publisher": "Dover Publications",
-    },
-    # === POETRY ===
-    {
-        "title": "A Child's Garden of Verses",
-        "author": "Robert Louis Stevenson",
-        "description": "The beloved collection of childhood poems — 'The Swing,' 'My Shadow,' 'The Land of Counterpane' — pure magic for young ears.",
-        "long_description": "Stevenson wrote these poems while bedridden with illness, remembering his own childhood with photographic tenderness. These verses capture the inner world of a child with perfect rhythm, vivid imagery, and a gentleness that has enchanted families for over a century.",
-        "reading_level": "early",
-        "age_range": "3-8",
-        "subjects": ["poetry", "literature", "classics"],
-        "time_period": "Victorian era",
-        "region": "Europe",
-        "isbn": "9780689823824",
-        "language": "English",
-        "popularity_score": 90,
-        "page_count": 112,
-        "publication_year": 1885,
-        "publisher": "Various",
-    },
-    {
-        "title": "Favorite Poems Old and New",
-        "author": "Helen Ferris (editor)",
-        "description": "The definitive poetry anthology for families — over 700 poems organized by theme, from silly rhymes to Shakespeare.",
-        "reading_level": "read-aloud",
-        "age_range": "4-14",
-        "subjects": ["poetry", "literature", "anthology"],
-        "time_period": "Multiple periods",
-        "region": "World",
-        "isbn": "9780385076968",
-        "language": "English",
-        "popularity_score": 86,
-        "page_count": 598,
-        "publication_year": 1957,
-        "publisher": "Doubleday",
-    },
-    {
-        "title": "Hailstones and Halibut Bones",
-        "author": "Mary O'Neill",
-        "description": "Twelve poems about colors that teach children to see the world in vivid, sensory detail — 'What is Gold?' 'What is Purple?'",
-        "reading_level": "early",
-        "age_range": "4-9",
-        "subjects": ["poetry", "art", "colors", "picture book"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780385410786",
-        "language": "English",
-        "popularity_score": 79,
-        "page_count": 64,
-        "publication_year": 1961,
-        "publisher": "Doubleday",
-    },
-    # === BIOGRAPHY ===
-    {
-        "title": "George Washington's World",
-        "author": "Genevieve Foster",
-        "description": "What was happening around the world during George Washington's lifetime — a panoramic view of the 18th century.",
-        "long_description": "Foster pioneered the 'horizontal history' approach: instead of studying one country's timeline, she shows what was happening everywhere at the same time. While Washington fought for independence, Mozart composed, Captain Cook explored the Pacific, and Napoleon rose to power. History becomes a living, interconnected tapestry.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "biography", "world history"],
-        "time_period": "18th century",
-        "region": "World",
-        "isbn": "9780964380691",
-        "language": "English",
-        "series": "Foster's World Books",
-        "popularity_score": 84,
-        "page_count": 350,
-        "publication_year": 1941,
-        "publisher": "Beautiful Feet Books",
-    },
-    {
-        "title": "Abraham Lincoln's World",
-        "author": "Genevieve Foster",
-        "description": "The world during Lincoln's lifetime — from Beethoven's symphonies to the opening of Japan to Darwin's voyage on the Beagle.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "biography", "world history"],
-        "time_period": "19th century",
-        "region": "World",
-        "isbn": "9780964380615",
-        "language": "English",
-        "series": "Foster's World Books",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 82,
-        "page_count": 348,
-        "publication_year": 1944,
-        "publisher": "Beautiful Feet Books",
-    },
-    {
-        "title": "The Wright Brothers: How They Invented the Airplane",
-        "author": "Russell Freedman",
-        "description": "The true story of Orville and Wilbur's journey to flight, illustrated with their own stunning photographs.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["biography", "science", "aviation", "invention"],
-        "time_period": "Early 20th century",
-        "region": "North America",
-        "isbn": "9780823412976",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 81,
-        "page_count": 129,
-        "publication_year": 1991,
-        "publisher": "Holiday House",
-    },
-    {
-        "title": "Men of Iron",
-        "author": "Howard Pyle",
-        "description": "A young squire trains for knighthood in 15th-century England — thrilling combat, medieval honor, and Pyle's magnificent illustrations.",
-        "reading_level": "advanced",
-        "age_range": "10-15",
-        "subjects": ["history", "medieval", "adventure", "chivalry"],
-        "time_period": "15th century",
-        "region": "Europe",
-        "isbn": "9780486253411",
-        "language": "English",
-        "popularity_score": 77,
-        "page_count": 240,
-        "publication_year": 1891,
-        "publisher": "Dover Publications",
-    },
-    {
-        "title": "Invincible Louisa",
-        "author": "Cornelia Meigs",
-        "description": "The biography of Louisa May Alcott — her passionate family, her struggles as a writer, and the creation of Little Women.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "literature", "women's history"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780316565943",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 74,
-        "page_count": 260,
-        "publication_year": 1933,
-        "publisher": "Little, Brown",
-    },
-    # === WORLD CULTURES & LITERATURE ===
-    {
-        "title": "The Jungle Book",
-        "author": "Rudyard Kipling",
-        "description": "Mowgli, raised by wolves in the Indian jungle, learns the law of the jungle from Baloo, Bagheera, and Kaa.",
-        "reading_level": "intermediate",
-        "age_range": "8-13",
-        "subjects": ["literature", "nature", "India", "adventure", "classics"],
-        "time_period": "19th century",
-        "region": "Asia",
-        "isbn": "9780141325293",
-        "language": "English",
-        "popularity_score": 89,
-        "page_count": 277,
-        "publication_year": 1894,
-        "publisher": "Macmillan",
-    },
-    {
-        "title": "The Story of Doctor Dolittle",
-        "author": "Hugh Lofting",
-        "description": "A doctor who can talk to animals sets off on extraordinary adventures across the globe.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["literature", "animals", "adventure", "humor"],
-        "time_period": "Victorian era",
-        "region": "World",
-        "isbn": "9780440483076",
-        "language": "English",
-        "series": "Doctor Dolittle",
-        "popularity_score": 82,
-        "page_count": 176,
-        "publication_year": 1920,
-        "publisher": "Frederick A. Stokes",
-    },
-    {
-        "title": "The Railway Children",
-        "author": "E. Nesbit",
-        "description": "Three children move to the countryside near a railway line and have adventures that test their courage and kindness.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "family", "British literature", "classics"],
-        "time_period": "Edwardian era",
-        "region": "Europe",
-        "isbn": "9780141321608",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 256,
-        "publication_year": 1906,
-        "publisher": "Wells Gardner",
-    },
-    {
-        "title": "Black Beauty",
-        "author": "Anna Sewell",
-        "description": "The autobiography of a horse — from gentle country life to harsh city labor — a timeless story of compassion and animal welfare.",
-        "reading_level": "intermediate",
-        "age_range": "8-13",
-        "subjects": ["literature", "animals", "character", "classics"],
-        "time_period": "Victorian era",
-        "region": "Europe",
-        "isbn": "9780141321035",
-        "language": "English",
-        "popularity_score": 87,
-        "page_count": 256,
-        "publication_year": 1877,
-        "publisher": "Jarrold and Sons",
-    },
-    {
-        "title": "Hans Brinker, or The Silver Skates",
-        "author": "Mary Mapes Dodge",
-        "description": "A Dutch boy dreams of winning the great skating race while trying to find a doctor to save his injured father.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "Netherlands", "culture", "family"],
-        "time_period": "19th century",
-        "region": "Europe",
-        "isbn": "9780064401326",
-        "language": "English",
-        "popularity_score": 76,
-        "page_count": 336,
-        "publication_year": 1865,
-        "publisher": "Various",
-    },
-    {
-        "title": "Tales from Shakespeare",
-        "author": "Charles and Mary Lamb",
-        "description": "Twenty of Shakespeare's plays retold as elegant prose stories — the gateway to the Bard for young readers.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["literature", "drama", "Shakespeare", "classics"],
-        "time_period": "Renaissance",
-        "region": "Europe",
-        "isbn": "9780141321684",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 336,
-        "publication_year": 1807,
-        "publisher": "Various",
-    },
-    # === MORE HISTORY ===
-    {
-        "title": "Augustus Caesar's World",
-        "author": "Genevieve Foster",
-        "description": "The world of 44 BC to 14 AD — from the fall of the Roman Republic to the birth of Christianity, told as living history.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "ancient Rome", "world history", "biography"],
-        "time_period": "Ancient",
-        "region": "World",
-        "isbn": "9780964380639",
-        "language": "English",
-        "series": "Foster's World Books",
-        "popularity_score": 80,
-        "page_count": 330,
-        "publication_year": 1947,
-        "publisher": "Beautiful Feet Books",
-    },
-    {
-        "title": "The Story of the World, Volume 2: The Middle Ages",
-        "author": "Susan Wise Bauer",
-        "description": "History from the fall of Rome through the Renaissance — told as a captivating narrative for young listeners.",
-        "reading_level": "read-aloud",
-        "age_range": "5-10",
-        "subjects": ["history", "medieval", "world history"],
-        "time_period": "Medieval",
-        "region": "World",
-        "isbn": "9781933339092",
-        "language": "English",
-        "series": "Story of the World",
-        "popularity_score": 96,
-        "page_count": 372,
-        "publication_year": 2007,
-        "publisher": "Peace Hill Press",
-    },
-    {
-        "title": "The Story of the World, Volume 3: Early Modern Times",
-        "author": "Susan Wise Bauer",
-        "description": "From Elizabeth I to the dawn of the Industrial Revolution — world history told as a story for young minds.",
-        "reading_level": "read-aloud",
-        "age_range": "5-10",
-        "subjects": ["history", "early modern", "world history"],
-        "time_period": "Early Modern",
-        "region": "World",
-        "isbn": "9781933339108",
-        "language": "English",
-        "series": "Story of the World",
-        "popularity_score": 94,
-        "page_count": 400,
-        "publication_year": 2004,
-        "publisher": "Peace Hill Press",
-    },
-    {
-        "title": "The Story of the World, Volume 4: The Modern Age",
-        "author": "Susan Wise Bauer",
-        "description": "From the age of revolution through the modern world — wars, inventions, civil rights, and the shaping of today.",
-        "reading_level": "read-aloud",
-        "age_range": "5-10",
-        "subjects": ["history", "modern history", "world history"],
-        "time_period": "Modern",
-        "region": "World",
-        "isbn": "9781933339115",
-        "language": "English",
-        "series": "Story of the World",
-        "popularity_score": 93,
-        "page_count": 468,
-        "publication_year": 2005,
-        "publisher": "Peace Hill Press",
-    },
-    {
-        "title": "Otto of the Silver Hand",
-        "author": "Howard Pyle",
-        "description": "A gentle boy caught between warring medieval families learns that goodness can triumph over violence.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["history", "medieval", "character", "adventure"],
-        "time_period": "Medieval",
-        "region": "Europe",
-        "isbn": "9780486217840",
-        "language": "English",
-        "popularity_score": 74,
-        "page_count": 136,
-        "publication_year": 1888,
-        "publisher": "Dover Publications",
-    },
-    {
-        "title": "Adam of the Road",
-        "author": "Elizabeth Janet Gray",
-        "description": "An eleven-year-old minstrel's son travels medieval England searching for his father and his stolen dog.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["history", "medieval", "adventure", "music"],
-        "time_period": "13th century",
-        "region": "Europe",
-        "isbn": "9780140324648",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 77,
-        "page_count": 320,
-        "publication_year": 1942,
-        "publisher": "Viking Press",
-    },
-    # === NATURE & SCIENCE (more) ===
-    {
-        "title": "Keeping a Nature Journal",
-        "author": "Clare Walker Leslie",
-        "description": "A practical, inspiring guide to observing and recording nature — the companion to outdoor exploration.",
-        "reading_level": "teacher-reference",
-        "age_range": "8-adult",
-        "subjects": ["nature", "art", "science", "journaling"],
-        "time_period": "Contemporary",
-        "region": "North America",
-        "isbn": "9781580174930",
-        "language": "English",
-        "popularity_score": 75,
-        "page_count": 216,
-        "publication_year": 2003,
-        "publisher": "Storey Publishing",
-    },
-    {
-        "title": "The Country Diary of an Edwardian Lady",
-        "author": "Edith Holden",
-        "description": "A naturalist's exquisite illustrated diary of the English countryside through the seasons — wildflowers, birds, and poetry.",
-        "reading_level": "read-aloud",
-        "age_range": "6-adult",
-        "subjects": ["nature", "art", "seasons", "British countryside"],
-        "time_period": "Edwardian era",
-        "region": "Europe",
-        "isbn": "9780030198717",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 192,
-        "publication_year": 1977,
-        "publisher": "Henry Holt",
-    },
-    {
-        "title": "Owls in the Family",
-        "author": "Farley Mowat",
-        "description": "Two pet owls — Wol and Weeps — turn a Canadian boy's life upside down in this hilarious true story.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-11",
-        "subjects": ["nature", "animals", "humor", "memoir"],
-        "time_period": "20th century",
-        "region": "Canada",
-        "isbn": "9780440413615",
-        "language": "English",
-        "popularity_score": 83,
-        "page_count": 107,
-        "publication_year": 1961,
-        "publisher": "Little, Brown",
-    },
-    {
-        "title": "My Side of the Mountain",
-        "author": "Jean Craighead George",
-        "description": "A boy runs away to the Catskill Mountains and survives alone in the wilderness with a falcon, a weasel, and his own ingenuity.",
-        "reading_level": "intermediate",
-        "age_range": "9-13",
-        "subjects": ["nature", "survival", "adventure", "independence"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780142401118",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 91,
-        "page_count": 177,
-        "publication_year": 1959,
-        "publisher": "Dutton",
-    },
-    {
-        "title": "The Ology Series: Dragonology",
-        "author": "Dr. Ernest Drake",
-        "description": "A richly illustrated 'field guide' to dragons — presented as a Victorian naturalist's journal with pull-out maps and specimens.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["fantasy", "nature", "art", "interactive"],
-        "time_period": "Victorian era",
-        "region": "World",
-        "isbn": "9780763623296",
-        "language": "English",
-        "series": "Ology",
-        "popularity_score": 84,
-        "page_count": 30,
-        "publication_year": 2003,
-        "publisher": "Candlewick Press",
-    },
-    # === PICTURE BOOKS & EARLY READERS ===
-    {
-        "title": "The Story of Ferdinand",
-        "author": "Munro Leaf",
-        "description": "A young bull who would rather smell flowers than fight in the ring — a gentle, subversive classic about being true to yourself.",
-        "reading_level": "early",
-        "age_range": "3-7",
-        "subjects": ["literature", "picture book", "character", "peace"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780448421902",
-        "language": "English",
-        "popularity_score": 89,
-        "page_count": 72,
-        "publication_year": 1936,
-        "publisher": "Viking Press",
-    },
-    {
-        "title": "Mike Mulligan and His Steam Shovel",
-        "author": "Virginia Lee Burton",
-        "description": "Mike Mulligan and his beloved steam shovel Mary Anne prove they can dig as fast as modern machines — a celebration of determination.",
-        "reading_level": "early",
-        "age_range": "3-7",
-        "subjects": ["literature", "picture book", "machines", "determination"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780395169612",
-        "language": "English",
-        "popularity_score": 87,
-        "page_count": 48,
-        "publication_year": 1939,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "The Little House",
-        "author": "Virginia Lee Burton",
-        "description": "A little house in the country watches the city grow up around her — a poignant story about progress, nature, and home.",
-        "reading_level": "early",
-        "age_range": "3-7",
-        "subjects": ["literature", "picture book", "nature", "change"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780395259382",
-        "language": "English",
-        "awards": ["Caldecott Medal"],
-        "popularity_score": 88,
-        "page_count": 44,
-        "publication_year": 1942,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Caps for Sale",
-        "author": "Esphyr Slobodkina",
-        "description": "A peddler, a tree full of monkeys, and a stack of caps — one of the most satisfying read-alouds ever written.",
-        "reading_level": "early",
-        "age_range": "3-6",
-        "subjects": ["literature", "picture book", "humor"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780064431439",
-        "language": "English",
-        "popularity_score": 86,
-        "page_count": 48,
-        "publication_year": 1940,
-        "publisher": "Harper",
-    },
-    {
-        "title": "Millions of Cats",
-        "author": "Wanda Gág",
-        "description": "An old man sets out to find one kitten and comes home with hundreds of cats, thousands of cats, millions and billions and trillions of cats.",
-        "reading_level": "early",
-        "age_range": "3-6",
-        "subjects": ["literature", "picture book", "classics"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780698113633",
-        "language": "English",
-        "popularity_score": 84,
-        "page_count": 32,
-        "publication_year": 1928,
-        "publisher": "Coward-McCann",
-    },
-    {
-        "title": "Madeline",
-        "author": "Ludwig Bemelmans",
-        "description": "In an old house in Paris covered with vines lived twelve little girls in two straight lines — and the smallest one was Madeline.",
-        "reading_level": "early",
-        "age_range": "3-7",
-        "subjects": ["literature", "picture book", "France", "courage"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780140564396",
-        "language": "English",
-        "awards": ["Caldecott Honor"],
-        "popularity_score": 92,
-        "page_count": 56,
-        "publication_year": 1939,
-        "publisher": "Viking Press",
-    },
-    # === MORE LITERARY CLASSICS ===
-    {
-        "title": "Little Women",
-        "author": "Louisa May Alcott",
-        "description": "The four March sisters — Meg, Jo, Beth, and Amy — grow up during the Civil War, facing poverty, loss, and love with spirit and grace.",
-        "long_description": "This is the book that launched a thousand readers. Alcott drew from her own family life to create characters so real they feel like friends. Jo March, fierce and literary; gentle Beth; vain Amy; responsible Meg — together they embody the joys and heartaches of growing up. It is as fresh today as the day it was published.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["literature", "family", "Civil War", "classics", "women's history"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780147514011",
-        "language": "English",
-        "popularity_score": 94,
-        "page_count": 449,
-        "publication_year": 1868,
-        "publisher": "Various",
-    },
-    {
-        "title": "Robinson Crusoe",
-        "author": "Daniel Defoe",
-        "description": "A man shipwrecked on a deserted island survives for 28 years through ingenuity, faith, and determination — the original survival story.",
-        "reading_level": "advanced",
-        "age_range": "10-15",
-        "subjects": ["literature", "adventure", "survival", "classics"],
-        "time_period": "18th century",
-        "region": "World",
-        "isbn": "9780141439822",
-        "language": "English",
-        "popularity_score": 85,
-        "page_count": 320,
-        "publication_year": 1719,
-        "publisher": "Various",
-    },
-    {
-        "title": "The Swiss Family Robinson",
-        "author": "Johann David Wyss",
-        "description": "A family shipwrecked on a tropical island builds an extraordinary life using wit, knowledge, and the bounty of nature.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["literature", "adventure", "survival", "family", "nature"],
-        "time_period": "19th century",
-        "region": "World",
-        "isbn": "9780141325309",
-        "language": "English",
-        "popularity_score": 83,
-        "page_count": 352,
-        "publication_year": 1812,
-        "publisher": "Various",
-    },
-    {
-        "title": "Swallows and Amazons",
-        "author": "Arthur Ransome",
-        "description": "Four children sail, camp, and explore the English Lake District in a timeless adventure of childhood freedom and imagination.",
-        "reading_level": "intermediate",
-        "age_range": "8-13",
-        "subjects": ["literature", "adventure", "sailing", "British literature"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780099503910",
-        "language": "English",
-        "series": "Swallows and Amazons",
-        "popularity_score": 82,
-        "page_count": 352,
-        "publication_year": 1930,
-        "publisher": "Jonathan Cape",
-    },
-    {
-        "title": "The Phantom Tollbooth",
-        "author": "Norton Juster",
-        "description": "Bored Milo drives through a mysterious tollbooth into the Kingdom of Wisdom — where words and numbers are alive, and learning is an adventure.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "fantasy", "humor", "wordplay", "mathematics"],
-        "time_period": "20th century",
-        "region": "Fantasy World",
-        "isbn": "9780394820378",
-        "language": "English",
-        "popularity_score": 91,
-        "page_count": 272,
-        "publication_year": 1961,
-        "publisher": "Random House",
-    },
-    {
-        "title": "The Borrowers",
-        "author": "Mary Norton",
-        "description": "Tiny people living under the floorboards 'borrow' from the humans upstairs — until a boy discovers them and their world is threatened.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-11",
-        "subjects": ["literature", "fantasy", "adventure", "British literature"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780152047375",
-        "language": "English",
-        "awards": ["Carnegie Medal"],
-        "series": "The Borrowers",
-        "popularity_score": 86,
-        "page_count": 180,
-        "publication_year": 1952,
-        "publisher": "Harcourt",
-    },
-    {
-        "title": "Mrs. Frisby and the Rats of NIMH",
-        "author": "Robert C. O'Brien",
-        "description": "A widowed mouse must move her family before the farmer's plow destroys their home — and turns to a colony of super-intelligent rats for help.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "fantasy", "science", "adventure"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780689710681",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 89,
-        "page_count": 233,
-        "publication_year": 1971,
-        "publisher": "Atheneum",
-    },
-    # === MUSIC & ART ===
-    {
-        "title": "Sebastian Bach, The Boy from Thuringia",
-        "author": "Opal Wheeler",
-        "description": "The childhood of Johann Sebastian Bach — how a musical genius grew up in a family of musicians in small-town Germany.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["biography", "music", "art"],
-        "time_period": "17th century",
-        "region": "Europe",
-        "isbn": "9781893103139",
-        "language": "English",
-        "series": "Great Musicians Series",
-        "popularity_score": 72,
-        "page_count": 144,
-        "publication_year": 1937,
-        "publisher": "Zeezok Publishing",
-    },
-    {
-        "title": "Beethoven Lives Upstairs",
-        "author": "Barbara Nichol",
-        "description": "A boy's hilarious and touching letters about the eccentric genius who moves into the apartment above — Ludwig van Beethoven.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["biography", "music", "humor"],
-        "time_period": "19th century",
-        "region": "Europe",
-        "isbn": "9780531071182",
-        "language": "English",
-        "popularity_score": 81,
-        "page_count": 52,
-        "publication_year": 1993,
-        "publisher": "Orchard Books",
-    },
-    {
-        "title": "Getting to Know the World's Greatest Artists: Monet",
-        "author": "Mike Venezia",
-        "description": "An accessible, humorous introduction to Claude Monet and Impressionism — perfect for making art history approachable.",
-        "reading_level": "early",
-        "age_range": "5-9",
-        "subjects": ["art", "biography", "art history"],
-        "time_period": "19th century",
-        "region": "Europe",
-        "isbn": "9780516422763",
-        "language": "English",
-        "series": "Getting to Know the World's Greatest Artists",
-        "popularity_score": 76,
-        "page_count": 32,
-        "publication_year": 1990,
-        "publisher": "Children's Press",
-    },
-    # ---- CHRISTIAN LIVING BOOKS ----
-    {
-        "title": "The Child's Story Bible",
-        "author": "Catherine F. Vos",
-        "description": "A beloved retelling of the entire Bible in vivid, literary language that captivates children while remaining faithful to Scripture.",
-        "long_description": "For nearly a century, this has been the gold standard for Bible storybooks in Reformed and Charlotte Mason households. Catherine Vos retells the full sweep of Scripture — from Creation through Revelation — in rich, narrative prose that treats children as capable of understanding deep truths. Unlike simplified 'Bible story' books, Vos preserves the drama, complexity, and beauty of the original text.",
-        "reading_level": "read-aloud",
-        "age_range": "4-12",
-        "subjects": ["bible", "religion", "literature", "character"],
-        "time_period": "Ancient",
-        "region": "Middle East",
-        "isbn": "9780802850119",
-        "language": "English",
-        "popularity_score": 90,
-        "page_count": 732,
-        "publication_year": 1934,
-        "publisher": "Eerdmans",
-    },
-    {
-        "title": "The Hiding Place",
-        "author": "Corrie ten Boom",
-        "description": "The true story of Corrie ten Boom's family, who sheltered Jews in their home during the Nazi occupation of Holland — and survived the horrors of a concentration camp through faith.",
-        "long_description": "Corrie ten Boom and her family, devout Dutch Christians, risked everything to hide Jewish refugees in a secret room behind a bedroom wall. When they were betrayed and sent to Ravensbrück concentration camp, Corrie's faith was tested to its limits. This memoir is a testament to courage, forgiveness, and the power of faith in the darkest circumstances — one of the most important Christian testimonies of the 20th century.",
-        "reading_level": "advanced",
-        "age_range": "12-18",
-        "subjects": ["biography", "history", "religion", "character", "World War II"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780800794057",
-        "language": "English",
-        "awards": ["ECPA Gold Medallion"],
-        "popularity_score": 93,
-        "page_count": 256,
-        "publication_year": 1971,
-        "publisher": "Chosen Books",
-    },
-    {
-        "title": "Treasures of the Snow",
-        "author": "Patricia St. John",
-        "description": "In a Swiss mountain village, a boy's cruel act leaves another child crippled — and both must learn what forgiveness and redemption truly mean.",
-        "long_description": "When Lucien pushes little Dani off a cliff in a moment of jealousy, Dani's sister Annette vows never to forgive him. Set against the breathtaking backdrop of the Swiss Alps, this story follows both children as bitterness destroys and grace heals. Patricia St. John weaves the gospel into a gripping story without ever feeling preachy — children are drawn in by the drama and come away understanding forgiveness at the deepest level.",
-        "reading_level": "intermediate",
-        "age_range": "8-14",
-        "subjects": ["literature", "character", "religion", "adventure"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780802465757",
-        "language": "English",
-        "popularity_score": 85,
-        "page_count": 240,
-        "publication_year": 1950,
-        "publisher": "Moody Publishers",
-    },
-    {
-        "title": "The Tanglewoods' Secret",
-        "author": "Patricia St. John",
-        "description": "A willful, hot-tempered girl discovers a life-changing secret in the English countryside — that love and gentleness come from knowing the Good Shepherd.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "character", "religion", "nature"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780802465740",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 128,
-        "publication_year": 1948,
-        "publisher": "Moody Publishers",
-    },
-    {
-        "title": "Star of Light",
-        "author": "Patricia St. John",
-        "description": "In the mountains of Morocco, a young boy rescues his blind baby sister from being sold, and both children find refuge — and the Light of the World — at a missionary nurse's home.",
-        "reading_level": "intermediate",
-        "age_range": "8-14",
-        "subjects": ["literature", "character", "religion", "missions"],
-        "time_period": "20th century",
-        "region": "Africa",
-        "isbn": "9780802465764",
-        "language": "English",
-        "popularity_score": 78,
-        "page_count": 160,
-        "publication_year": 1953,
-        "publisher": "Moody Publishers",
-    },
-    {
-        "title": "Dangerous Journey",
-        "author": "John Bunyan, retold by Oliver Hunkin",
-        "description": "A stunning illustrated edition of Pilgrim's Progress, bringing Bunyan's allegory to life with dramatic artwork that makes this masterpiece accessible to older children.",
-        "reading_level": "intermediate",
-        "age_range": "8-14",
-        "subjects": ["literature", "religion", "allegory", "classics"],
-        "time_period": "17th century",
-        "region": "Europe",
-        "isbn": "9780802836199",
-        "language": "English",
-        "popularity_score": 82,
-        "page_count": 128,
-        "publication_year": 1985,
-        "publisher": "Eerdmans",
-    },
-    {
-        "title": "Hinds' Feet on High Places",
-        "author": "Hannah Hurnard",
-        "description": "An allegorical tale of Much-Afraid, who journeys with the Good Shepherd from the Valley of Humiliation to the High Places — a story of spiritual transformation.",
-        "reading_level": "advanced",
-        "age_range": "12-18",
-        "subjects": ["literature", "religion", "allegory", "character"],
-        "region": "World",
-        "isbn": "9780842314299",
-        "language": "English",
-        "popularity_score": 81,
-        "page_count": 240,
-        "publication_year": 1955,
-        "publisher": "Tyndale House",
-    },
-    {
-        "title": "The Jesus Storybook Bible",
-        "author": "Sally Lloyd-Jones",
-        "description": "Every story whispers His name — a beautifully written Bible storybook that shows how every narrative in Scripture points to Jesus.",
-        "long_description": "This isn't a book of moral lessons. Sally Lloyd-Jones retells the great stories of the Bible in rich, poetic prose, showing children that the entire Bible is one long story — an adventure story about a young Hero who comes from a far country to win back his lost treasure. From Genesis to Revelation, every story points forward or back to Jesus. The writing is so beautiful that adults weep reading it aloud.",
-        "reading_level": "read-aloud",
-        "age_range": "3-8",
-        "subjects": ["bible", "religion", "literature"],
-        "time_period": "Ancient",
-        "region": "Middle East",
-        "isbn": "9780310708254",
-        "language": "English",
-        "popularity_score": 94,
-        "page_count": 352,
-        "publication_year": 2007,
-        "publisher": "Zonderkidz",
-    },
-    {
-        "title": "Trial and Triumph: Stories from Church History",
-        "author": "Richard M. Hannula",
-        "description": "Forty-six true stories of Christian heroes across two thousand years of church history — from Polycarp to Dietrich Bonhoeffer.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "biography", "religion", "character"],
-        "time_period": "Multiple eras",
-        "region": "World",
-        "isbn": "9781591280576",
-        "language": "English",
-        "popularity_score": 79,
-        "page_count": 244,
-        "publication_year": 1999,
-        "publisher": "Canon Press",
-    },
-    {
-        "title": "Through Gates of Splendor",
-        "author": "Elisabeth Elliot",
-        "description": "The true account of five young missionaries martyred by the Auca Indians in Ecuador — and the extraordinary faith that drove them into the jungle.",
-        "reading_level": "advanced",
-        "age_range": "14-18",
-        "subjects": ["biography", "missions", "religion", "history"],
-        "time_period": "20th century",
-        "region": "South America",
-        "isbn": "9780842371520",
-        "language": "English",
-        "popularity_score": 86,
-        "page_count": 267,
-        "publication_year": 1957,
-        "publisher": "Tyndale House",
-    },
-    {
-        "title": "Shadow of the Almighty: The Life and Testament of Jim Elliot",
-        "author": "Elisabeth Elliot",
-        "description": "The biography of missionary Jim Elliot, drawn from his journals and letters — revealing the passionate faith of a young man who gave everything for the gospel.",
-        "reading_level": "advanced",
-        "age_range": "14-18",
-        "subjects": ["biography", "missions", "religion"],
-        "time_period": "20th century",
-        "region": "South America",
-        "isbn": "9780060622138",
-        "language": "English",
-        "popularity_score": 83,
-        "page_count": 272,
-        "publication_year": 1958,
-        "publisher": "HarperOne",
-    },
-    {
-        "title": "George Müller: The Guardian of Bristol's Orphans",
-        "author": "Janet & Geoff Benge",
-        "description": "The incredible true story of George Müller, who fed and housed over ten thousand orphans in Victorian England — never once asking for money, relying solely on prayer.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "missions", "religion", "history", "character"],
-        "time_period": "Victorian era",
-        "region": "Europe",
-        "isbn": "9781576581452",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 82,
-        "page_count": 200,
-        "publication_year": 1999,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "Gladys Aylward: The Adventure of a Lifetime",
-        "author": "Janet & Geoff Benge",
-        "description": "A parlor maid from London who became one of the most remarkable missionaries in China — leading a hundred orphans over the mountains to safety during the Japanese invasion.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "missions", "religion", "history", "adventure"],
-        "time_period": "20th century",
-        "region": "Asia",
-        "isbn": "9781576580196",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 81,
-        "page_count": 192,
-        "publication_year": 1998,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "Eric Liddell: Something Greater Than Gold",
-        "author": "Janet & Geoff Benge",
-        "description": "The Olympic champion who refused to run on Sunday — and later gave his life as a missionary in China. The true story behind Chariots of Fire.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "missions", "religion", "character"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9781576580226",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 84,
-        "page_count": 192,
-        "publication_year": 1998,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "Hudson Taylor: Deep in the Heart of China",
-        "author": "Janet & Geoff Benge",
-        "description": "The founder of the China Inland Mission dressed in Chinese clothes, ate Chinese food, and trusted God for every need — opening inland China to the gospel.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "missions", "religion", "history"],
-        "time_period": "Victorian era",
-        "region": "Asia",
-        "isbn": "9781576580165",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 80,
-        "page_count": 192,
-        "publication_year": 1998,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "Amy Carmichael: Rescuer of Precious Gems",
-        "author": "Janet & Geoff Benge",
-        "description": "For fifty-five years without a furlough, Amy Carmichael rescued children from temple slavery in India — a story of fierce compassion and unbreakable faith.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "missions", "religion", "character"],
-        "time_period": "Victorian era",
-        "region": "Asia",
-        "isbn": "9781576581377",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 79,
-        "page_count": 192,
-        "publication_year": 2002,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "Corrie ten Boom: Keeper of the Angels' Den",
-        "author": "Janet & Geoff Benge",
-        "description": "The children's biography of Corrie ten Boom — watchmaker, resistance hero, and concentration camp survivor who preached forgiveness around the world.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "religion", "history", "World War II", "character"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9781576581360",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 83,
-        "page_count": 200,
-        "publication_year": 1999,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "William Carey: Obliged to Go",
-        "author": "Janet & Geoff Benge",
-        "description": "A cobbler who taught himself languages, defied his denomination, and became the father of modern missions — transforming India through translation, education, and social reform.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "missions", "religion", "history"],
-        "time_period": "18th century",
-        "region": "Asia",
-        "isbn": "9781576581476",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 77,
-        "page_count": 192,
-        "publication_year": 2002,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "David Livingstone: Africa's Trailblazer",
-        "author": "Janet & Geoff Benge",
-        "description": "The Scottish doctor and explorer who walked thirty thousand miles across Africa — driven by a vision to end the slave trade and bring the gospel to unreached peoples.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["biography", "missions", "religion", "history", "geography"],
-        "time_period": "Victorian era",
-        "region": "Africa",
-        "isbn": "9781576581537",
-        "language": "English",
-        "series": "Christian Heroes: Then & Now",
-        "popularity_score": 78,
-        "page_count": 192,
-        "publication_year": 1999,
-        "publisher": "YWAM Publishing",
-    },
-    {
-        "title": "Stepping Heavenward",
-        "author": "Elizabeth Prentiss",
-        "description": "The diary of Katherine Mortimer from age sixteen through adulthood — an honest, sometimes humorous portrait of a woman learning to surrender her will to God through the joys and trials of ordinary life.",
-        "reading_level": "advanced",
-        "age_range": "14-18",
-        "subjects": ["literature", "religion", "character", "classics"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9781941129524",
-        "language": "English",
-        "popularity_score": 75,
-        "page_count": 320,
-        "publication_year": 1869,
-        "publisher": "Calvary Press",
-    },
-    {
-        "title": "Augustine Came to Kent",
-        "author": "Barbara Willard",
-        "description": "The vivid story of how Christianity came to Anglo-Saxon England in 597 AD — told through the eyes of a young servant boy who travels with Augustine's mission from Rome.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "religion", "literature"],
-        "time_period": "6th century",
-        "region": "Europe",
-        "isbn": "9781883937546",
-        "language": "English",
-        "popularity_score": 74,
-        "page_count": 160,
-        "publication_year": 1963,
-        "publisher": "Bethlehem Books",
-    },
-    {
-        "title": "Mere Christianity",
-        "author": "C.S. Lewis",
-        "description": "C.S. Lewis's legendary BBC radio talks, adapted into the most popular and accessible defense of the Christian faith ever written — logical, witty, and deeply humane.",
-        "reading_level": "advanced",
-        "age_range": "14-18",
-        "subjects": ["religion", "philosophy", "classics"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780060652920",
-        "language": "English",
-        "popularity_score": 92,
-        "page_count": 227,
-        "publication_year": 1952,
-        "publisher": "HarperOne",
-    },
-    {
-        "title": "The Screwtape Letters",
-        "author": "C.S. Lewis",
-        "description": "A senior demon writes letters of advice to his incompetent nephew on how to tempt a human soul — a wickedly clever inversion that illuminates the Christian life.",
-        "reading_level": "advanced",
-        "age_range": "14-18",
-        "subjects": ["literature", "religion", "satire", "character"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780060652937",
-        "language": "English",
-        "popularity_score": 88,
-        "page_count": 209,
-        "publication_year": 1942,
-        "publisher": "HarperOne",
-    },
-    {
-        "title": "Foxe's Book of Martyrs",
-        "author": "John Foxe, edited by William Byron Forbush",
-        "description": "The classic account of Christian martyrdom from the early church through the Reformation — stories of faith under fire that have inspired believers for over four centuries.",
-        "reading_level": "advanced",
-        "age_range": "12-18",
-        "subjects": ["history", "religion", "biography", "character"],
-        "time_period": "Multiple eras",
-        "region": "World",
-        "isbn": "9780310243915",
-        "language": "English",
-        "popularity_score": 77,
-        "page_count": 384,
-        "publication_year": 1563,
-        "publisher": "Zondervan",
-    },
-    {
-        "title": "God's Smuggler",
-        "author": "Brother Andrew",
-        "description": "The thrilling true story of Brother Andrew, who smuggled Bibles behind the Iron Curtain during the Cold War — trusting God to blind the eyes of border guards.",
-        "reading_level": "advanced",
-        "age_range": "12-18",
-        "subjects": ["biography", "missions", "religion", "history", "adventure"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780800793012",
-        "language": "English",
-        "popularity_score": 84,
-        "page_count": 272,
-        "publication_year": 1967,
-        "publisher": "Chosen Books",
-    },
-    {
-        "title": "The Ology: Ancient Truths, Ever New",
-        "author": "Marty Machowski",
-        "description": "A beautifully illustrated systematic theology for children — teaching deep doctrines of the faith in language kids can understand, with discussion questions and Scripture references.",
-        "reading_level": "read-aloud",
-        "age_range": "6-12",
-        "subjects": ["bible", "religion", "theology"],
-        "region": "World",
-        "isbn": "9781942572312",
-        "language": "English",
-        "popularity_score": 78,
-        "page_count": 160,
-        "publication_year": 2015,
-        "publisher": "New Growth Press",
-    },
-    {
-        "title": "Missionary Stories with the Millers",
-        "author": "Mildred A. Martin",
-        "description": "Twenty-three true stories of missionaries around the world, told through the Miller family's evening devotional time — perfect for family read-alouds.",
-        "reading_level": "read-aloud",
-        "age_range": "5-10",
-        "subjects": ["missions", "religion", "biography", "geography"],
-        "region": "World",
-        "isbn": "9780876023570",
-        "language": "English",
-        "series": "Miller Family Series",
-        "popularity_score": 73,
-        "page_count": 176,
-        "publication_year": 1993,
-        "publisher": "Green Pastures Press",
-    },
-    {
-        "title": "The Yearling",
-        "author": "Marjorie Kinnan Rawlings",
-        "description": "A boy named Jody adopts an orphaned fawn in the Florida scrublands — and learns the wrenching cost of growing up when the deer threatens the family's survival.",
-        "long_description": "Set in the post-Civil War Florida backwoods, this Pulitzer Prize winner is one of the great coming-of-age novels in American literature. Jody Baxter's love for his pet deer Flag is set against the harsh realities of frontier life — hunger, flood, rattlesnakes, and the unforgiving land. Rawlings writes nature like a painter, and the ending is one of the most powerful in children's literature.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["literature", "nature", "character", "American life"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780020449317",
-        "language": "English",
-        "awards": ["Pulitzer Prize"],
-        "popularity_score": 85,
-        "page_count": 400,
-        "publication_year": 1938,
-        "publisher": "Scribner",
-    },
-    # ---- MORE GENERAL LIVING BOOKS ----
-    {
-        "title": "Cathedral: The Story of Its Construction",
-        "author": "David Macaulay",
-        "description": "With meticulous pen-and-ink illustrations, David Macaulay reveals how a medieval cathedral was designed and built — stone by stone, over decades, by the hands of a whole community.",
-        "reading_level": "intermediate",
-        "age_range": "8-14",
-        "subjects": ["history", "architecture", "art", "medieval"],
-        "time_period": "Medieval",
-        "region": "Europe",
-        "isbn": "9780395316689",
-        "language": "English",
-        "awards": ["Caldecott Honor"],
-        "popularity_score": 86,
-        "page_count": 80,
-        "publication_year": 1973,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Castle",
-        "author": "David Macaulay",
-        "description": "How a Welsh castle and its surrounding town were planned and built in the thirteenth century — brought to life through stunning architectural drawings.",
-        "reading_level": "intermediate",
-        "age_range": "8-14",
-        "subjects": ["history", "architecture", "medieval"],
-        "time_period": "Medieval",
-        "region": "Europe",
-        "isbn": "9780395329207",
-        "language": "English",
-        "awards": ["Caldecott Honor"],
-        "popularity_score": 83,
-        "page_count": 80,
-        "publication_year": 1977,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "The Sign of the Beaver",
-        "author": "Elizabeth George Speare",
-        "description": "Left alone in the Maine wilderness, thirteen-year-old Matt must survive with help from a Penobscot Indian boy — and both learn to see beyond their differences.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "adventure", "character", "Native American"],
-        "time_period": "Colonial era",
-        "region": "North America",
-        "isbn": "9780547577111",
-        "language": "English",
-        "awards": ["Newbery Honor", "Scott O'Dell Award"],
-        "popularity_score": 87,
-        "page_count": 144,
-        "publication_year": 1983,
-        "publisher": "Houghton Mifflin",
-    },
-    {
-        "title": "Across Five Aprils",
-        "author": "Irene Hunt",
-        "description": "The Civil War tears through southern Illinois as young Jethro Creighton watches his brothers leave to fight on opposite sides — a story of a boy forced to grow up too fast.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["history", "Civil War", "character", "American life"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780425182789",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 82,
-        "page_count": 190,
-        "publication_year": 1964,
-        "publisher": "Berkley Books",
-    },
-    {
-        "title": "Roll of Thunder, Hear My Cry",
-        "author": "Mildred D. Taylor",
-        "description": "The Logan family fights to keep their land and their dignity in Depression-era Mississippi, where being Black means living under constant threat.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["history", "civil rights", "character", "American life"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780140384512",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 88,
-        "page_count": 288,
-        "publication_year": 1976,
-        "publisher": "Puffin Books",
-    },
-    {
-        "title": "Sarah, Plain and Tall",
-        "author": "Patricia MacLachlan",
-        "description": "A mail-order bride from Maine comes to the prairie — and two motherless children hold their breath, hoping she'll stay.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["literature", "American life", "character"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780064402057",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 84,
-        "page_count": 64,
-        "publication_year": 1985,
-        "publisher": "Harper Trophy",
-    },
-    {
-        "title": "The Courage of Sarah Noble",
-        "author": "Alice Dalgliesh",
-        "description": "Eight-year-old Sarah accompanies her father into the Connecticut wilderness in 1707, clutching her mother's words: 'Keep up your courage, Sarah Noble.'",
-        "reading_level": "early",
-        "age_range": "6-10",
-        "subjects": ["history", "character", "colonial America", "adventure"],
-        "time_period": "Colonial era",
-        "region": "North America",
-        "isbn": "9780689715402",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 80,
-        "page_count": 52,
-        "publication_year": 1954,
-        "publisher": "Aladdin",
-    },
-    {
-        "title": "Ben and Me",
-        "author": "Robert Lawson",
-        "description": "The 'true' story of Benjamin Franklin as told by Amos, the mouse who lived in his fur cap — and claims credit for most of Ben's best ideas.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["history", "biography", "humor", "American life"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780316517324",
-        "language": "English",
-        "popularity_score": 79,
-        "page_count": 114,
-        "publication_year": 1939,
-        "publisher": "Little, Brown",
-    },
-    {
-        "title": "Mr. Revere and I",
-        "author": "Robert Lawson",
-        "description": "The story of Paul Revere's famous ride — narrated by his horse, Scheherazade, who has very strong opinions about the whole affair.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["history", "biography", "humor", "American Revolution"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780316517393",
-        "language": "English",
-        "popularity_score": 78,
-        "page_count": 152,
-        "publication_year": 1953,
-        "publisher": "Little, Brown",
-    },
-    {
-        "title": "The Hundred Dresses",
-        "author": "Eleanor Estes",
-        "description": "Wanda Petronski claims to have a hundred dresses at home, though she wears the same faded dress every day. Her classmates' teasing leads to one of the most powerful lessons about bullying ever written for children.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["literature", "character", "social issues"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780152052607",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 83,
-        "page_count": 80,
-        "publication_year": 1944,
-        "publisher": "Harcourt",
-    },
-    {
-        "title": "Homer Price",
-        "author": "Robert McCloskey",
-        "description": "A boy in small-town Ohio has the most wonderfully absurd adventures — from a runaway doughnut machine to a pet skunk to a robbery solved by comic books.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "humor", "American life"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780142404157",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 160,
-        "publication_year": 1943,
-        "publisher": "Puffin Books",
-    },
-    {
-        "title": "Pippi Longstocking",
-        "author": "Astrid Lindgren",
-        "description": "The strongest girl in the world lives alone with a monkey and a horse, makes up her own rules, and turns the whole town upside down with her wild adventures.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["literature", "humor", "adventure"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780142402504",
-        "language": "English",
-        "popularity_score": 87,
-        "page_count": 160,
-        "publication_year": 1945,
-        "publisher": "Puffin Books",
-    },
-    {
-        "title": "The Cricket in Times Square",
-        "author": "George Selden",
-        "description": "A cricket from Connecticut accidentally ends up in a New York City subway station — and his extraordinary musical talent transforms the lives of his new friends.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "music", "friendship"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780312380038",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 82,
-        "page_count": 151,
-        "publication_year": 1960,
-        "publisher": "Square Fish",
-    },
-    {
-        "title": "Stuart Little",
-        "author": "E.B. White",
-        "description": "The second son of the Little family is only two inches tall and looks remarkably like a mouse — which makes life in New York City quite an adventure.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "adventure", "humor"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780064400565",
-        "language": "English",
-        "popularity_score": 84,
-        "page_count": 131,
-        "publication_year": 1945,
-        "publisher": "Harper Trophy",
-    },
-    {
-        "title": "The Trumpet of the Swan",
-        "author": "E.B. White",
-        "description": "Louis is a trumpeter swan born without a voice — so his father steals a trumpet, and Louis must earn enough money to pay for it while finding his place in the world.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "nature", "music", "character"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780064408677",
-        "language": "English",
-        "popularity_score": 81,
-        "page_count": 252,
-        "publication_year": 1970,
-        "publisher": "Harper Trophy",
-    },
-    {
-        "title": "Justin Morgan Had a Horse",
-        "author": "Marguerite Henry",
-        "description": "The true story of the small, plain colt that could outrun, outpull, and outwalk every horse in Vermont — founding the Morgan horse breed.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["history", "animals", "biography", "American life"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780689714924",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 78,
-        "page_count": 175,
-        "publication_year": 1945,
-        "publisher": "Aladdin",
-    },
-    {
-        "title": "Brighty of the Grand Canyon",
-        "author": "Marguerite Henry",
-        "description": "A wild burro roams free in the Grand Canyon, befriends a prospector, and helps solve a mystery — based on the true story of a beloved donkey.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["nature", "adventure", "animals", "American life"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780689714856",
-        "language": "English",
-        "popularity_score": 79,
-        "page_count": 224,
-        "publication_year": 1953,
-        "publisher": "Aladdin",
-    },
-    {
-        "title": "All-of-a-Kind Family",
-        "author": "Sydney Taylor",
-        "description": "Five sisters growing up in a Jewish family on the Lower East Side of New York — their everyday adventures are full of warmth, humor, and the richness of immigrant life.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "history", "Jewish culture", "family"],
-        "time_period": "Early 20th century",
-        "region": "North America",
-        "isbn": "9780440400592",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 192,
-        "publication_year": 1951,
-        "publisher": "Yearling",
-    },
-    {
-        "title": "Snow Treasure",
-        "author": "Marie McSwigan",
-        "description": "Norwegian children use their sleds to smuggle nine million dollars in gold bullion past Nazi soldiers to a waiting ship — based on an incredible true story.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["history", "World War II", "adventure", "courage"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780142402108",
-        "language": "English",
-        "popularity_score": 79,
-        "page_count": 196,
-        "publication_year": 1942,
-        "publisher": "Puffin Books",
-    },
-    {
-        "title": "I Am David",
-        "author": "Anne Holm",
-        "description": "A boy escapes a concentration camp and walks alone across Europe toward Denmark — learning about trust, beauty, and freedom for the first time in his life.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["literature", "history", "character", "courage"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780152051600",
-        "language": "English",
-        "popularity_score": 82,
-        "page_count": 256,
-        "publication_year": 1963,
-        "publisher": "Harcourt",
-    },
-    {
-        "title": "An Island Story",
-        "author": "H.E. Marshall",
-        "description": "A literary telling of British history from Roman times to Queen Victoria — written with the warmth and narrative skill of a master storyteller, a Charlotte Mason staple.",
-        "reading_level": "intermediate",
-        "age_range": "8-14",
-        "subjects": ["history", "British history", "literature"],
-        "time_period": "Multiple eras",
-        "region": "Europe",
-        "isbn": "9781599150505",
-        "language": "English",
-        "popularity_score": 81,
-        "page_count": 562,
-        "publication_year": 1905,
-        "publisher": "Yesterday's Classics",
-    },
-    {
-        "title": "Rifles for Watie",
-        "author": "Harold Keith",
-        "description": "A sixteen-year-old Union soldier in the Civil War's western theater accidentally becomes a spy behind Confederate lines — caught between two armies and two loyalties.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["history", "Civil War", "adventure"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780064470308",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 80,
-        "page_count": 332,
-        "publication_year": 1957,
-        "publisher": "Harper Trophy",
-    },
-    {
-        "title": "I, Juan de Pareja",
-        "author": "Elizabeth Borton de Treviño",
-        "description": "The true story of Velázquez's slave, Juan de Pareja, who secretly taught himself to paint — and eventually earned his freedom and recognition as an artist in his own right.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["history", "biography", "art", "character"],
-        "time_period": "17th century",
-        "region": "Europe",
-        "isbn": "9780312380052",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 79,
-        "page_count": 192,
-        "publication_year": 1965,
-        "publisher": "Square Fish",
-    },
-    {
-        "title": "D'Aulaires' Norse Gods and Giants",
-        "author": "Ingri & Edgar Parin d'Aulaire",
-        "description": "The legends of Odin, Thor, Loki, and the other Norse gods retold with gorgeous lithograph illustrations — the companion to D'Aulaires' Greek Myths.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-12",
-        "subjects": ["mythology", "literature", "Norse", "classics"],
-        "time_period": "Ancient",
-        "region": "Europe",
-        "isbn": "9780590032513",
-        "language": "English",
-        "popularity_score": 84,
-        "page_count": 154,
-        "publication_year": 1967,
-        "publisher": "Doubleday",
-    },
-    {
-        "title": "Strawberry Girl",
-        "author": "Lois Lenski",
-        "description": "In the Florida backwoods, Birdie Boyer's family tries to grow strawberries while feuding with their rough, rowdy neighbors — a vivid slice of early 1900s rural America.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "American life", "history"],
-        "time_period": "Early 20th century",
-        "region": "North America",
-        "isbn": "9780064405850",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 76,
-        "page_count": 194,
-        "publication_year": 1945,
-        "publisher": "Harper Trophy",
-    },
-    {
-        "title": "The Saturdays",
-        "author": "Elizabeth Enright",
-        "description": "Four siblings in New York pool their allowances so one child each Saturday can have a real adventure in the city — and every outing brings surprises.",
-        "reading_level": "early-intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "family", "adventure"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780312375980",
-        "language": "English",
-        "series": "The Melendy Quartet",
-        "popularity_score": 78,
-        "page_count": 192,
-        "publication_year": 1941,
-        "publisher": "Square Fish",
-    },
-    {
-        "title": "Gone-Away Lake",
-        "author": "Elizabeth Enright",
-        "description": "Two cousins discover a forgotten summer colony around a dried-up lake — complete with crumbling houses, overgrown gardens, and two elderly residents who never left.",
-        "reading_level": "intermediate",
-        "age_range": "8-12",
-        "subjects": ["literature", "adventure", "nature"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780152022723",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 77,
-        "page_count": 256,
-        "publication_year": 1957,
-        "publisher": "Harcourt",
-    },
-    {
-        "title": "Five Children and It",
-        "author": "E. Nesbit",
-        "description": "Five siblings discover a sand fairy who grants one wish per day — but every wish goes hilariously, disastrously wrong.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "fantasy", "humor", "classics"],
-        "time_period": "Edwardian era",
-        "region": "Europe",
-        "isbn": "9780141321615",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 224,
-        "publication_year": 1902,
-        "publisher": "Puffin Classics",
-    },
-    {
-        "title": "The Velveteen Rabbit",
-        "author": "Margery Williams",
-        "description": "A stuffed rabbit longs to become Real — and learns from the Skin Horse that it only happens when a child loves you completely, even when you're worn and shabby.",
-        "reading_level": "read-aloud",
-        "age_range": "3-8",
-        "subjects": ["literature", "classics", "character"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780380002559",
-        "language": "English",
-        "popularity_score": 89,
-        "page_count": 48,
-        "publication_year": 1922,
-        "publisher": "Avon Books",
-    },
-    {
-        "title": "Winnie-the-Pooh",
-        "author": "A.A. Milne",
-        "description": "The adventures of a bear of very little brain and his friends in the Hundred Acre Wood — gentle, witty, and wise stories that have enchanted families for a century.",
-        "reading_level": "read-aloud",
-        "age_range": "3-8",
-        "subjects": ["literature", "classics", "humor"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780525444435",
-        "language": "English",
-        "popularity_score": 92,
-        "page_count": 176,
-        "publication_year": 1926,
-        "publisher": "Dutton",
-    },
-    {
-        "title": "Peter Pan",
-        "author": "J.M. Barrie",
-        "description": "The Darling children fly to Neverland with Peter Pan, where they battle Captain Hook, befriend the Lost Boys, and face the question of whether to grow up.",
-        "reading_level": "intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "fantasy", "adventure", "classics"],
-        "time_period": "Edwardian era",
-        "region": "Europe",
-        "isbn": "9780141321752",
-        "language": "English",
-        "popularity_score": 88,
-        "page_count": 240,
-        "publication_year": 1911,
-        "publisher": "Puffin Classics",
-    },
-    {
-        "title": "The Boxcar Children",
-        "author": "Gertrude Chandler Warner",
-        "description": "Four orphaned siblings make a home in an abandoned boxcar in the woods — furnishing it with creek water, cracked dishes, and pure resourcefulness.",
-        "reading_level": "early",
-        "age_range": "6-10",
-        "subjects": ["literature", "adventure", "family"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780807508527",
-        "language": "English",
-        "series": "The Boxcar Children",
-        "popularity_score": 86,
-        "page_count": 160,
-        "publication_year": 1924,
-        "publisher": "Albert Whitman",
-    },
-    {
-        "title": "Sounder",
-        "author": "William H. Armstrong",
-        "description": "A boy and his coon dog Sounder endure after the father is arrested for stealing food for his starving family — a spare, devastating story of injustice and perseverance.",
-        "reading_level": "intermediate",
-        "age_range": "10-14",
-        "subjects": ["literature", "civil rights", "character", "American life"],
-        "time_period": "19th century",
-        "region": "North America",
-        "isbn": "9780064400206",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 80,
-        "page_count": 128,
-        "publication_year": 1969,
-        "publisher": "Harper Trophy",
-    },
-    {
-        "title": "And Then What Happened, Paul Revere?",
-        "author": "Jean Fritz",
-        "description": "The real Paul Revere — a silversmith who couldn't keep a secret and left his spurs behind on the most important night in American history. History has never been this fun.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["history", "biography", "American Revolution", "humor"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780698113510",
-        "language": "English",
-        "popularity_score": 81,
-        "page_count": 48,
-        "publication_year": 1973,
-        "publisher": "Putnam",
-    },
-    {
-        "title": "Shh! We're Writing the Constitution",
-        "author": "Jean Fritz",
-        "description": "The hot, secret, argumentative summer of 1787 when fifty-five men locked themselves in a room in Philadelphia and created the Constitution of the United States.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["history", "American government", "biography"],
-        "time_period": "18th century",
-        "region": "North America",
-        "isbn": "9780698116245",
-        "language": "English",
-        "popularity_score": 80,
-        "page_count": 64,
-        "publication_year": 1987,
-        "publisher": "Putnam",
-    },
-    {
-        "title": "Crispin: The Cross of Lead",
-        "author": "Avi",
-        "description": "A thirteen-year-old serf in medieval England is falsely accused of murder and must flee — finding an unlikely protector in a giant juggler named Bear.",
-        "reading_level": "intermediate",
-        "age_range": "9-14",
-        "subjects": ["history", "medieval", "adventure", "character"],
-        "time_period": "Medieval",
-        "region": "Europe",
-        "isbn": "9780786816583",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 82,
-        "page_count": 262,
-        "publication_year": 2002,
-        "publisher": "Hyperion",
-    },
-    {
-        "title": "The Endless Steppe",
-        "author": "Esther Hautzig",
-        "description": "A Polish Jewish girl and her family are deported to Siberia during World War II — and find unexpected beauty and resilience in five years of exile on the endless Russian steppe.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["biography", "history", "World War II", "character"],
-        "time_period": "20th century",
-        "region": "Asia",
-        "isbn": "9780064405348",
-        "language": "English",
-        "awards": ["Newbery Honor"],
-        "popularity_score": 77,
-        "page_count": 256,
-        "publication_year": 1968,
-        "publisher": "Harper Trophy",
-    },
-    {
-        "title": "A Bear Called Paddington",
-        "author": "Michael Bond",
-        "description": "A small bear from Darkest Peru arrives at Paddington Station with a note reading 'Please look after this bear' — and the Brown family's life is never the same.",
-        "reading_level": "early-intermediate",
-        "age_range": "6-10",
-        "subjects": ["literature", "humor", "classics"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780062312181",
-        "language": "English",
-        "popularity_score": 87,
-        "page_count": 160,
-        "publication_year": 1958,
-        "publisher": "HarperCollins",
-    },
-    {
-        "title": "Anne Frank: The Diary of a Young Girl",
-        "author": "Anne Frank",
-        "description": "The actual diary of a thirteen-year-old Jewish girl hiding from the Nazis in an Amsterdam attic — one of the most important documents of the 20th century.",
-        "reading_level": "advanced",
-        "age_range": "10-14",
-        "subjects": ["biography", "history", "World War II", "character"],
-        "time_period": "20th century",
-        "region": "Europe",
-        "isbn": "9780553296983",
-        "language": "English",
-        "popularity_score": 94,
-        "page_count": 283,
-        "publication_year": 1947,
-        "publisher": "Bantam",
-    },
-    {
-        "title": "Ginger Pye",
-        "author": "Eleanor Estes",
-        "description": "The Pye family's smart puppy Ginger disappears — and the children turn detective in a small Connecticut town full of quirky characters and surprising clues.",
-        "reading_level": "early-intermediate",
-        "age_range": "7-12",
-        "subjects": ["literature", "mystery", "family", "humor"],
-        "time_period": "20th century",
-        "region": "North America",
-        "isbn": "9780152024994",
-        "language": "English",
-        "awards": ["Newbery Medal"],
-        "popularity_score": 76,
-        "page_count": 306,
-        "publication_year": 1951,
-        "publisher": "Harcourt",
-    },
-]
 
-SOURCES = [
-    {
-        "name": "Amazon",
-        "base_url": "https://www.amazon.com",
-        "affiliate_tag": "livingbooks-20",
-        "logo_url": "/images/sources/amazon.svg",
-    },
-    {
-        "name": "BookShop.org",
-        "base_url": "https://bookshop.org",
-        "affiliate_tag": None,
-        "logo_url": "/images/sources/bookshop.svg",
-    },
-    {
-        "name": "ThriftBooks",
-        "base_url": "https://www.thriftbooks.com",
-        "affiliate_tag": None,
-        "logo_url": "/images/sources/thriftbooks.svg",
-    },
-    {
-        "name": "AbeBooks",
-        "base_url": "https://www.abebooks.com",
-        "affiliate_tag": None,
-        "logo_url": "/images/sources/abebooks.svg",
-    },
-    {
-        "name": "Library (WorldCat)",
-        "base_url": "https://www.worldcat.org",
-        "affiliate_tag": None,
-        "logo_url": "/images/sources/library.svg",
-    },
-]
+def book_row(data: dict) -> dict:
+    """A full books row for ``data``, with an Open Library cover for books with an ISBN."""
+    row = {field: None for field in OPTIONAL_BOOK_FIELDS}
+    row.update(data)
+    if not row["cover_image_url"] and row["isbn"]:
+        row["cover_image_url"] = f"https://covers.openlibrary.org/b/isbn/{row['isbn']}-L.jpg"
+    return row
 
-CURATED_LISTS = [
-    {
-        "name": "Charlotte Mason Essentials",
-        "slug": "charlotte-mason-essentials",
-        "description": "The living books most recommended by Charlotte Mason educators — books that bring subjects alive through literary storytelling rather than dry textbooks.",
-        "category": "Philosophy",
-        "is_featured": True,
-        "book_titles": [
-            "Charlotte's Web", "The Wind in the Willows", "Pilgrim's Progress",
-            "The Handbook of Nature Study", "Understood Betsy", "Beautiful Stories from Shakespeare",
-            "Paddle-to-the-Sea", "The Burgess Bird Book for Children",
-        ],
-    },
-    {
-        "name": "First Living Books (Ages 4-7)",
-        "slug": "first-living-books",
-        "description": "The perfect starting point for young children: picture books and read-alouds that spark wonder, imagination, and a love of learning.",
-        "category": "By Age",
-        "is_featured": True,
-        "book_titles": [
-            "Blueberries for Sal", "Make Way for Ducklings", "Ox-Cart Man",
-            "Paddle-to-the-Sea", "The Burgess Bird Book for Children",
-        ],
-    },
-    {
-        "name": "Living History: Ancient World",
-        "slug": "living-history-ancient",
-        "description": "Travel back to ancient civilizations through stories that make history unforgettable — from Greek myths to biblical times.",
-        "category": "History",
-        "is_featured": True,
-        "book_titles": [
-            "The Story of the World, Volume 1: Ancient Times",
-            "D'Aulaires' Book of Greek Myths", "The Bronze Bow",
-            "The Story of Mankind",
-        ],
-    },
-    {
-        "name": "Living History: American Story",
-        "slug": "living-history-america",
-        "description": "Experience America's story through the eyes of those who lived it — from colonial days through the frontier and beyond.",
-        "category": "History",
-        "is_featured": True,
-        "book_titles": [
-            "Johnny Tremain", "Little House in the Big Woods", "Caddie Woodlawn",
-            "The Witch of Blackbird Pond", "The Matchlock Gun", "Carry On, Mr. Bowditch",
-            "This Country of Ours", "Amos Fortune, Free Man", "Little Britches: Father and I Were Ranchers",
-        ],
-    },
-    {
-        "name": "Nature Study Living Books",
-        "slug": "nature-study",
-        "description": "Books that cultivate a deep connection with the natural world — the foundation of Charlotte Mason's approach to science education.",
-        "category": "Science & Nature",
-        "is_featured": True,
-        "book_titles": [
-            "The Handbook of Nature Study", "The Burgess Bird Book for Children",
-            "Pagoo", "Rascal", "Paddle-to-the-Sea", "Minn of the Mississippi",
-            "Blueberries for Sal",
-        ],
-    },
-    {
-        "name": "Award Winners Hall of Fame",
-        "slug": "award-winners",
-        "description": "Newbery Medal and Honor winners that stand the test of time — books recognized as the finest in children's literature.",
-        "category": "Awards",
-        "is_featured": False,
-        "book_titles": [
-            "Carry On, Mr. Bowditch", "The Door in the Wall", "Island of the Blue Dolphins",
-            "Number the Stars", "A Wrinkle in Time", "Johnny Tremain",
-            "The Witch of Blackbird Pond", "The Bronze Bow", "The Wheel on the School",
-            "King of the Wind", "Caddie Woodlawn",
-        ],
-    },
-    {
-        "name": "Adventure & Courage",
-        "slug": "adventure-courage",
-        "description": "Stories of bravery, perseverance, and daring that build character and ignite the imagination.",
-        "category": "Character",
-        "is_featured": False,
-        "book_titles": [
-            "Treasure Island", "Robin Hood", "The Hobbit",
-            "Island of the Blue Dolphins", "Watership Down", "The Twenty-One Balloons",
-            "Carry On, Mr. Bowditch",
-        ],
-    },
-    {
-        "name": "World Cultures & Geography",
-        "slug": "world-cultures-geography",
-        "description": "Living books that transport readers around the globe, building understanding and empathy for diverse peoples and places.",
-        "category": "Geography",
-        "is_featured": False,
-        "book_titles": [
-            "A Child's Geography of the World", "Heidi", "The Good Master",
-            "The Wheel on the School", "The Trumpeter of Krakow",
-            "Number the Stars", "King of the Wind",
-        ],
-    },
-    {
-        "name": "Timeless Fantasy & Imagination",
-        "slug": "timeless-fantasy",
-        "description": "The greatest fantasy and imaginative literature for young readers — stories that expand the mind and nourish the soul.",
-        "category": "Literature",
-        "is_featured": False,
-        "book_titles": [
-            "The Hobbit", "The Chronicles of Narnia: The Lion, the Witch and the Wardrobe",
-            "A Wrinkle in Time", "The Wind in the Willows", "Charlotte's Web",
-            "Watership Down",
-        ],
-    },
-    {
-        "name": "Family Read-Alouds Everyone Loves",
-        "slug": "family-read-alouds",
-        "description": "The absolute best books for reading aloud together as a family — stories that captivate every age from 5 to 105.",
-        "category": "Family",
-        "is_featured": True,
-        "book_titles": [
-            "Charlotte's Web", "The Hobbit",
-            "The Chronicles of Narnia: The Lion, the Witch and the Wardrobe",
-            "Little House in the Big Woods", "Where the Red Fern Grows",
-            "Anne of Green Gables", "The Secret Garden", "The Wind in the Willows",
-        ],
-    },
-    # === NEW LISTS ===
-    {
-        "name": "Living Science: How the World Works",
-        "slug": "living-science",
-        "description": "Science told through stories, biographies, and wonder — not textbooks. These books make the natural world and human discovery irresistible.",
-        "category": "Science & Nature",
-        "is_featured": True,
-        "book_titles": [
-            "The Story of Science: Aristotle Leads the Way",
-            "Archimedes and the Door of Science", "The Mystery of the Periodic Table",
-            "Fabre's Book of Insects", "The Handbook of Nature Study",
-            "My Side of the Mountain", "The Burgess Bird Book for Children",
-        ],
-    },
-    {
-        "name": "Picture Books That Last a Lifetime",
-        "slug": "picture-books-lifetime",
-        "description": "The greatest picture books ever made — books your children will read to their children. Art, story, and meaning in perfect harmony.",
-        "category": "By Age",
-        "is_featured": True,
-        "book_titles": [
-            "Make Way for Ducklings", "Blueberries for Sal", "Madeline",
-            "The Story of Ferdinand", "Mike Mulligan and His Steam Shovel",
-            "The Little House", "Caps for Sale", "Millions of Cats", "Ox-Cart Man",
-        ],
-    },
-    {
-        "name": "Living Math: Numbers Come Alive",
-        "slug": "living-math",
-        "description": "Mathematics through story and wonder — because numbers are beautiful when you meet them as friends, not enemies.",
-        "category": "Mathematics",
-        "is_featured": False,
-        "book_titles": [
-            "The Life of Fred: Fractions", "Mathematician's Delight",
-            "Archimedes and the Door of Science", "The Phantom Tollbooth",
-            "Carry On, Mr. Bowditch",
-        ],
-    },
-    {
-        "name": "Poetry for the Whole Family",
-        "slug": "poetry-family",
-        "description": "Poetry collections that belong in every home — from nursery rhymes to Shakespeare, organized for families who want to fall in love with language.",
-        "category": "Poetry & Language",
-        "is_featured": False,
-        "book_titles": [
-            "A Child's Garden of Verses", "Favorite Poems Old and New",
-            "Hailstones and Halibut Bones",
-        ],
-    },
-    {
-        "name": "Living History: Medieval World",
-        "slug": "living-history-medieval",
-        "description": "Knights, castles, cathedrals, and the people who built them — the Middle Ages through the eyes of those who lived it.",
-        "category": "History",
-        "is_featured": False,
-        "book_titles": [
-            "The Story of the World, Volume 2: The Middle Ages",
-            "The Door in the Wall", "Adam of the Road", "Otto of the Silver Hand",
-            "Men of Iron", "Robin Hood", "The Trumpeter of Krakow",
-        ],
-    },
-    {
-        "name": "Music & Art Appreciation",
-        "slug": "music-art-appreciation",
-        "description": "Living books that open children's eyes and ears to the great artists and composers — creativity as a way of seeing the world.",
-        "category": "Arts",
-        "is_featured": False,
-        "book_titles": [
-            "Sebastian Bach, The Boy from Thuringia", "Beethoven Lives Upstairs",
-            "Getting to Know the World's Greatest Artists: Monet",
-            "Discovering Great Artists", "Hailstones and Halibut Bones",
-        ],
-    },
-    {
-        "name": "Survival & Self-Reliance",
-        "slug": "survival-self-reliance",
-        "description": "Stories of humans against nature — building shelter, finding food, and discovering what you're truly made of.",
-        "category": "Character",
-        "is_featured": False,
-        "book_titles": [
-            "My Side of the Mountain", "Island of the Blue Dolphins",
-            "Robinson Crusoe", "The Swiss Family Robinson",
-            "Little Britches: Father and I Were Ranchers", "Rascal",
-        ],
-    },
-    {
-        "name": "The Complete Story of the World",
-        "slug": "story-of-the-world-complete",
-        "description": "Susan Wise Bauer's beloved four-volume narrative history — the backbone of thousands of homeschool programs worldwide.",
-        "category": "History",
-        "is_featured": True,
-        "book_titles": [
-            "The Story of the World, Volume 1: Ancient Times",
-            "The Story of the World, Volume 2: The Middle Ages",
-            "The Story of the World, Volume 3: Early Modern Times",
-            "The Story of the World, Volume 4: The Modern Age",
-        ],
-    },
-    {
-        "name": "Christian Living Books",
-        "slug": "christian-living-books",
-        "description": "Living books rooted in the Christian faith — from Bible retellings and missionary biographies to allegories and stories of courage, forgiveness, and grace.",
-        "category": "Faith",
-        "is_featured": True,
-        "book_titles": [
-            "The Child's Story Bible", "The Jesus Storybook Bible", "Pilgrim's Progress",
-            "Dangerous Journey", "The Hiding Place", "Treasures of the Snow",
-            "The Tanglewoods' Secret", "Star of Light", "The Bronze Bow",
-            "Mere Christianity", "The Screwtape Letters", "Hinds' Feet on High Places",
-            "Trial and Triumph: Stories from Church History", "God's Smuggler",
-        ],
-    },
-    {
-        "name": "Missionary Heroes",
-        "slug": "missionary-heroes",
-        "description": "True stories of men and women who left everything behind to carry the gospel to the ends of the earth — adventure, sacrifice, and faith in action.",
-        "category": "Faith",
-        "is_featured": False,
-        "book_titles": [
-            "Through Gates of Splendor", "Shadow of the Almighty: The Life and Testament of Jim Elliot",
-            "George Müller: The Guardian of Bristol's Orphans", "Gladys Aylward: The Adventure of a Lifetime",
-            "Eric Liddell: Something Greater Than Gold", "Hudson Taylor: Deep in the Heart of China",
-            "Amy Carmichael: Rescuer of Precious Gems", "Corrie ten Boom: Keeper of the Angels' Den",
-            "William Carey: Obliged to Go", "David Livingstone: Africa's Trailblazer",
-            "God's Smuggler",
-        ],
-    },
-    {
-        "name": "World War II Through Living Books",
-        "slug": "wwii-living-books",
-        "description": "Experience the Second World War through the eyes of those who lived it — stories of courage, resistance, and the triumph of the human spirit.",
-        "category": "History",
-        "is_featured": True,
-        "book_titles": [
-            "The Hiding Place", "Number the Stars", "Snow Treasure",
-            "Anne Frank: The Diary of a Young Girl", "The Endless Steppe",
-            "I Am David", "Corrie ten Boom: Keeper of the Angels' Den",
-        ],
-    },
-    {
-        "name": "British Literature Classics",
-        "slug": "british-classics",
-        "description": "The crown jewels of English children's literature — from the Lake District to Narnia, these are the books that defined the genre.",
-        "category": "Literature",
-        "is_featured": False,
-        "book_titles": [
-            "The Wind in the Willows", "The Secret Garden", "The Railway Children",
-            "Black Beauty", "Swallows and Amazons", "The Borrowers",
-            "Treasure Island", "A Child's Garden of Verses",
-        ],
-    },
-]
+
+def book_links(book_id: int, title: str, isbn: str | None, source_map: dict) -> list[dict]:
+    """Buy/rent links for one book: Amazon, BookShop, ThriftBooks, plus WorldCat by ISBN."""
+    query = title.replace(" ", "+")
+    links = [
+        {
+            "book_id": book_id,
+            "source_id": source_map["Amazon"],
+            "url": f"https://www.amazon.com/dp/{isbn}?tag=livingbooks-20" if isbn else f"https://www.amazon.com/s?k={query}",
+            "link_type": "buy",
+            "affiliate_tag": "livingbooks-20",
+            "price_hint": "$8-15",
+        },
+        {
+            "book_id": book_id,
+            "source_id": source_map["BookShop.org"],
+            "url": f"https://bookshop.org/p/books/{isbn}" if isbn else f"https://bookshop.org/books?keywords={query}",
+            "link_type": "buy",
+            "affiliate_tag": None,
+            "price_hint": "$10-18",
+        },
+        {
+            "book_id": book_id,
+            "source_id": source_map["ThriftBooks"],
+            "url": f"https://www.thriftbooks.com/w/{title.lower().replace(' ', '-')}/",
+            "link_type": "buy",
+            "affiliate_tag": None,
+            "price_hint": "$3-8",
+        },
+    ]
+    if isbn:
+        links.append({
+            "book_id": book_id,
+            "source_id": source_map["Library (WorldCat)"],
+            "url": f"https://www.worldcat.org/isbn/{isbn}",
+            "link_type": "rent",
+            "affiliate_tag": None,
+            "price_hint": "Free",
+        })
+    return links
 
 
 async def seed():
+    async with async_session() as session:
+        if await read_seed_marker(session) == seed_version():
+            print(f"Seed data {seed_version()} already loaded. Skipping seed.")
+            return
+
+    data = load_seed_data()
+    books, sources, curated_lists = data["books"], data["sources"], data["curated_lists"]
+
     async with engine.begin() as conn:
+        # Trigram indexes on books need pg_trgm (normally enabled by migration 006)
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     async with async_session() as session:
         # Check if already fully seeded
-        from sqlalchemy import select, func, delete
         book_count = (await session.execute(select(func.count(Book.id)))).scalar() or 0
         list_count = (await session.execute(select(func.count(CuratedList.id)))).scalar() or 0
 
-        if book_count >= len(BOOKS) and list_count >= len(CURATED_LISTS):
+        if book_count >= len(books) and list_count >= len(curated_lists):
             # Update cover images if any are missing
             missing_covers = (await session.execute(
                 select(func.count(Book.id)).where(Book.cover_image_url.is_(None))
             )).scalar() or 0
             if missing_covers > 0:
                 print(f"Updating {missing_covers} books with cover images...")
-                books = (await session.execute(
+                uncovered = (await session.execute(
                     select(Book).where(Book.cover_image_url.is_(None))
                 )).scalars().all()
-                for b in books:
+                for b in uncovered:
                     if b.isbn:
                         b.cover_image_url = f"https://covers.openlibrary.org/b/isbn/{b.isbn}-L.jpg"
                 await session.commit()
                 print("Cover images updated!")
             else:
-                print(f"Database already has {book_count} books and {list_count} lists. Skipping seed.")
+                print(
+                    f"Database already has {book_count} books and {list_count} lists. "
+                    "Skipping seed."
+                )
+            await write_seed_marker(session)
             return
 
         # Clear partial data for clean re-seed
         if book_count > 0 or list_count > 0:
-            print(f"Found partial data ({book_count} books, {list_count} lists). Clearing for clean seed...")
+            print(
+                f"Found partial data ({book_count} books, {list_count} lists). "
+                "Clearing for clean seed..."
+            )
             await session.execute(delete(ListItem))
             await session.execute(delete(CuratedList))
             await session.execute(delete(BookLink))
@@ -3154,113 +217,66 @@ async def seed():
             await session.commit()
             print("Cleared partial data.")
 
-        # Insert books (deduplicate by title)
-        book_map = {}
-        seen_titles = set()
-        skipped = 0
-        for data in BOOKS:
-            if data["title"] in seen_titles:
-                skipped += 1
-                continue
-            seen_titles.add(data["title"])
-            book_data = dict(data)
-            if not book_data.get("cover_image_url") and book_data.get("isbn"):
-                book_data["cover_image_url"] = f"https://covers.openlibrary.org/b/isbn/{book_data['isbn']}-L.jpg"
-            book = Book(**book_data)
-            session.add(book)
-            await session.flush()
-            book_map[data["title"]] = book.id
-        print(f"Inserted {len(seen_titles)} books ({skipped} duplicates skipped).")
+        # Insert books (deduplicate by title) with one multi-row INSERT ... RETURNING
+        books_by_title = {}
+        for data in books:
+            books_by_title.setdefault(data["title"], data)
+        book_rows = [book_row(data) for data in books_by_title.values()]
+        book_map = await insert_returning(session, Book, book_rows, "title")
+        skipped = len(books) - len(book_map)
+        print(f"Inserted {len(book_map)} books ({skipped} duplicates skipped).")
 
-        # Insert sources
-        source_map = {}
-        for data in SOURCES:
-            source = Source(**data)
-            session.add(source)
-            await session.flush()
-            source_map[data["name"]] = source.id
-        print(f"Inserted {len(SOURCES)} sources.")
+        source_map = await insert_returning(session, Source, sources, "name")
+        print(f"Inserted {len(sources)} sources.")
 
-        # Create links for each book to Amazon and BookShop
-        link_count = 0
-        amazon_id = source_map["Amazon"]
-        bookshop_id = source_map["BookShop.org"]
-        thrift_id = source_map["ThriftBooks"]
-        library_id = source_map["Library (WorldCat)"]
+        # Links are built from the in-memory title map, then inserted in one batch
+        link_rows = [
+            link
+            for title, book_id in book_map.items()
+            for link in book_links(book_id, title, books_by_title[title].get("isbn"), source_map)
+        ]
+        await session.execute(insert(BookLink), link_rows)
+        print(f"Created {len(link_rows)} book links.")
 
-        for title, book_id in book_map.items():
-            book_data = next(b for b in BOOKS if b["title"] == title)
-            isbn = book_data.get("isbn", "")
-
-            # Amazon link
-            session.add(BookLink(
-                book_id=book_id,
-                source_id=amazon_id,
-                url=f"https://www.amazon.com/dp/{isbn}?tag=livingbooks-20" if isbn else f"https://www.amazon.com/s?k={title.replace(' ', '+')}",
-                link_type="buy",
-                affiliate_tag="livingbooks-20",
-                price_hint="$8-15",
-            ))
-            link_count += 1
-
-            # Bookshop link
-            session.add(BookLink(
-                book_id=book_id,
-                source_id=bookshop_id,
-                url=f"https://bookshop.org/p/books/{isbn}" if isbn else f"https://bookshop.org/books?keywords={title.replace(' ', '+')}",
-                link_type="buy",
-                price_hint="$10-18",
-            ))
-            link_count += 1
-
-            # ThriftBooks link
-            session.add(BookLink(
-                book_id=book_id,
-                source_id=thrift_id,
-                url=f"https://www.thriftbooks.com/w/{title.lower().replace(' ', '-')}/",
-                link_type="buy",
-                price_hint="$3-8",
-            ))
-            link_count += 1
-
-            # Library link
-            if isbn:
-                session.add(BookLink(
-                    book_id=book_id,
-                    source_id=library_id,
-                    url=f"https://www.worldcat.org/isbn/{isbn}",
-                    link_type="rent",
-                    price_hint="Free",
-                ))
-                link_count += 1
-
-        print(f"Created {link_count} book links.")
-
-        # Create curated lists
-        for lst_data in CURATED_LISTS:
-            book_titles = lst_data.pop("book_titles")
-            lst = CuratedList(**lst_data)
-            session.add(lst)
-            await session.flush()
-
-            for rank, bt in enumerate(book_titles, start=1):
-                if bt in book_map:
-                    session.add(ListItem(
-                        list_id=lst.id,
-                        book_id=book_map[bt],
-                        rank=rank,
-                    ))
-            await session.flush()
+        list_rows = [
+            {k: v for k, v in lst.items() if k != "book_titles"} for lst in curated_lists
+        ]
+        list_map = await insert_returning(session, CuratedList, list_rows, "slug")
+        item_rows = [
+            {"list_id": list_map[lst["slug"]], "book_id": book_map[title], "rank": rank}
+            for lst in curated_lists
+            for rank, title in enumerate(lst["book_titles"], start=1)
+            if title in book_map
+        ]
+        await session.execute(insert(ListItem), item_rows)
+        print(f"Created {len(curated_lists)} curated lists.")
+        await session.commit()
 
-        print(f"Created {len(CURATED_LISTS)} curated lists.")
+        related_rows = await rebuild_related_books(session)
         await session.commit()
+        print(f"Precomputed {related_rows} related-book links.")
+        await write_seed_marker(session)
+        await catalog_events.catalog_reloaded()
         print("Seed complete!")
 
 
 if __name__ == "__main__":
+    import argparse
     import traceback
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--synthetic", type=int, metavar="N", help="append N synthetic books and activity"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed for --synthetic")
+    args = parser.parse_args()
     try:
-        asyncio.run(seed())
+        if args.synthetic:
+            from scripts.synthetic import seed_synthetic
+
+            asyncio.run(seed_synthetic(args.synthetic, args.seed))
+        else:
+            asyncio.run(seed())
     except Exception:
         traceback.print_exc()
         sys.exit(1)
@@ -0,0 +1,538 @@
+"""
+Synthetic data for load and benchmark testing: N books with links and curated
+lists, plus users, children, reading plans, reviews, subscribers and click
+events, all bulk-loaded with COPY.
+
+Field distributions (subjects, age ranges, reading levels, periods, regions)
+are sampled from the hand-written seed catalog, so filters and facets behave
+as they do in production, just at scale. Activity is skewed toward popular
+books and clustered by subject, so related/also-planned rebuilds see realistic
+co-occurrence. Output is deterministic for a given ``--seed`` and ``--as-of``.
+
+Usage:
+    cd backend
+    python -m scripts.synthetic --books 100000 --users 10000
+    python -m scripts.seed --synthetic 100000   # same, with default ratios
+"""
+
+import asyncio
+import bisect
+import datetime
+import itertools
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import select
+
+from app.core.database import async_session
+from app.models.book import Book, BookLink, Source
+from app.models.child import Child
+from app.models.click_event import ClickEvent
+from app.models.list import CuratedList, ListItem
+from app.models.reading_plan import ReadingPlan, ReadingPlanItem
+from app.models.review import BookReview
+from app.models.subscriber import EmailSubscriber
+from app.models.user import User
+from app.services import catalog_events
+from scripts.bulk_load import copy_rows, insert_returning, release_ids, reserve_ids
+
+BOOK_COLUMNS = (
+    "id", "title", "author", "description", "reading_level", "age_range", "subjects",
+    "time_period", "region", "isbn", "cover_image_url", "language", "series", "awards",
+    "popularity_score", "page_count", "publication_year", "publisher",
+)
+LINK_COLUMNS = ("book_id", "source_id", "url", "link_type", "affiliate_tag", "price_hint")
+ITEM_COLUMNS = ("list_id", "book_id", "rank")
+USER_COLUMNS = (
+    "id", "email", "name", "subscription_tier", "subscription_active", "created_at", "updated_at",
+)
+CHILD_COLUMNS = (
+    "id", "user_id", "name", "birth_year", "grade_level", "interests", "reading_level",
+)
+PLAN_COLUMNS = (
+    "id", "user_id", "child_id", "name", "description", "is_ai_generated",
+    "created_at", "updated_at",
+)
+PLAN_ITEM_COLUMNS = ("plan_id", "book_id", "week_number", "order_in_week", "status")
+REVIEW_COLUMNS = (
+    "user_id", "book_id", "rating", "review_text", "child_age_when_read", "created_at",
+)
+SUBSCRIBER_COLUMNS = (
+    "id", "email", "name", "signup_source", "utm_source", "created_at", "unsubscribed_at",
+)
+CLICK_COLUMNS = ("book_id", "link_id", "source_name", "referrer", "session_id", "created_at")
+
+BOOKS_PER_LIST = 500
+BOOKS_PER_AUTHOR = 8
+BOOKS_PER_USER = 10
+SUBSCRIBERS_PER_USER = 3
+CLICKS_PER_USER = 25
+PREMIUM_SHARE = 0.15
+CHILDREN_PER_USER_WEIGHTS = (25, 30, 25, 15, 5)  # 0..4 children
+PLANS_PER_USER_WEIGHTS = (40, 35, 15, 10)  # 0..3 plans
+HISTORY_DAYS = 365
+CLICK_HISTORY_DAYS = 90
+
+_ADJECTIVES = (
+    "Brave", "Little", "Golden", "Hidden", "Silent", "Wandering", "Lost", "Bright",
+    "Ancient", "Secret", "Faithful", "Wild", "Last", "Great", "Quiet", "Far",
+)
+_NOUNS = (
+    "River", "Lighthouse", "Garden", "Mountain", "Voyage", "Kingdom", "Meadow", "Harbor",
+    "Forest", "Island", "Bridge", "Prairie", "Castle", "Compass", "Lantern", "Orchard",
+)
+_FIRST_NAMES = (
+    "Anna", "James", "Clara", "Thomas", "Ruth", "William", "Elsie", "Henry", "Grace",
+    "Samuel", "Laura", "Arthur", "Edith", "Walter", "Mary", "George",
+)
+_LAST_NAMES = (
+    "Whitfield", "Carver", "Holloway", "Pemberton", "Ashby", "Lindqvist", "Marsh",
+    "Fairbanks", "Thornton", "Okafor", "Delacroix", "Brennan", "Castellanos", "Hale",
+)
+_GRADES = (
+    "Pre-K", "K", "1st", "2nd", "3rd", "4th", "5th", "6th", "7th", "8th", "9th", "10th",
+    "11th", "12th",
+)
+_PLAN_STATUSES = ("to-read", "reading", "completed")
+_SIGNUP_SOURCES = ("footer", "lead_magnet", "book_detail", "blog")
+_PUBLISHERS = (
+    "Houghton Mifflin", "Harper & Brothers", "Scribner", "Puffin", "Macmillan",
+    "Dover", "Yesterday's Classics", "Beautiful Feet Books",
+)
+
+
+@dataclass
+class Distribution:
+    """Weighted choices drawn from observed counts."""
+
+    values: list
+    cum_weights: list
+
+    @classmethod
+    def of(cls, counts: Counter) -> "Distribution":
+        values, weights = zip(*counts.most_common()) if counts else ((None,), (1,))
+        return cls(list(values), list(itertools.accumulate(weights)))
+
+    def pick(self, rng: random.Random):
+        return self.values[bisect.bisect(self.cum_weights, rng.random() * self.cum_weights[-1])]
+
+    def sample(self, rng: random.Random, k: int) -> list:
+        picked = []
+        while len(picked) < min(k, len(self.values)):
+            value = self.pick(rng)
+            if value not in picked:
+                picked.append(value)
+        return picked
+
+
+def _reference_distributions() -> dict[str, Distribution]:
+    from scripts.seed import load_seed_data
+
+    books = load_seed_data()["books"]
+
+    def counts(field):
+        return Counter(b.get(field) for b in books)
+
+    return {
+        "subjects": Distribution.of(Counter(s for b in books for s in b["subjects"])),
+        "subject_count": Distribution.of(Counter(len(b["subjects"]) for b in books)),
+        "age_range": Distribution.of(counts("age_range")),
+        "reading_level": Distribution.of(counts("reading_level")),
+        "time_period": Distribution.of(counts("time_period")),
+        "region": Distribution.of(counts("region")),
+        "awards": Distribution.of(Counter(a for b in books for a in b.get("awards") or [])),
+    }
+
+
+def synthetic_isbn(book_id: int) -> str:
+    """A valid ISBN-13 in the 979 prefix (unused by the seed data), unique per id."""
+    digits = f"979{book_id:09d}"
+    check = (10 - sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(digits)) % 10) % 10
+    return digits + str(check)
+
+
+def generate_books(first_id: int, count: int, rng: random.Random) -> list[tuple]:
+    """``count`` book records in BOOK_COLUMNS order, with ids from ``first_id``."""
+    dist = _reference_distributions()
+    authors = [
+        f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        for _ in range(max(1, count // BOOKS_PER_AUTHOR))
+    ]
+    records = []
+    for book_id in range(first_id, first_id + count):
+        isbn = synthetic_isbn(book_id)
+        # Popularity is long-tailed, like real demand
+        popularity = round(min(100.0, rng.paretovariate(1.5) * 10), 1)
+        records.append((
+            book_id,
+            f"The {rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} {book_id}",
+            # Skewed toward the first authors, so a few are prolific
+            authors[int(len(authors) * rng.random() ** 3)],
+            f"A living book about the {rng.choice(_NOUNS).lower()} and the people who loved it.",
+            dist["reading_level"].pick(rng),
+            dist["age_range"].pick(rng),
+            dist["subjects"].sample(rng, dist["subject_count"].pick(rng)),
+            dist["time_period"].pick(rng),
+            dist["region"].pick(rng),
+            isbn,
+            f"https://covers.openlibrary.org/b/isbn/{isbn}-L.jpg",
+            "English",
+            None,
+            [dist["awards"].pick(rng)] if rng.random() < 0.15 else None,
+            popularity,
+            rng.randint(32, 480),
+            rng.randint(1850, 2020),
+            rng.choice(_PUBLISHERS),
+        ))
+    return records
+
+
+def generate_lists(book_ids: list[int], rng: random.Random) -> tuple[list[dict], list[list[int]]]:
+    """Curated lists (one per BOOKS_PER_LIST books) and each list's book ids in rank order."""
+    lists, members = [], []
+    for n in range(max(1, len(book_ids) // BOOKS_PER_LIST)):
+        lists.append({
+            "name": f"Synthetic List {n + 1}",
+            "slug": f"synthetic-list-{book_ids[0]}-{n + 1}",
+            "description": "Generated for load testing.",
+            "category": "Synthetic",
+            "is_featured": False,
+        })
+        members.append(rng.sample(book_ids, min(len(book_ids), rng.randint(10, 50))))
+    return lists, members
+
+
+class BookSampler:
+    """Draws book ids weighted by popularity, overall or within one subject."""
+
+    def __init__(self, books: list[tuple], seed: int):
+        self.rng = np.random.default_rng(seed)
+        popularity_at = BOOK_COLUMNS.index("popularity_score")
+        subjects_at = BOOK_COLUMNS.index("subjects")
+        self.ids = np.array([b[0] for b in books], dtype=np.int64)
+        # +1 so zero-popularity books can still be drawn
+        weights = np.array([b[popularity_at] for b in books], dtype=np.float64) + 1.0
+        self.cum_weights = np.cumsum(weights)
+        positions = defaultdict(list)
+        for i, book in enumerate(books):
+            for subject in book[subjects_at]:
+                positions[subject].append(i)
+        self.by_subject = {
+            subject: (self.ids[idx], np.cumsum(weights[idx]))
+            for subject, idx in ((k, np.array(v)) for k, v in positions.items())
+        }
+        self.subjects = Distribution.of(Counter({k: len(v) for k, v in positions.items()}))
+
+    def _draw(self, ids: np.ndarray, cum_weights: np.ndarray, n: int) -> list[int]:
+        picks = np.searchsorted(cum_weights, self.rng.random(n) * cum_weights[-1], side="right")
+        # Distinct ids, first draw first
+        return list(dict.fromkeys(ids[picks].tolist()))
+
+    def pick_subject(self, rng: random.Random) -> str:
+        """A subject, weighted by how many books have it."""
+        return self.subjects.pick(rng)
+
+    def popular(self, n: int) -> list[int]:
+        return self._draw(self.ids, self.cum_weights, n)
+
+    def in_subject(self, subject: str, n: int) -> list[int]:
+        if subject not in self.by_subject:
+            return self.popular(n)
+        ids, cum_weights = self.by_subject[subject]
+        return self._draw(ids, cum_weights, n)
+
+
+def _days_ago(rng: random.Random, as_of: datetime.datetime, days: int) -> datetime.datetime:
+    return as_of - datetime.timedelta(seconds=rng.randrange(days * 86400))
+
+
+def generate_users(
+    first_id: int, count: int, rng: random.Random, as_of: datetime.datetime
+) -> list[tuple]:
+    """User records in USER_COLUMNS order; a PREMIUM_SHARE of them are subscribed."""
+    records = []
+    for user_id in range(first_id, first_id + count):
+        premium = rng.random() < PREMIUM_SHARE
+        joined = _days_ago(rng, as_of, HISTORY_DAYS)
+        records.append((
+            user_id,
+            f"synthetic-user-{user_id}@example.com",
+            f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+            "premium" if premium else "free",
+            premium,
+            joined,
+            joined,
+        ))
+    return records
+
+
+def generate_children(
+    first_id: int, user_ids: list[int], sampler: BookSampler, rng: random.Random,
+    as_of: datetime.datetime,
+) -> list[tuple]:
+    """0-4 children per user, in CHILD_COLUMNS order, with subject interests."""
+    dist = _reference_distributions()
+    records, child_id = [], first_id
+    for user_id in user_ids:
+        for _ in range(rng.choices(range(5), CHILDREN_PER_USER_WEIGHTS)[0]):
+            age = rng.randint(4, 16)
+            records.append((
+                child_id,
+                user_id,
+                rng.choice(_FIRST_NAMES),
+                as_of.year - age,
+                _GRADES[min(len(_GRADES) - 1, max(0, age - 4))],
+                sampler.subjects.sample(rng, rng.randint(1, 3)),
+                dist["reading_level"].pick(rng),
+            ))
+            child_id += 1
+    return records
+
+
+def generate_plans(
+    first_id: int, user_ids: list[int], children: list[tuple], sampler: BookSampler,
+    rng: random.Random, as_of: datetime.datetime,
+) -> tuple[list[tuple], list[tuple]]:
+    """Reading plans (PLAN_COLUMNS) and their items (PLAN_ITEM_COLUMNS).
+
+    Each plan follows one subject, taken from its child's interests when it has
+    a child, so books that share plans also share subjects.
+    """
+    kids = defaultdict(list)
+    for child in children:
+        kids[child[1]].append(child)
+    plans, items, plan_id = [], [], first_id
+    for user_id in user_ids:
+        for _ in range(rng.choices(range(4), PLANS_PER_USER_WEIGHTS)[0]):
+            child = rng.choice(kids[user_id]) if kids[user_id] and rng.random() < 0.8 else None
+            subject = rng.choice(child[5]) if child else sampler.pick_subject(rng)
+            created = _days_ago(rng, as_of, HISTORY_DAYS)
+            plans.append((
+                plan_id,
+                user_id,
+                child[0] if child else None,
+                f"{subject.title()} for {child[2] if child else 'the family'}",
+                None,
+                rng.random() < 0.3,
+                created,
+                created,
+            ))
+            for n, book_id in enumerate(sampler.in_subject(subject, rng.randint(6, 30))):
+                status = rng.choices(_PLAN_STATUSES, (60, 15, 25))[0]
+                items.append((plan_id, book_id, n // 3 + 1, n % 3, status))
+            plan_id += 1
+    return plans, items
+
+
+def generate_reviews(
+    user_ids: list[int], sampler: BookSampler, rng: random.Random, as_of: datetime.datetime
+) -> list[tuple]:
+    """Reviews in REVIEW_COLUMNS order: most users write none, a few write many."""
+    records = []
+    for user_id in user_ids:
+        count = min(50, int(rng.paretovariate(1.3)) - 1)
+        for book_id in sampler.popular(count) if count else ():
+            records.append((
+                user_id,
+                book_id,
+                rng.choices(range(1, 6), (2, 3, 10, 30, 55))[0],
+                "A lovely living book." if rng.random() < 0.4 else None,
+                rng.randint(4, 16) if rng.random() < 0.5 else None,
+                _days_ago(rng, as_of, HISTORY_DAYS),
+            ))
+    return records
+
+
+def generate_subscribers(
+    first_id: int, count: int, rng: random.Random, as_of: datetime.datetime
+) -> list[tuple]:
+    """Newsletter subscribers in SUBSCRIBER_COLUMNS order (naive UTC timestamps)."""
+    naive = as_of.replace(tzinfo=None)
+    records = []
+    for subscriber_id in range(first_id, first_id + count):
+        joined = _days_ago(rng, naive, HISTORY_DAYS)
+        records.append((
+            subscriber_id,
+            f"synthetic-subscriber-{subscriber_id}@example.com",
+            rng.choice(_FIRST_NAMES) if rng.random() < 0.6 else None,
+            rng.choices(_SIGNUP_SOURCES, (40, 25, 20, 15))[0],
+            rng.choice(("google", "pinterest", "instagram", None)),
+            joined,
+            joined + datetime.timedelta(days=rng.randint(1, 90)) if rng.random() < 0.08 else None,
+        ))
+    return records
+
+
+def generate_clicks(
+    count: int, sampler: BookSampler, source_names: list[str], rng: random.Random,
+    as_of: datetime.datetime,
+) -> list[tuple]:
+    """About ``count`` affiliate clicks in CLICK_COLUMNS order, grouped into browsing
+    sessions of 1-8 clicks within one subject (naive UTC timestamps)."""
+    naive = as_of.replace(tzinfo=None)
+    records = []
+    while len(records) < count:
+        session_id = f"{rng.getrandbits(128):032x}"
+        started = _days_ago(rng, naive, CLICK_HISTORY_DAYS)
+        subject = sampler.pick_subject(rng)
+        for n, book_id in enumerate(sampler.in_subject(subject, rng.randint(1, 8))):
+            records.append((
+                book_id,
+                None,
+                rng.choice(source_names),
+                rng.choice(("/books", "/lists", "/search", None)),
+                session_id,
+                started + datetime.timedelta(minutes=2 * n),
+            ))
+    return records[:count]
+
+
+@dataclass
+class SyntheticScale:
+    books: int
+    users: int | None = None
+
+    def __post_init__(self):
+        if self.users is None:
+            self.users = max(1, self.books // BOOKS_PER_USER)
+
+    @property
+    def subscribers(self) -> int:
+        return self.users * SUBSCRIBERS_PER_USER
+
+    @property
+    def clicks(self) -> int:
+        return self.users * CLICKS_PER_USER
+
+
+async def _load_catalog(session, count: int, rng: random.Random) -> tuple[list[tuple], dict]:
+    """COPY ``count`` books with their links and lists; returns (books, source ids by name)."""
+    from scripts.seed import book_links, load_seed_data
+
+    source_map = dict((await session.execute(select(Source.name, Source.id))).all())
+    missing = [s for s in load_seed_data()["sources"] if s["name"] not in source_map]
+    source_map.update(await insert_returning(session, Source, missing, "name"))
+
+    first_id = await reserve_ids(session, Book.__table__, count)
+    books = generate_books(first_id, count, rng)
+    await copy_rows(session, Book.__table__, BOOK_COLUMNS, books)
+    print(f"Copied {count} books.")
+
+    title_at, isbn_at = BOOK_COLUMNS.index("title"), BOOK_COLUMNS.index("isbn")
+    links = await copy_rows(
+        session,
+        BookLink.__table__,
+        LINK_COLUMNS,
+        (
+            tuple(link[c] for c in LINK_COLUMNS)
+            for book in books
+            for link in book_links(book[0], book[title_at], book[isbn_at], source_map)
+        ),
+    )
+    print(f"Copied {links} book links.")
+
+    list_rows, members = generate_lists([book[0] for book in books], rng)
+    list_map = await insert_returning(session, CuratedList, list_rows, "slug")
+    items = await copy_rows(
+        session,
+        ListItem.__table__,
+        ITEM_COLUMNS,
+        (
+            (list_map[lst["slug"]], book_id, rank)
+            for lst, ids in zip(list_rows, members)
+            for rank, book_id in enumerate(ids, start=1)
+        ),
+    )
+    print(f"Created {len(list_rows)} lists with {items} items.")
+    return books, source_map
+
+
+async def _load_activity(
+    session, scale: SyntheticScale, sampler: BookSampler, source_names: list[str],
+    rng: random.Random, as_of: datetime.datetime,
+) -> None:
+    first_user = await reserve_ids(session, User.__table__, scale.users)
+    users = generate_users(first_user, scale.users, rng, as_of)
+    await copy_rows(session, User.__table__, USER_COLUMNS, users)
+    user_ids = [user[0] for user in users]
+    print(f"Copied {len(users)} users.")
+
+    # Children need ids before plans can point at them; reserve generously, then
+    # hand back the unused tail so the sequence stays close to max(id)
+    first_child = await reserve_ids(session, Child.__table__, scale.users * 4)
+    children = generate_children(first_child, user_ids, sampler, rng, as_of)
+    await copy_rows(session, Child.__table__, CHILD_COLUMNS, children)
+    await release_ids(session, Child.__table__, first_child + len(children) - 1)
+    print(f"Copied {len(children)} children.")
+
+    first_plan = await reserve_ids(session, ReadingPlan.__table__, scale.users * 3)
+    plans, items = generate_plans(first_plan, user_ids, children, sampler, rng, as_of)
+    await copy_rows(session, ReadingPlan.__table__, PLAN_COLUMNS, plans)
+    await copy_rows(session, ReadingPlanItem.__table__, PLAN_ITEM_COLUMNS, items)
+    await release_ids(session, ReadingPlan.__table__, first_plan + len(plans) - 1)
+    print(f"Copied {len(plans)} reading plans with {len(items)} items.")
+
+    reviews = await copy_rows(
+        session, BookReview.__table__, REVIEW_COLUMNS,
+        generate_reviews(user_ids, sampler, rng, as_of),
+    )
+    print(f"Copied {reviews} reviews.")
+
+    first_subscriber = await reserve_ids(session, EmailSubscriber.__table__, scale.subscribers)
+    subscribers = await copy_rows(
+        session, EmailSubscriber.__table__, SUBSCRIBER_COLUMNS,
+        generate_subscribers(first_subscriber, scale.subscribers, rng, as_of),
+    )
+    print(f"Copied {subscribers} subscribers.")
+
+    clicks = await copy_rows(
+        session, ClickEvent.__table__, CLICK_COLUMNS,
+        generate_clicks(scale.clicks, sampler, source_names, rng, as_of),
+    )
+    print(f"Copied {clicks} click events.")
+
+
+async def load_synthetic(
+    scale: SyntheticScale, seed: int = 0, as_of: datetime.datetime | None = None
+) -> None:
+    """Append a synthetic catalog and user activity of the given ``scale``."""
+    as_of = as_of or datetime.datetime.now(datetime.UTC).replace(microsecond=0)
+    rng = random.Random(seed)
+    started = time.monotonic()
+    async with async_session() as session:
+        books, source_map = await _load_catalog(session, scale.books, rng)
+        await session.commit()
+        if scale.users:
+            sampler = BookSampler(books, seed)
+            await _load_activity(session, scale, sampler, sorted(source_map), rng, as_of)
+            await session.commit()
+
+    await catalog_events.catalog_reloaded()
+    print(f"Synthetic data loaded in {time.monotonic() - started:.1f}s.")
+
+
+async def seed_synthetic(count: int, seed: int = 0) -> None:
+    """Append ``count`` synthetic books plus activity at the default ratios."""
+    await load_synthetic(SyntheticScale(books=count), seed)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bulk-load deterministic synthetic data.")
+    parser.add_argument("--books", type=int, default=100_000)
+    parser.add_argument("--users", type=int, help=f"default: books / {BOOKS_PER_USER}")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--as-of",
+        type=datetime.datetime.fromisoformat,
+        help="timestamp activity is generated relative to (default: now)",
+    )
+    args = parser.parse_args()
+    as_of = args.as_of
+    if as_of is not None and as_of.tzinfo is None:
+        as_of = as_of.replace(tzinfo=datetime.UTC)
+    asyncio.run(load_synthetic(SyntheticScale(args.books, args.users), args.seed, as_of))
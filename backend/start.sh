@@ -14,4 +14,6 @@ python -m scripts.seed 2>&1 || {
 }
 
 echo "=== Starting uvicorn ==="
+# Seeding ran above, so workers skip the startup seed check
+export STARTUP_SEED="${STARTUP_SEED:-skip}"
 exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-10000}"
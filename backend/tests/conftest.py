@@ -1,5 +1,6 @@
 """Shared test fixtures for the Living Books Hub API."""
 
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 import datetime
 
@@ -7,7 +8,10 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
-from app.core.database import get_db
+from app.core.database import get_db, track_queries
+
+# AsyncSession methods that each send one statement
+_QUERY_METHODS = ("execute", "scalar", "scalars", "get", "stream", "stream_scalars")
 
 
 def make_mock_book(**overrides):
@@ -158,6 +162,32 @@ class MockResult:
     def scalar_one_or_none(self):
         return self._items[0] if self._items else None
 
+    def one(self):
+        return self._items[0]
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Clear in-process caches so results never leak between tests."""
+    from app.api import books
+    from app.core.rate_limit import librarian_limiter
+    from app.core.response_cache import MemoryBackend, response_cache
+    from app.services.catalog_context import catalog_context
+    from app.services.catalog_index import catalog_index
+    from app.services.facets import facet_cache
+    from app.services.librarian_cache import librarian_cache
+    from app.services.retrieval import book_retriever
+
+    books._count_cache.clear()
+    response_cache.backend = MemoryBackend(ttl_seconds=60, max_entries=256)
+    facet_cache.invalidate()
+    catalog_index.invalidate()
+    catalog_context.invalidate()
+    librarian_cache.clear()
+    book_retriever.invalidate()
+    librarian_limiter._requests.clear()
+    yield
+
 
 @pytest.fixture
 def mock_db():
@@ -186,6 +216,31 @@ def mock_db():
     return session
 
 
+@pytest.fixture
+def query_budget(mock_db):
+    """Assert a block issues at most ``limit`` SQL statements.
+
+        with query_budget(1):
+            await client.get("/api/v1/lists")
+
+    Counts statements sent through the engine plus calls on ``mock_db`` (with
+    the mock, eager loads that a real engine would run separately aren't seen).
+    """
+
+    def mock_calls():
+        return sum(getattr(mock_db, method).await_count for method in _QUERY_METHODS)
+
+    @contextmanager
+    def budget(limit: int):
+        before = mock_calls()
+        with track_queries() as stats:
+            yield stats
+        used = stats.count + mock_calls() - before
+        assert used <= limit, f"{used} queries issued, budget is {limit}"
+
+    return budget
+
+
 @pytest.fixture
 async def client(mock_db):
     """Async test client with mocked database."""
@@ -155,20 +155,90 @@ async def test_csv_import_no_auth(client):
 
 
 @pytest.mark.asyncio
-async def test_csv_import_success(client, mock_db, admin_headers):
-    """POST /api/v1/admin/books/import-csv imports books from CSV."""
-    mock_db.flush = pytest.importorskip("unittest.mock").AsyncMock()
+async def test_csv_import_success(client, mock_db, admin_headers, tmp_path):
+    """POST /api/v1/admin/books/import-csv spools the upload and queues a job."""
+    mock = pytest.importorskip("unittest.mock")
     csv_content = (
         "title,author,description,age_range,subjects,language,popularity_score\n"
         "Test Book,Test Author,A test desc,6-10,nature|science,English,50\n"
         "Book Two,Author Two,Another desc,8-12,history,English,30\n"
     )
-    resp = await client.post(
-        "/api/v1/admin/books/import-csv",
-        headers=admin_headers,
-        files={"file": ("books.csv", io.BytesIO(csv_content.encode()), "text/csv")},
+    added = []
+    mock_db.add = mock.MagicMock(side_effect=added.append)
+
+    async def assign_id():
+        added[0].id = 7
+
+    mock_db.flush = mock.AsyncMock(side_effect=assign_id)
+    run = mock.AsyncMock()
+    with (
+        mock.patch("app.services.import_jobs.settings.import_spool_dir", str(tmp_path)),
+        mock.patch("app.services.import_jobs.run_import_job", run),
+    ):
+        resp = await client.post(
+            "/api/v1/admin/books/import-csv",
+            headers=admin_headers,
+            files={"file": ("books.csv", io.BytesIO(csv_content.encode()), "text/csv")},
+        )
+    assert resp.status_code == 202
+    assert resp.json() == {"job_id": 7, "status": "queued"}
+    run.assert_awaited_once_with(7)
+    job = added[0]
+    assert job.filename == "books.csv"
+    assert job.file_size == len(csv_content)
+    with open(job.file_path) as f:
+        assert f.read() == csv_content
+
+
+@pytest.mark.asyncio
+async def test_get_import_job(client, mock_db, admin_headers):
+    """GET /api/v1/admin/import-jobs/{id} reports progress; 404 when unknown."""
+    mock = pytest.importorskip("unittest.mock")
+    import datetime
+
+    job = mock.MagicMock(
+        id=3, status="running", filename="books.csv", file_size=120, rows=5000,
+        created_count=4000, updated_count=990, error_count=10,
+        errors=[{"row": 12, "error": "missing required column(s): title"}],
+        error_message=None, cancel_requested=False,
+        created_at=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+        started_at=None, finished_at=None,
     )
+    mock_db.get = mock.AsyncMock(side_effect=[job, None])
+    resp = await client.get("/api/v1/admin/import-jobs/3", headers=admin_headers)
     assert resp.status_code == 200
+    assert resp.json()["rows"] == 5000
+    assert resp.json()["errors"][0]["row"] == 12
+
+    resp = await client.get("/api/v1/admin/import-jobs/4", headers=admin_headers)
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_book_updates_facet_cache(client, mock_db, admin_headers):
+    """POST /api/v1/admin/books patches cached facet counts without a reload."""
+    mock = pytest.importorskip("unittest.mock")
+    mock_db.execute = mock.AsyncMock(
+        return_value=MockResult(items=[("books", None, 1), ("subjects", "nature", 1)])
+    )
+    await client.get("/api/v1/books/filters")
+
+    with mock.patch("app.services.related.refresh_related_for", mock.AsyncMock()):
+        await client.post(
+            "/api/v1/admin/books",
+            headers=admin_headers,
+            json={
+                "title": "Pagoo",
+                "author": "Holling C. Holling",
+                "description": "A hermit crab's life in a tide pool.",
+                "age_range": "8-12",
+                "subjects": ["nature", "science"],
+                "time_period": "20th century",
+            },
+        )
+    resp = await client.get("/api/v1/books/filters")
     data = resp.json()
-    assert data["created"] == 2
-    assert data["errors"] == []
+    assert data["subjects"] == ["nature", "science"]
+    assert data["age_ranges"] == ["8-12"]
+    assert data["time_periods"] == ["20th century"]
+    assert mock_db.execute.await_count == 1
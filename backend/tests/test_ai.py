@@ -0,0 +1,98 @@
+"""Tests for the async Groq wrapper: shared client, timeouts and the concurrency limit."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.services import ai
+
+
+class FakeCompletions:
+    """Stands in for ``AsyncGroq.chat.completions``; each call sleeps ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0, content: str = "Try Paddle-to-the-Sea."):
+        self.delay = delay
+        self.content = content
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def groq(monkeypatch):
+    completions = FakeCompletions()
+    client = MagicMock()
+    client.chat.completions = completions
+    monkeypatch.setattr(ai, "_client", client)
+    monkeypatch.setattr(ai, "_limiter", None)
+    with patch.object(settings, "groq_enabled", True), patch.object(
+        settings, "groq_api_key", "test-key"
+    ):
+        yield completions
+
+
+def test_client_is_shared():
+    with patch.object(settings, "groq_enabled", True), patch.object(
+        settings, "groq_api_key", "test-key"
+    ), patch.object(ai, "_client", None):
+        assert ai.get_groq_client() is ai.get_groq_client()
+
+
+def test_client_disabled():
+    with patch.object(settings, "groq_enabled", False):
+        assert ai.get_groq_client() is None
+
+
+@pytest.mark.asyncio
+async def test_librarian_reply(groq):
+    reply = await ai.ask_librarian_ai("boats", "- Paddle-to-the-Sea by Holling C. Holling")
+    assert reply == "Try Paddle-to-the-Sea."
+
+
+@pytest.mark.asyncio
+async def test_librarian_times_out(groq):
+    groq.delay = 1
+    with patch.object(settings, "groq_librarian_timeout_seconds", 0.01):
+        with pytest.raises(TimeoutError):
+            await ai.ask_librarian_ai("boats", "")
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited(groq):
+    groq.delay = 0.01
+    with patch.object(settings, "groq_max_concurrency", 2):
+        replies = await asyncio.gather(*(ai.ask_librarian_ai("boats", "") for _ in range(6)))
+    assert len(replies) == 6
+    assert groq.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_pieces_and_releases_slot(groq):
+    async def stream():
+        for piece in ["Try ", None, "Paddle-to-the-Sea."]:
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    chunks = MagicMock(__aiter__=lambda self: stream(), close=AsyncMock())
+
+    async def create(**kwargs):
+        assert kwargs["stream"] is True
+        return chunks
+
+    groq.create = create
+    pieces = [p async for p in ai.stream_librarian_ai("boats", "")]
+    assert pieces == ["Try ", "Paddle-to-the-Sea."]
+    chunks.close.assert_awaited_once()
+    assert not ai._get_limiter().locked()
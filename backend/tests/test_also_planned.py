@@ -0,0 +1,101 @@
+"""Tests for co-planned ("families who planned X also planned Y") recommendations."""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from app.services import also_planned
+from app.services.also_planned import co_occurrence_neighbors, rebuild_also_planned
+from tests.conftest import MockResult, make_mock_book
+
+
+def _baskets(*baskets):
+    keys = [i for i, books in enumerate(baskets) for _ in books]
+    books = [book for basket in baskets for book in basket]
+    return np.array(keys), np.array(books)
+
+
+def test_neighbors_ranked_by_cosine_similarity():
+    # 10 and 20 always appear together; 30 only once alongside them
+    neighbors = co_occurrence_neighbors([(*_baskets([10, 20], [10, 20, 30], [30, 40]), 1.0)])
+    assert [book for book, _ in neighbors[10]] == [20, 30]
+    assert neighbors[10][0][1] > neighbors[10][1][1]
+    assert neighbors[20][0][0] == 10
+
+
+def test_weak_and_oversized_baskets_are_ignored():
+    # A single click session (weight 0.5) is below the support threshold
+    assert co_occurrence_neighbors([(*_baskets([1, 2]), 0.5)]) == {}
+    # Two sessions are enough
+    assert [b for b, _ in co_occurrence_neighbors([(*_baskets([1, 2], [1, 2]), 0.5)])[1]] == [2]
+
+    huge = list(range(also_planned.MAX_BASKET_SIZE + 1))
+    assert co_occurrence_neighbors([(*_baskets(huge), 1.0)]) == {}
+
+
+def test_top_n_and_duplicate_events():
+    basket = [1, 2, 3, 4, 2, 2]  # repeated clicks count once per basket
+    neighbors = co_occurrence_neighbors([(*_baskets(basket, basket), 1.0)], top_n=2)
+    assert len(neighbors[1]) == 2
+    assert neighbors[1][0][1] == pytest.approx(1.0)
+
+
+def test_no_events():
+    empty = (np.array([], dtype=np.int64), np.array([], dtype=np.int64), 1.0)
+    assert co_occurrence_neighbors([empty]) == {}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_writes_ranked_rows():
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MockResult())
+    plans = _baskets([1, 2], [1, 2, 3])
+    clicks = _baskets()
+    with patch.object(also_planned, "load_baskets", AsyncMock(side_effect=[plans, clicks])):
+        written = await rebuild_also_planned(db)
+    rows = db.execute.await_args_list[-1].args[1]
+    assert written == len(rows) == 6
+    assert (rows[0]["book_id"], rows[0]["related_book_id"], rows[0]["rank"]) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_also_planned(client, mock_db):
+    """GET /api/v1/books/{id}/also-planned returns co-planned books."""
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[make_mock_book(id=2)]))
+    resp = await client.get("/api/v1/books/1/also-planned")
+    assert resp.status_code == 200
+    assert [b["id"] for b in resp.json()] == [2]
+    assert mock_db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_also_planned_not_found(client, mock_db):
+    """GET /api/v1/books/{id}/also-planned returns 404 for a missing book."""
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[]))
+    resp = await client.get("/api/v1/books/999/also-planned")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_librarian_fallback_tops_up_with_co_planned(client, mock_db):
+    """The deterministic librarian fills remaining slots with co-planned books."""
+    match = make_mock_book(id=1)
+    co_planned = make_mock_book(id=2, title="Pagoo")
+    mock_db.execute = AsyncMock(side_effect=[
+        MockResult(items=[match]),
+        MockResult(items=[co_planned, match]),
+    ])
+    resp = await client.post("/api/v1/librarian", json={"message": "charlotte"})
+    assert resp.status_code == 200
+    assert [b["id"] for b in resp.json()["suggested_books"]] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_also_planned_endpoint(client, mock_db, admin_headers):
+    """POST /api/v1/admin/rebuild-also-planned commits and reports rows written."""
+    with patch.object(also_planned, "rebuild_also_planned", AsyncMock(return_value=7)):
+        resp = await client.post("/api/v1/admin/rebuild-also-planned", headers=admin_headers)
+    assert resp.status_code == 200
+    assert resp.json() == {"also_planned_rows": 7}
+    mock_db.commit.assert_awaited()
@@ -0,0 +1,49 @@
+"""Tests for the benchmark harness's statistics and result comparison."""
+
+import httpx
+import pytest
+
+from app.core.database import _query_stats
+from benchmarks.compare import compare
+from benchmarks.run import EndpointStats, Recorder
+
+
+def test_endpoint_stats_summary_percentiles():
+    stats = EndpointStats(latencies_ms=[float(n) for n in range(1, 101)], queries=[3] * 100)
+    summary = stats.summary(wall_seconds=2.0)
+    assert summary["requests"] == 100
+    assert summary["p50_ms"] == pytest.approx(50.5)
+    assert summary["p99_ms"] == pytest.approx(99.01)
+    assert summary["rps"] == 50.0
+    assert summary["queries_per_request"] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_recorder_attributes_queries_to_its_request():
+    def handler(request):
+        # Stands in for the engine listener recording statements mid-request
+        _query_stats.get().record("SELECT 1", 1.5)
+        _query_stats.get().record("SELECT 2", 0.5)
+        return httpx.Response(404 if request.url.path == "/missing" else 200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://t") as c:
+        rec = Recorder(c)
+        await rec.request("ok", "GET", "/ok")
+        await rec.request("missing", "GET", "/missing")
+    assert rec.stats["ok"].queries == [2]
+    assert rec.stats["ok"].db_ms == [2.0]
+    assert rec.stats["missing"].errors == 1
+    assert _query_stats.get() is None
+
+
+def _run(commit, p95, queries):
+    stats = {"p95_ms": p95, "queries_per_request": queries}
+    return {"commit": commit, "sizes": {"10000": {"books.get": stats}}}
+
+
+def test_compare_flags_latency_and_query_regressions():
+    _, regressions = compare(_run("a", 10.0, 3), _run("b", 11.0, 3))
+    assert regressions == []
+    lines, regressions = compare(_run("a", 10.0, 3), _run("b", 13.0, 4))
+    assert regressions == ["10000:books.get queries", "10000:books.get p95"]
+    assert "a -> b" in lines[0]
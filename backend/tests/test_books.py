@@ -101,7 +101,7 @@ async def test_search_books_pagination_params(client, mock_db):
 
 
 @pytest.mark.asyncio
-async def test_get_book_detail(client, mock_db):
+async def test_get_book_detail(client, mock_db, query_budget):
     """GET /api/v1/books/{id} returns a book with links."""
     source = make_mock_source()
     link = make_mock_link(source=source)
@@ -109,7 +109,8 @@ async def test_get_book_detail(client, mock_db):
     mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
         return_value=MockResult(items=[book])
     )
-    resp = await client.get("/api/v1/books/1")
+    with query_budget(1):
+        resp = await client.get("/api/v1/books/1")
     assert resp.status_code == 200
     data = resp.json()
     assert data["title"] == "Charlotte's Web"
@@ -176,3 +177,166 @@ async def test_get_filters(client, mock_db):
     assert "time_periods" in data
     assert "regions" in data
     assert "languages" in data
+
+
+@pytest.mark.asyncio
+async def test_search_books_relevance_sort(client, mock_db):
+    """GET /api/v1/books?q=...&sort=relevance ranks by the stored search vector."""
+    book = make_mock_book()
+    mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
+        return_value=MockResult(items=[book], scalar_value=1)
+    )
+    resp = await client.get("/api/v1/books?q=charlotte&sort=relevance")
+    assert resp.status_code == 200
+    search_sql = str(mock_db.execute.await_args_list[-1].args[0])
+    assert "search_vector" in search_sql
+    assert "ts_rank_cd" in search_sql
+
+
+@pytest.mark.asyncio
+async def test_search_books_fuzzy_match(client, mock_db):
+    """GET /api/v1/books?match=fuzzy uses trigram word similarity for misspellings."""
+    book = make_mock_book(title="Carry On, Mr. Bowditch", author="Jean Lee Latham")
+    mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
+        return_value=MockResult(items=[book], scalar_value=1)
+    )
+    resp = await client.get("/api/v1/books?q=Bowdich&match=fuzzy&sort=relevance")
+    assert resp.status_code == 200
+    search_sql = str(mock_db.execute.await_args_list[-1].args[0])
+    assert "<%" in search_sql
+    assert "word_similarity" in search_sql
+    assert resp.json()["items"][0]["title"] == "Carry On, Mr. Bowditch"
+
+
+@pytest.mark.asyncio
+async def test_search_books_cursor_pagination(client, mock_db):
+    """GET /api/v1/books?pagination=cursor returns next_cursor and skips the count."""
+    books = [make_mock_book(id=i, popularity_score=100.0 - i) for i in range(1, 4)]
+    mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
+        return_value=MockResult(items=books)
+    )
+    resp = await client.get("/api/v1/books?pagination=cursor&per_page=2")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data["items"]) == 2
+    assert data["total"] is None
+    assert data["next_cursor"]
+    # Only the page query ran: no count(*) over the filtered set
+    assert mock_db.execute.await_count == 1
+
+    mock_db.execute.reset_mock()
+    mock_db.execute.return_value = MockResult(items=books[2:])
+    resp = await client.get(f"/api/v1/books?cursor={data['next_cursor']}&per_page=2")
+    assert resp.status_code == 200
+    assert resp.json()["next_cursor"] is None
+    seek_sql = str(mock_db.execute.await_args.args[0])
+    assert "(books.popularity_score, books.id) <" in seek_sql
+
+
+@pytest.mark.asyncio
+async def test_search_books_invalid_cursor(client, mock_db):
+    """GET /api/v1/books rejects malformed cursors and cursors from another sort."""
+    resp = await client.get("/api/v1/books?cursor=not-a-cursor")
+    assert resp.status_code == 400
+
+    mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
+        return_value=MockResult(items=[make_mock_book(id=1), make_mock_book(id=2)])
+    )
+    first = await client.get("/api/v1/books?pagination=cursor&per_page=1&sort=title")
+    resp = await client.get(f"/api/v1/books?cursor={first.json()['next_cursor']}")
+    assert resp.status_code == 400
+
+    resp = await client.get("/api/v1/books?q=rome&sort=relevance&pagination=cursor")
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_books_estimated_count(client, mock_db):
+    """GET /api/v1/books?count=estimated takes total from the planner's row estimate."""
+    mock = pytest.importorskip("unittest.mock")
+    plan = [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 4200}}]
+    mock_db.execute = mock.AsyncMock(
+        side_effect=[MockResult(scalar_value=plan), MockResult(items=[make_mock_book()])]
+    )
+    resp = await client.get("/api/v1/books?age_range=6-10&count=estimated")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] == 4200
+    assert data["pages"] == 175
+    assert data["total_strategy"] == "estimated"
+    assert str(mock_db.execute.await_args_list[0].args[0]).startswith("EXPLAIN")
+
+
+@pytest.mark.asyncio
+async def test_search_books_cached_count(client, mock_db):
+    """GET /api/v1/books?count=cached reuses the exact total for the same filters."""
+    mock = pytest.importorskip("unittest.mock")
+    mock_db.execute = mock.AsyncMock(
+        side_effect=[
+            MockResult(scalar_value=37),
+            MockResult(items=[make_mock_book()]),
+            MockResult(items=[make_mock_book()]),
+        ]
+    )
+    first = await client.get("/api/v1/books?subject=nature&count=cached")
+    assert first.json()["total"] == 37
+    assert first.json()["total_strategy"] == "exact"
+
+    second = await client.get("/api/v1/books?subject=nature&count=cached&page=2")
+    assert second.json()["total"] == 37
+    assert second.json()["total_strategy"] == "cached"
+    assert mock_db.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_books_invalid_count_strategy(client):
+    """GET /api/v1/books rejects unknown count strategies."""
+    resp = await client.get("/api/v1/books?count=guess")
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_books_facets_filtered(client, mock_db):
+    """GET /api/v1/books?facets=true returns counts within the filtered set in one query."""
+    mock = pytest.importorskip("unittest.mock")
+    facet_rows = [
+        ("books", None, 3),
+        ("age_range", "6-10", 2),
+        ("age_range", "8-12", 1),
+        ("language", "English", 3),
+        ("time_period", None, 1),
+        ("subjects", "nature", 3),
+        ("subjects", "science", 1),
+    ]
+    mock_db.execute = mock.AsyncMock(
+        side_effect=[MockResult(items=facet_rows), MockResult(items=[make_mock_book()])]
+    )
+    resp = await client.get("/api/v1/books?subject=nature&facets=true")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] == 3
+    assert data["facets"]["age_range"] == {"6-10": 2, "8-12": 1}
+    assert data["facets"]["subjects"] == {"nature": 3, "science": 1}
+    assert data["facets"]["time_period"] == {}
+    # Facets + total in one statement, then the page: no separate count(*)
+    assert mock_db.execute.await_count == 2
+    assert "GROUPING SETS" in str(mock_db.execute.await_args_list[0].args[0])
+
+
+@pytest.mark.asyncio
+async def test_search_books_facets_unfiltered_uses_cache(client, mock_db):
+    """GET /api/v1/books?facets=true without filters reads the catalog facet cache."""
+    mock = pytest.importorskip("unittest.mock")
+    mock_db.execute = mock.AsyncMock(
+        side_effect=[
+            MockResult(items=[("books", None, 5), ("region", "World", 5)]),
+            MockResult(items=[make_mock_book()]),
+            MockResult(items=[make_mock_book()]),
+        ]
+    )
+    await client.get("/api/v1/books?facets=true")
+    resp = await client.get("/api/v1/books?facets=true&page=2")
+    data = resp.json()
+    assert data["total"] == 5
+    assert data["facets"]["region"] == {"World": 5}
+    assert mock_db.execute.await_count == 3
@@ -0,0 +1,56 @@
+"""Tests for the cached, versioned LLM catalog context."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services import catalog_events
+from app.services.catalog_context import CatalogContext, age_band, age_span, catalog_line
+from tests.conftest import MockResult, make_mock_book
+
+
+def test_age_span_matches_related_parsing():
+    assert age_span("12+") == age_span("12-adult") == (12, 18)
+    assert age_span("8") == (8, 8)
+    assert age_span("all ages") == (0, 18)
+
+
+def test_age_band():
+    assert age_band(3) == (0, 5)
+    assert age_band(9) == (9, 11)
+    assert age_band(40) == (15, 18)
+
+
+def test_catalog_line():
+    assert catalog_line(make_mock_book()) == (
+        "- \"Charlotte's Web\" by E.B. White | Ages 6-10 | "
+        "Level: intermediate | Subjects: literature, nature"
+    )
+
+
+@pytest.mark.asyncio
+async def test_block_is_cached_per_catalog_version(mock_db):
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[make_mock_book()]))
+    context = CatalogContext()
+
+    first = await context.get(mock_db, 50)
+    again = await context.get(mock_db, 50)
+    assert again is first
+    assert mock_db.execute.await_count == 1
+    assert first.find("charlotte's web ").id == 1
+    assert first.find("Stuart Little") is None
+
+    await catalog_events.books_created([])
+    rebuilt = await context.get(mock_db, 50)
+    assert rebuilt is not first
+    assert mock_db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_age_band_filters_and_limits(mock_db):
+    await CatalogContext().get(mock_db, 200, (9, 11))
+    statement = mock_db.execute.await_args.args[0]
+    sql = str(statement)
+    assert "substring(books.age_range" in sql
+    assert "LIMIT" in sql
+    assert "books.long_description" not in sql
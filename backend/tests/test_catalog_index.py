@@ -0,0 +1,91 @@
+"""Tests for the in-memory catalog bitmap index."""
+
+import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.catalog_index import CatalogIndex
+from tests.conftest import MockResult, make_mock_book
+
+
+def _row(book_id, **overrides):
+    values = {
+        "id": book_id,
+        "age_range": "6-10",
+        "subjects": ["nature"],
+        "time_period": None,
+        "region": "North America",
+        "reading_level": "intermediate",
+        "language": "English",
+        "popularity_score": float(book_id),
+        "title": f"Book {book_id:03d}",
+        "author": "Author",
+        "created_at": datetime.datetime(2025, 1, book_id % 28 + 1, tzinfo=datetime.UTC),
+    }
+    values.update(overrides)
+    return SimpleNamespace(_mapping=values)
+
+
+async def _built_index(rows):
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MockResult(items=rows))
+    return await CatalogIndex().get(db)
+
+
+@pytest.mark.asyncio
+async def test_index_filters_sorts_and_pages():
+    rows = [_row(i) for i in range(1, 41)]
+    rows += [_row(i, age_range="8-12", subjects=["history", "nature"]) for i in range(41, 51)]
+    index = await _built_index(rows)
+
+    mask = index.match({"subjects": "history", "age_range": None})
+    assert mask.bit_count() == 10
+    assert index.page(mask, "popularity", 0, 3) == [50, 49, 48]
+    assert index.page(mask, "title", 8, 5) == [49, 50]
+
+    everything = index.match({})
+    assert index.page(everything, "popularity", 10, 2) == [40, 39]
+    assert index.page(index.match({"region": "Antarctica"}), "title", 0, 5) == []
+
+
+@pytest.mark.asyncio
+async def test_index_facet_counts_and_patching():
+    index = await _built_index([_row(1), _row(2, subjects=["history"])])
+    assert index.facet_counts(index.match({}))["subjects"] == {"nature": 1, "history": 1}
+
+    book = SimpleNamespace(
+        id=3, title="Pagoo", author="Holling", age_range="8-12", subjects=["nature"],
+        time_period=None, region=None, reading_level=None, language="English",
+        popularity_score=99.0,
+    )
+    index.upsert(book)
+    assert index.page(index.match({"subjects": "nature"}), "popularity", 0, 5) == [3, 1]
+
+    index.remove(1)
+    counts = index.facet_counts(index.match({}))
+    assert counts["subjects"] == {"nature": 1, "history": 1}
+    assert counts["age_range"] == {"6-10": 1, "8-12": 1}
+
+
+@pytest.mark.asyncio
+async def test_search_books_uses_catalog_index(client, mock_db):
+    """GET /api/v1/books answers from the index and only hydrates the page."""
+    rows = [_row(1, popularity_score=10.0), _row(2, popularity_score=90.0)]
+    mock_db.execute = AsyncMock(
+        side_effect=[
+            MockResult(items=rows),
+            MockResult(items=[make_mock_book(id=1), make_mock_book(id=2)]),
+        ]
+    )
+    with (
+        patch("app.api.books.settings.catalog_index_enabled", True),
+        patch("app.api.books.catalog_index", CatalogIndex()),
+    ):
+        resp = await client.get("/api/v1/books?subject=nature&facets=true")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [b["id"] for b in data["items"]] == [2, 1]
+    assert data["total"] == 2
+    assert data["facets"]["age_range"] == {"6-10": 2}
@@ -0,0 +1,89 @@
+"""Tests for the streaming CSV import pipeline."""
+
+import io
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services import csv_import
+from app.services.csv_import import IMPORT_COLUMNS, import_csv, parse_row
+
+HEADER = "title,author,description,age_range,isbn,subjects,page_count\n"
+
+
+def _csv(*lines):
+    return io.BytesIO((HEADER + "".join(line + "\n" for line in lines)).encode())
+
+
+def test_parse_row_converts_types():
+    record = dict(zip(IMPORT_COLUMNS, parse_row({
+        "title": " Pagoo ",
+        "author": "Holling C. Holling",
+        "description": "A hermit crab.",
+        "age_range": "8-12",
+        "subjects": "nature| science |",
+        "page_count": "96",
+    })))
+    assert record["title"] == "Pagoo"
+    assert record["subjects"] == ["nature", "science"]
+    assert record["page_count"] == 96
+    assert record["language"] == "English"
+    assert record["isbn"] is None
+
+
+@pytest.mark.parametrize(
+    "overrides, message",
+    [
+        ({"title": ""}, "missing required column(s): title"),
+        ({"isbn": "9" * 21}, "isbn is longer than 20 characters"),
+        ({"page_count": "many"}, "invalid literal"),
+    ],
+)
+def test_parse_row_rejects_invalid(overrides, message):
+    row = {"title": "T", "author": "A", "description": "D", "age_range": "6-10", **overrides}
+    with pytest.raises(ValueError, match=re.escape(message)):
+        parse_row(row)
+
+
+@pytest.mark.asyncio
+async def test_import_streams_in_chunks_with_row_errors():
+    load = AsyncMock(side_effect=[(2, 0), (0, 1)])
+    chunks = []
+
+    async def on_chunk(stats):
+        chunks.append(stats.rows)
+
+    upload = _csv(
+        "Book A,Author,Desc,6-10,111,nature,",
+        "Book B,Author,Desc,6-10,,history,",
+        ",Author,Desc,6-10,222,,",  # missing title
+        "Book A v2,Author,Desc,6-10,111,,",
+    )
+    with patch.object(csv_import, "CHUNK_ROWS", 3), patch.object(csv_import, "load_chunk", load):
+        stats = await import_csv(AsyncMock(), upload, on_chunk)
+
+    assert chunks == [3, 4]
+    assert (stats.rows, stats.created, stats.updated) == (4, 2, 1)
+    assert stats.errors == [{"row": 4, "error": "missing required column(s): title"}]
+    first_chunk = load.await_args_list[0].args[1]
+    assert [r[0] for r in first_chunk] == ["Book A", "Book B"]
+
+
+@pytest.mark.asyncio
+async def test_import_keeps_last_row_per_isbn_within_chunk():
+    load = AsyncMock(return_value=(1, 0))
+    upload = _csv("First,Author,Desc,6-10,111,,", "Second,Author,Desc,6-10,111,,")
+    with patch.object(csv_import, "load_chunk", load):
+        await import_csv(AsyncMock(), upload)
+    assert [r[0] for r in load.await_args.args[1]] == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_import_reports_undecodable_file():
+    load = AsyncMock()
+    with patch.object(csv_import, "load_chunk", load):
+        stats = await import_csv(AsyncMock(), io.BytesIO(b"title\n\xff\xfe\n"))
+    assert stats.error_count == 1
+    assert "unreadable CSV" in stats.errors[0]["error"]
+    load.assert_not_awaited()
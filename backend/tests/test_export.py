@@ -0,0 +1,87 @@
+"""Tests for the streaming bulk catalog export."""
+
+import csv
+import io
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from tests.conftest import make_mock_book, make_mock_link, make_mock_list, make_mock_list_item
+
+
+class StreamResult:
+    """Mock of the AsyncScalarResult returned by ``stream_scalars``."""
+
+    def __init__(self, *batches):
+        self.batches = batches
+
+    async def partitions(self):
+        for batch in self.batches:
+            yield batch
+
+
+def _export_session(*batches):
+    session = MagicMock()
+    session.stream_scalars = AsyncMock(return_value=StreamResult(*batches))
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return patch("app.api.export.async_session", factory), session
+
+
+def _book(book_id):
+    book = make_mock_book(id=book_id, links=[make_mock_link()])
+    book.list_items = [make_mock_list_item(book=book, curated_list=make_mock_list())]
+    return book
+
+
+@pytest.mark.asyncio
+async def test_export_requires_key(client):
+    resp = await client.get("/api/v1/export/books", headers={"X-API-Key": "wrong"})
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_streams_batches(client, admin_headers):
+    """GET /api/v1/export/books streams one JSON object per book, batch by batch."""
+    patcher, session = _export_session([_book(1), _book(2)], [_book(3)])
+    with patcher:
+        resp = await client.get("/api/v1/export/books", headers=admin_headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["id"] for r in records] == [1, 2, 3]
+    assert records[0]["links"][0]["source"] == "Amazon"
+    assert records[0]["lists"][0]["slug"] == "best-nature-books"
+    assert session.expunge_all.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_export_csv_matches_import_format(client, admin_headers):
+    patcher, _ = _export_session([_book(1)])
+    with patcher:
+        resp = await client.get("/api/v1/export/books?format=csv", headers=admin_headers)
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert rows[0]["title"] == "Charlotte's Web"
+    assert rows[0]["subjects"] == "literature|nature"
+    assert rows[0]["links"] == "Amazon=https://amazon.com/charlottes-web"
+
+
+@pytest.mark.asyncio
+async def test_export_partner_key_and_updated_since(client):
+    patcher, session = _export_session([])
+    with patcher, patch.object(settings, "partner_api_keys", "partner-a, partner-b"):
+        resp = await client.get(
+            "/api/v1/export/books?updated_since=2025-06-01T00:00:00Z",
+            headers={"X-API-Key": "partner-b"},
+        )
+    assert resp.status_code == 200
+    assert resp.text == ""
+    statement = str(session.stream_scalars.await_args.args[0])
+    assert "books.updated_at >=" in statement
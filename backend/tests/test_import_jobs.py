@@ -0,0 +1,131 @@
+"""Tests for background CSV import jobs."""
+
+import io
+import os
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.import_job import ImportJob
+from app.services import import_jobs
+from app.services.csv_import import ImportStats
+
+CSV = b"title,author,description,age_range\nA,B,C,6-10\n"
+
+
+def _job(tmp_path, **overrides):
+    path = tmp_path / "upload.csv"
+    path.write_bytes(CSV)
+    fields = {"id": 1, "status": "queued", "file_path": str(path), "cancel_requested": False}
+    fields.update(overrides)
+    return ImportJob(**fields)
+
+
+def _session(job, cancelled=False):
+    session = MagicMock()
+    session.get = AsyncMock(return_value=job)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.scalar = AsyncMock(return_value=cancelled)
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return patch("app.services.import_jobs.async_session", factory), session
+
+
+def _import_with(*chunk_stats):
+    """Stand-in for csv_import.import_csv that reports ``chunk_stats`` one by one."""
+
+    async def fake_import(db, f, on_chunk=None):
+        stats = ImportStats()
+        for rows, created in chunk_stats:
+            stats.rows, stats.created = rows, created
+            await on_chunk(stats)
+        return stats
+
+    return patch("app.services.csv_import.import_csv", fake_import)
+
+
+def test_spool_upload_copies_to_disk(tmp_path):
+    with patch("app.services.import_jobs.settings.import_spool_dir", str(tmp_path / "spool")):
+        path, size = import_jobs.spool_upload(io.BytesIO(CSV))
+    assert size == len(CSV)
+    assert open(path, "rb").read() == CSV
+
+
+@pytest.mark.asyncio
+async def test_run_import_job_records_progress(tmp_path):
+    job = _job(tmp_path)
+    session_patch, session = _session(job)
+    reloaded = AsyncMock()
+    with session_patch, _import_with((5000, 5000), (7500, 7400)), patch(
+        "app.services.catalog_events.catalog_reloaded", reloaded
+    ):
+        await import_jobs.run_import_job(1)
+
+    assert job.status == "succeeded"
+    assert (job.rows, job.created_count) == (7500, 7400)
+    assert job.started_at is not None and job.finished_at is not None
+    # running + one per chunk + final
+    assert session.commit.await_count == 4
+    assert not os.path.exists(job.file_path)
+    reloaded.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_import_job_stops_when_cancelled(tmp_path):
+    job = _job(tmp_path)
+    session_patch, _ = _session(job, cancelled=True)
+    with session_patch, _import_with((5000, 5000), (10000, 10000)), patch(
+        "app.services.catalog_events.catalog_reloaded", AsyncMock()
+    ):
+        await import_jobs.run_import_job(1)
+
+    assert job.status == "cancelled"
+    assert job.rows == 5000
+
+
+@pytest.mark.asyncio
+async def test_run_import_job_records_failure(tmp_path):
+    job = _job(tmp_path)
+    session_patch, session = _session(job)
+    failing = AsyncMock(side_effect=RuntimeError("connection lost"))
+    with session_patch, patch("app.services.csv_import.import_csv", failing):
+        await import_jobs.run_import_job(1)
+
+    assert job.status == "failed"
+    assert job.error_message == "connection lost"
+    session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cancel_finished_job_is_noop(tmp_path):
+    job = _job(tmp_path, status="succeeded")
+    db = MagicMock(flush=AsyncMock())
+    await import_jobs.request_cancel(db, job)
+    assert job.cancel_requested is False
+    db.flush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_job_spools_off_the_event_loop(tmp_path, mock_db):
+    with patch("app.services.import_jobs.settings.import_spool_dir", str(tmp_path)), patch(
+        "app.services.import_jobs.asyncio.to_thread", wraps=import_jobs.asyncio.to_thread
+    ) as to_thread:
+        job = await import_jobs.create_job(mock_db, io.BytesIO(CSV), "books.csv")
+    to_thread.assert_awaited_once()
+    assert (job.status, job.file_size) == ("queued", len(CSV))
+
+
+@pytest.mark.asyncio
+async def test_fail_interrupted_jobs():
+    patcher, session = _session(None)
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+    with patcher:
+        assert await import_jobs.fail_interrupted_jobs() == 2
+    statement = session.execute.await_args.args[0]
+    assert statement.compile().params["status"] == "failed"
+    session.commit.assert_awaited_once()
@@ -1,7 +1,12 @@
 """Tests for the librarian (AI recommendation) endpoint."""
 
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
+from app.core.config import settings
 from tests.conftest import MockResult, make_mock_book
 
 
@@ -80,3 +85,76 @@ async def test_librarian_short_message(client, mock_db):
         json={"message": "hi"},
     )
     assert resp.status_code == 200
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    """Parse an SSE body into ``(event, data)`` pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_librarian_stream_deterministic(client, mock_db):
+    """POST /api/v1/librarian/stream sends the fallback reply as one token, then done."""
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[make_mock_book()]))
+
+    @asynccontextmanager
+    async def session():
+        yield mock_db
+
+    with patch("app.api.librarian.async_session", session):
+        resp = await client.post("/api/v1/librarian/stream", json={"message": "nature"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    (token, first), (done, final) = _events(resp.text)
+    assert (token, done) == ("token", "done")
+    assert final["reply"] == first["text"]
+    assert final["suggested_books"][0]["title"] == "Charlotte's Web"
+
+
+@pytest.mark.asyncio
+async def test_librarian_stream_tokens(client, mock_db):
+    """Groq tokens are forwarded as they arrive; done names the books the reply mentions."""
+    books = [make_mock_book(), make_mock_book(id=2, title="Paddle-to-the-Sea")]
+    mock_db.execute = AsyncMock(return_value=MockResult(items=books))
+
+    async def tokens(*args):
+        for piece in ["You'll love ", "Paddle-to-the-Sea", "!"]:
+            yield piece
+
+    with patch.object(settings, "groq_enabled", True), patch.object(
+        settings, "groq_api_key", "test-key"
+    ), patch("app.api.librarian.stream_librarian_ai", tokens):
+        resp = await client.post("/api/v1/librarian/stream", json={"message": "boats"})
+    events = _events(resp.text)
+    assert [e for e, _ in events] == ["token", "token", "token", "done"]
+    assert events[-1][1]["reply"] == "You'll love Paddle-to-the-Sea!"
+    assert [b["id"] for b in events[-1][1]["suggested_books"]] == [2]
+
+
+@pytest.mark.asyncio
+async def test_librarian_stream_context_failure_falls_back(client, mock_db):
+    """If the catalog context can't be built, the stream sends the deterministic answer."""
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[make_mock_book()]))
+    stream = AsyncMock()
+
+    @asynccontextmanager
+    async def session():
+        yield mock_db
+
+    with patch.object(settings, "groq_enabled", True), patch.object(
+        settings, "groq_api_key", "test-key"
+    ), patch(
+        "app.api.librarian.relevant_context", AsyncMock(side_effect=RuntimeError("db down"))
+    ), patch("app.api.librarian.stream_librarian_ai", stream), patch(
+        "app.api.librarian.async_session", session
+    ):
+        resp = await client.post("/api/v1/librarian/stream", json={"message": "nature"})
+    assert resp.status_code == 200
+    (token, _), (done, final) = _events(resp.text)
+    assert (token, done) == ("token", "done")
+    assert final["suggested_books"][0]["title"] == "Charlotte's Web"
+    stream.assert_not_called()
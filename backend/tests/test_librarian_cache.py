@@ -0,0 +1,98 @@
+"""Tests for the librarian reply cache."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.models.schemas import LibrarianResponse
+from app.services import catalog_events
+from app.services.librarian_cache import LibrarianCache, normalize, similarity
+from app.services.retrieval import book_retriever
+from tests.conftest import MockResult, make_mock_book
+
+
+def _cache(**overrides):
+    options = {"ttl_seconds": 60, "max_entries": 16, "min_similarity": 0.8, **overrides}
+    return LibrarianCache(**options)
+
+
+def test_normalize_ignores_case_punctuation_and_filler():
+    assert normalize("Books about ancient Rome for a 9 year old!") == normalize(
+        "ancient rome books for 9 year olds"
+    )
+
+
+def test_similarity_requires_same_numbers():
+    nine = normalize("ancient rome books for a 9 year old boy")
+    five = normalize("ancient rome books for a 5 year old boy")
+    assert similarity(nine, five) == 0.0
+
+
+def test_exact_and_similar_hits():
+    cache = _cache()
+    response = LibrarianResponse(reply="Try Detectives in Togas.")
+    cache.set("books about ancient Rome for a 9 year old", 1, "", response)
+
+    assert cache.get("Ancient Rome books for 9 year olds?", 1, "") is response
+    assert cache.get("books about ancient Rome for a 9 year old reader", 1, "") is response
+    assert cache.get("books about ancient Egypt", 1, "") is None
+    assert cache.as_dict() == {
+        "entries": 1,
+        "hits": 1,
+        "similar_hits": 1,
+        "misses": 1,
+        "hit_rate": 0.667,
+    }
+
+
+def test_catalog_version_and_family_scope_entries():
+    cache = _cache()
+    cache.set("ancient rome", 1, "", LibrarianResponse(reply="x"))
+    assert cache.get("ancient rome", 2, "") is None
+    assert cache.get("ancient rome", 1, "family-a") is None
+
+
+def test_size_bound_evicts_oldest():
+    cache = _cache(max_entries=2)
+    for topic in ("rome", "egypt", "greece"):
+        cache.set(f"ancient {topic}", 1, "", LibrarianResponse(reply=topic))
+    assert cache.get("ancient rome", 1, "") is None
+    assert cache.get("ancient greece", 1, "").reply == "greece"
+
+
+@pytest.mark.asyncio
+async def test_librarian_reuses_cached_reply(client, mock_db):
+    """The second near-identical question is answered without Groq or the catalog query."""
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[make_mock_book()]))
+    ask = AsyncMock(return_value="You'll love Charlotte's Web.")
+
+    @asynccontextmanager
+    async def session():
+        yield mock_db
+
+    with patch.object(settings, "groq_enabled", True), patch.object(
+        settings, "groq_api_key", "test-key"
+    ), patch("app.api.librarian.ask_librarian_ai", ask), patch(
+        "app.services.retrieval.async_session", session
+    ):
+        first = await client.post("/api/v1/librarian", json={"message": "books about pigs"})
+        queries = mock_db.execute.await_count
+        second = await client.post("/api/v1/librarian", json={"message": "Books about pigs!"})
+        assert mock_db.execute.await_count == queries
+        await catalog_events.books_created([])
+        third = await client.post("/api/v1/librarian", json={"message": "books about pigs"})
+        if book_retriever._refresh is not None:
+            await book_retriever._refresh
+
+    assert first.json() == second.json()
+    assert ask.await_count == 2
+    assert third.json()["suggested_books"][0]["title"] == "Charlotte's Web"
+
+
+@pytest.mark.asyncio
+async def test_librarian_cache_stats_endpoint(client, admin_headers):
+    resp = await client.get("/api/v1/admin/librarian-cache", headers=admin_headers)
+    assert resp.status_code == 200
+    assert resp.json()["hits"] == 0
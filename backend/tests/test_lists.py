@@ -17,26 +17,21 @@ async def test_get_lists_empty(client, mock_db):
 
 
 @pytest.mark.asyncio
-async def test_get_lists_with_results(client, mock_db):
-    """GET /api/v1/lists returns lists with book counts."""
+async def test_get_lists_with_results(client, mock_db, query_budget):
+    """GET /api/v1/lists returns lists with book counts in one query."""
     lst = make_mock_list()
-    call_count = 0
-
-    async def side_effect(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            return MockResult(items=[lst])
-        return MockResult(scalar_value=5)
-
-    mock_db.execute = side_effect
-    resp = await client.get("/api/v1/lists")
+    mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
+        return_value=MockResult(items=[(lst, 5)])
+    )
+    with query_budget(1):
+        resp = await client.get("/api/v1/lists")
     assert resp.status_code == 200
     data = resp.json()
     assert len(data) == 1
     assert data[0]["name"] == "Best Nature Books"
     assert data[0]["slug"] == "best-nature-books"
     assert data[0]["is_featured"] is True
+    assert data[0]["book_count"] == 5
 
 
 @pytest.mark.asyncio
@@ -70,7 +65,7 @@ async def test_get_list_categories(client, mock_db):
 
 
 @pytest.mark.asyncio
-async def test_get_list_detail(client, mock_db):
+async def test_get_list_detail(client, mock_db, query_budget):
     """GET /api/v1/lists/{slug} returns list with items."""
     book = make_mock_book()
     item = make_mock_list_item(book=book, rank=1)
@@ -79,7 +74,8 @@ async def test_get_list_detail(client, mock_db):
     mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
         return_value=MockResult(items=[lst])
     )
-    resp = await client.get("/api/v1/lists/best-nature-books")
+    with query_budget(1):
+        resp = await client.get("/api/v1/lists/best-nature-books")
     assert resp.status_code == 200
     data = resp.json()
     assert data["name"] == "Best Nature Books"
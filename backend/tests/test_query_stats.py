@@ -0,0 +1,69 @@
+"""Tests for per-request SQL query instrumentation."""
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.core.database import (
+    _after_cursor_execute,
+    _before_cursor_execute,
+    _handle_error,
+    track_queries,
+)
+
+
+def _run_statement(conn, statement):
+    _before_cursor_execute(conn, None, statement, {}, None, False)
+    _after_cursor_execute(conn, None, statement, {}, None, False)
+
+
+def test_track_queries_counts_and_nests():
+    conn = SimpleNamespace(info={})
+    _run_statement(conn, "SELECT untracked")
+    with track_queries() as outer:
+        _run_statement(conn, "SELECT 1")
+        with track_queries() as inner:
+            _run_statement(conn, "SELECT 2")
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.slowest_statement in ("SELECT 1", "SELECT 2")
+    assert outer.total_ms >= outer.slowest_ms >= 0
+    assert conn.info["query_start"] == []
+
+
+def test_failed_statement_drops_its_start_time():
+    conn = SimpleNamespace(info={})
+    _before_cursor_execute(conn, None, "SELECT broken", {}, None, False)
+    _handle_error(SimpleNamespace(connection=conn, cursor=object()))
+    assert conn.info["query_start"] == []
+    with track_queries() as stats:
+        _run_statement(conn, "SELECT 1")
+    assert stats.count == 1
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_only_in_debug(client):
+    resp = await client.get("/")
+    assert "server-timing" not in resp.headers
+    with patch("app.core.query_stats.settings.debug", True):
+        resp = await client.get("/")
+    assert resp.headers["server-timing"].startswith('db;dur=0.0;desc="0 queries"')
+
+
+@pytest.mark.asyncio
+async def test_request_log_has_query_fields(client, caplog):
+    with caplog.at_level(logging.INFO, logger="app.core.query_stats"):
+        await client.get("/")
+    record = caplog.records[-1]
+    assert (record.method, record.path, record.status) == ("GET", "/", 200)
+    assert record.db_queries == 0
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fails_when_exceeded(query_budget, mock_db):
+    with pytest.raises(AssertionError, match="2 queries issued, budget is 1"):
+        with query_budget(1):
+            await mock_db.execute("SELECT 1")
+            await mock_db.scalar("SELECT 2")
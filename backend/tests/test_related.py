@@ -0,0 +1,166 @@
+"""Tests for the precomputed related-books neighbor table."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.age_ranges import parse_age_range
+from app.services.related import (
+    RelatedScorer,
+    _BookFeatures,
+    age_similarity,
+    load_scorer,
+    rebuild_related_books,
+    refresh_related_for,
+)
+from tests.conftest import MockResult, make_mock_book
+
+
+def _features(book_id, subjects=("nature",), ages=(6, 10), lists=(), **overrides):
+    values = {
+        "id": book_id,
+        "subjects": frozenset(subjects),
+        "ages": ages,
+        "time_period": None,
+        "region": None,
+        "series": None,
+        "lists": frozenset(lists),
+        "popularity": 0.0,
+    }
+    values.update(overrides)
+    return _BookFeatures(**values)
+
+
+def test_parse_age_range():
+    assert parse_age_range("6-10") == (6, 10)
+    assert parse_age_range("12+") == (12, 18)
+    assert parse_age_range("8") == (8, 8)
+    assert parse_age_range("12-adult") == (12, 18)
+    assert parse_age_range("all ages") is None
+
+
+def test_age_similarity_rewards_overlap_and_adjacency():
+    assert age_similarity((6, 10), (6, 10)) == 1.0
+    assert 0 < age_similarity((6, 10), (8, 12)) < 1
+    assert age_similarity((6, 8), (9, 12)) == 0.25
+    assert age_similarity((3, 5), (12, 18)) == 0.0
+
+
+def test_neighbors_ranked_by_combined_score():
+    scorer = RelatedScorer([
+        _features(1, subjects=("nature", "science"), lists=(7,), series="Burgess"),
+        _features(2, subjects=("nature", "science"), lists=(7,), series="Burgess"),
+        _features(3, subjects=("nature",)),
+        _features(4, subjects=("history",), ages=(14, 18)),
+    ])
+    neighbors = scorer.neighbors(1)
+    assert [book_id for book_id, _ in neighbors] == [2, 3]
+    assert neighbors[0][1] > neighbors[1][1]
+    assert scorer.neighbors(1, k=1) == neighbors[:1]
+
+
+def test_neighbors_found_through_list_co_occurrence():
+    scorer = RelatedScorer([
+        _features(1, subjects=("nature",), lists=(3,)),
+        _features(2, subjects=("poetry",), ages=None, lists=(3,)),
+    ])
+    assert [book_id for book_id, _ in scorer.neighbors(1)] == [2]
+
+
+def test_common_subjects_count_towards_score(monkeypatch):
+    """A candidate found through a rare subject scores the same whether or not the
+    scorer holds the books that make its other shared subject common."""
+    monkeypatch.setattr("app.services.related.MAX_CANDIDATE_POSTING", 2)
+    target = _features(1, subjects=("botany", "nature"))
+    candidate = _features(2, subjects=("botany", "nature"))
+    crowd = [_features(i, subjects=("nature",), ages=(14, 18)) for i in (3, 4)]
+
+    full = RelatedScorer([target, candidate, *crowd]).neighbors(1)
+    incremental = RelatedScorer([target, candidate]).neighbors(1)
+    assert full == incremental
+    assert full[0][0] == 2
+
+
+@pytest.mark.asyncio
+async def test_load_scorer_and_rebuild():
+    """Features load in two queries; rebuild clears and rewrites the table."""
+    books = [
+        SimpleNamespace(
+            id=i, subjects=["nature"], age_range="6-10", time_period=None,
+            region=None, series=None, popularity_score=float(i),
+        )
+        for i in (1, 2, 3)
+    ]
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[
+        MockResult(items=[(5, 1), (5, 2)]),
+        MockResult(items=books),
+        MockResult(),  # clear
+        MockResult(),  # insert batch
+    ])
+    written = await rebuild_related_books(db)
+    assert written == 6
+    rows = db.execute.await_args_list[-1].args[1]
+    # Books 1 and 2 share a curated list, so they rank each other first
+    assert (rows[0]["book_id"], rows[0]["related_book_id"], rows[0]["rank"]) == (1, 2, 1)
+
+    db.execute = AsyncMock(side_effect=[MockResult(items=[]), MockResult(items=books)])
+    scorer = await load_scorer(db)
+    assert set(scorer.books) == {1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_refresh_related_for_loads_only_candidates():
+    """A single-book refresh reads its candidates and merges it into their stored lists."""
+
+    def book(book_id, subjects):
+        return SimpleNamespace(
+            id=book_id, subjects=subjects, age_range="6-10", time_period=None,
+            region=None, series=None, popularity_score=0.0,
+        )
+
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[
+        MockResult(items=[book(1, ["nature", "history"])]),
+        MockResult(items=[]),  # target's lists
+        MockResult(items=[(3, 5_000)]),  # capped subject counts: history is too common
+        MockResult(items=[book(2, ["nature"])]),
+        MockResult(items=[]),  # candidates' lists
+        MockResult(items=[(2, 9, 0.9), (2, 1, 0.1)]),  # book 2's stored neighbors
+        MockResult(),  # delete
+        MockResult(),  # insert
+    ])
+    await refresh_related_for(db, 1)
+
+    candidates_sql = str(db.execute.await_args_list[3].args[0])
+    assert "books.subjects &&" in candidates_sql
+    assert "books.id !=" in candidates_sql
+    rows = db.execute.await_args_list[7].args[1]
+    assert [(r["book_id"], r["related_book_id"], r["rank"]) for r in rows] == [
+        (1, 2, 1),
+        (2, 9, 1),
+        (2, 1, 2),
+    ]
+    assert rows[2]["score"] > 0.1
+
+
+@pytest.mark.asyncio
+async def test_related_books_served_from_table(client, mock_db):
+    """GET /api/v1/books/{id}/related is a single lookup when neighbors exist."""
+    neighbor = make_mock_book(id=2, title="My Side of the Mountain")
+    mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
+        return_value=MockResult(items=[neighbor])
+    )
+    resp = await client.get("/api/v1/books/1/related")
+    assert resp.status_code == 200
+    assert [b["id"] for b in resp.json()] == [2]
+    assert mock_db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_related_endpoint(client, mock_db, admin_headers):
+    """POST /api/v1/admin/rebuild-related reports how many rows were written."""
+    resp = await client.post("/api/v1/admin/rebuild-related", headers=admin_headers)
+    assert resp.status_code == 200
+    assert resp.json() == {"related_rows": 0}
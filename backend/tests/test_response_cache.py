@@ -0,0 +1,152 @@
+"""Tests for the public catalog response cache."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.core.response_cache import (
+    MemoryBackend,
+    RedisBackend,
+    ResponseCache,
+    ResponseCacheMiddleware,
+    cache_key,
+    match_tags,
+    response_cache,
+)
+from tests.conftest import MockResult, make_mock_list
+
+
+class FakeRedis:
+    """Local stand-in for the redis.asyncio subset RedisBackend uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+def test_match_tags_and_cache_key():
+    assert match_tags("/api/v1/books/42") == ("catalog", "book:42", "sources")
+    assert match_tags("/api/v1/books") is None
+    assert match_tags("/api/v1/librarian") is None
+    assert cache_key("/api/v1/lists", b"featured=true&category=Nature") == cache_key(
+        "/api/v1/lists", b"category=Nature&featured=true"
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeat_get_served_from_cache(client, mock_db):
+    """A second identical GET is answered without touching the database."""
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[(make_mock_list(), 3)]))
+    first = await client.get("/api/v1/lists?featured=true&category=Nature")
+    second = await client.get("/api/v1/lists?category=Nature&featured=true")
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert "max-age=" in second.headers["cache-control"]
+    reads = mock_db.execute.await_count
+    await client.get("/api/v1/lists?featured=true&category=Nature")
+    assert mock_db.execute.await_count == reads
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304(client, mock_db):
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[(make_mock_list(), 3)]))
+    etag = (await client.get("/api/v1/lists")).headers["etag"]
+    resp = await client.get("/api/v1/lists", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(client, mock_db):
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[]))
+    await client.get("/api/v1/lists/missing")
+    resp = await client.get("/api/v1/lists/missing")
+    assert resp.status_code == 404
+    assert "x-cache" not in resp.headers
+    assert mock_db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_admin_write_invalidates_by_tag(client, mock_db, admin_headers):
+    """Creating a list expires cached /lists responses."""
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[(make_mock_list(), 3)]))
+    await client.get("/api/v1/lists")
+    await client.post(
+        "/api/v1/admin/lists",
+        headers=admin_headers,
+        json={"name": "Poetry", "slug": "poetry", "description": "Verse for children."},
+    )
+    resp = await client.get("/api/v1/lists")
+    assert resp.headers["x-cache"] == "MISS"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_invalidates_stats(client, mock_db):
+    """/stats includes the subscriber count, so a new subscriber expires it."""
+    assert "subscribers" in match_tags("/api/v1/stats")
+    before = await response_cache.backend.tag_versions(["subscribers"])
+    await client.post("/api/v1/newsletter/subscribe", json={"email": "reader@example.com"})
+    assert await response_cache.backend.tag_versions(["subscribers"]) == [before[0] + 1]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_with_local_stand_in(client, mock_db):
+    response_cache.backend = RedisBackend(FakeRedis())
+    mock_db.execute = AsyncMock(return_value=MockResult(items=[(make_mock_list(), 3)]))
+    await client.get("/api/v1/lists")
+    assert (await client.get("/api/v1/lists")).headers["x-cache"] == "HIT"
+
+    await response_cache.invalidate("lists")
+    assert (await client.get("/api/v1/lists")).headers["x-cache"] == "MISS"
+
+    await response_cache.clear()
+    assert (await client.get("/api/v1/lists")).headers["x-cache"] == "MISS"
+
+
+@pytest.mark.asyncio
+async def test_endpoint_headers_replayed_on_miss_and_hit():
+    """Headers the endpoint set survive caching; hop-by-hop ones don't."""
+
+    async def endpoint(scope, receive, send):
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"cache-control", b"public, max-age=5"),
+            (b"server-timing", b"app;dur=1.0"),
+            (b"x-catalog-version", b"7"),
+            (b"connection", b"keep-alive"),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"[]"})
+
+    cache = ResponseCache(MemoryBackend(ttl_seconds=60, max_entries=8))
+    transport = httpx.ASGITransport(app=ResponseCacheMiddleware(endpoint, cache))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        miss, hit = await c.get("/api/v1/lists"), await c.get("/api/v1/lists")
+        not_modified = await c.get("/api/v1/lists", headers={"If-None-Match": hit.headers["etag"]})
+
+    assert (miss.headers["x-cache"], hit.headers["x-cache"]) == ("MISS", "HIT")
+    for resp in (miss, hit):
+        assert resp.headers["cache-control"] == "public, max-age=5"
+        assert resp.headers["server-timing"] == "app;dur=1.0"
+        assert resp.headers["x-catalog-version"] == "7"
+        assert resp.headers["content-type"] == "application/json"
+        assert "connection" not in resp.headers
+    assert hit.content == b"[]"
+    assert not_modified.status_code == 304
+    assert not_modified.headers["cache-control"] == "public, max-age=5"
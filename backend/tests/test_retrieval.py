@@ -0,0 +1,115 @@
+"""Tests for TF-IDF retrieval of librarian/curriculum context."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services import catalog_events
+from app.services.retrieval import BookRetriever, build_tfidf, relevant_context, tokenize
+from tests.conftest import MockResult, make_mock_book
+
+BOOKS = [
+    make_mock_book(),
+    make_mock_book(
+        id=2,
+        title="Detectives in Togas",
+        author="Henry Winterfeld",
+        description="Schoolboys in ancient Rome solve a mystery.",
+        subjects=["history", "mystery"],
+        age_range="9-13",
+        popularity_score=70.0,
+    ),
+    make_mock_book(
+        id=3,
+        title="The Bronze Bow",
+        author="Elizabeth George Speare",
+        description="A boy in Roman-occupied Galilee.",
+        subjects=["history", "faith"],
+        age_range="12-adult",
+        popularity_score=80.0,
+    ),
+    make_mock_book(
+        id=4,
+        title="City",
+        author="David Macaulay",
+        description="How the Romans planned and built a city.",
+        subjects=["history", "architecture"],
+        age_range="3-6",
+        popularity_score=60.0,
+    ),
+]
+
+
+def _session(db):
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return factory
+
+
+def _retriever():
+    retriever = BookRetriever()
+    retriever._index = build_tfidf(BOOKS)
+    return retriever
+
+
+def test_tokenize_drops_filler_and_plurals():
+    assert tokenize("Books about the Romans, for kids!") == ["roman"]
+
+
+def test_search_ranks_by_similarity():
+    retriever = _retriever()
+    assert retriever.search("mystery in ancient rome", 5) == [2]
+    assert retriever.search("Romans", 5) == [4, 3]
+    assert len(retriever.search("history", 2)) == 2
+    assert retriever.search("dinosaurs", 5) == []
+
+
+def test_search_respects_age_band():
+    retriever = _retriever()
+    assert retriever.search("history", 5, (9, 11)) == [2]
+    assert retriever.search("history", 5, (15, 18)) == [3]
+
+
+@pytest.mark.asyncio
+async def test_index_rebuilds_on_new_catalog_version(mock_db):
+    mock_db.execute = AsyncMock(return_value=MockResult(items=BOOKS))
+    retriever = BookRetriever()
+    await retriever.get(mock_db)
+    await retriever.get(mock_db)
+    assert mock_db.execute.await_count == 1
+
+    # A stale index keeps serving while a background task rebuilds it
+    await catalog_events.books_created([])
+    with patch("app.services.retrieval.async_session", _session(mock_db)):
+        assert await retriever.get(mock_db) is retriever
+        assert mock_db.execute.await_count == 1
+        await retriever._refresh
+    assert mock_db.execute.await_count == 2
+    assert retriever.is_fresh
+
+
+@pytest.mark.asyncio
+async def test_relevant_context_appends_matches_after_popular(mock_db):
+    """The popular block stays first (a stable prompt prefix); matches follow it."""
+
+    async def execute(statement):
+        sql = str(statement)
+        if "books.id IN" in sql:
+            return MockResult(items=[BOOKS[1]])
+        if "LIMIT" in sql:  # the popular block
+            return MockResult(items=BOOKS[:1])
+        return MockResult(items=BOOKS)
+
+    mock_db.execute = AsyncMock(side_effect=execute)
+    block = await relevant_context(mock_db, "a mystery set in Rome", popular=1, retrieved=2)
+    assert [b.id for b in block.books] == [1, 2]
+    lines = block.text.splitlines()
+    assert lines[0].startswith("- \"Charlotte's Web\"")
+    assert lines[2:] == [
+        "More books matching this request:",
+        '- "Detectives in Togas" by Henry Winterfeld | Ages 9-13 | '
+        "Level: intermediate | Subjects: history, mystery",
+    ]
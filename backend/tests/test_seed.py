@@ -0,0 +1,144 @@
+"""Tests for the bulk seed and synthetic catalog helpers."""
+
+import datetime
+import random
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scripts import seed
+from scripts.seed import OPTIONAL_BOOK_FIELDS, book_links, book_row, load_seed_data
+from scripts.synthetic import (
+    BOOK_COLUMNS,
+    BookSampler,
+    SyntheticScale,
+    generate_books,
+    generate_children,
+    generate_clicks,
+    generate_lists,
+    generate_plans,
+    generate_reviews,
+    generate_users,
+    synthetic_isbn,
+)
+
+BOOKS = load_seed_data()["books"]
+SOURCE_MAP = {"Amazon": 1, "BookShop.org": 2, "ThriftBooks": 3, "Library (WorldCat)": 5}
+
+
+def test_book_rows_share_keys_for_multi_row_insert():
+    rows = [book_row(data) for data in BOOKS]
+    assert len({frozenset(row) for row in rows}) == 1
+    assert set(OPTIONAL_BOOK_FIELDS) <= set(rows[0])
+    assert rows[0]["cover_image_url"].endswith(f"{BOOKS[0]['isbn']}-L.jpg")
+
+
+def test_book_links_use_isbn_when_present():
+    assert len(book_links(7, "Pagoo", "9780395538340", SOURCE_MAP)) == 4
+    links = book_links(7, "Pagoo", None, SOURCE_MAP)
+    assert [link["source_id"] for link in links] == [1, 2, 3]
+    assert links[0]["url"] == "https://www.amazon.com/s?k=Pagoo"
+    assert len({frozenset(link) for link in links}) == 1
+
+
+def test_synthetic_isbn_has_valid_check_digit():
+    isbn = synthetic_isbn(123456)
+    assert len(isbn) == 13 and isbn.startswith("979")
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(isbn))
+    assert total % 10 == 0
+
+
+def test_generate_books_is_deterministic():
+    first = generate_books(100, 50, random.Random(3))
+    assert first == generate_books(100, 50, random.Random(3))
+    assert [b[0] for b in first] == list(range(100, 150))
+    assert all(len(b) == len(BOOK_COLUMNS) for b in first)
+    reference_ages = {b["age_range"] for b in BOOKS}
+    assert {b[BOOK_COLUMNS.index("age_range")] for b in first} <= reference_ages
+
+
+def test_generate_lists_draws_members_from_catalog():
+    ids = list(range(1, 1201))
+    lists, members = generate_lists(ids, random.Random(0))
+    assert len(lists) == 2
+    assert all(10 <= len(m) <= 50 and set(m) <= set(ids) for m in members)
+    assert len({lst["slug"] for lst in lists}) == 2
+
+
+def _fake_session():
+    @asynccontextmanager
+    async def factory():
+        yield MagicMock()
+
+    return patch("scripts.seed.async_session", factory)
+
+
+@pytest.mark.asyncio
+async def test_seed_skips_when_marker_is_current():
+    engine = MagicMock()
+    with _fake_session(), patch("scripts.seed.engine", engine), patch(
+        "scripts.seed.read_seed_marker", AsyncMock(return_value=seed.seed_version())
+    ):
+        await seed.seed()
+    engine.begin.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("marker, seeds", [(None, True), ("0ld", True), ("current", False)])
+async def test_startup_check_seeds_only_when_stale(marker, seeds):
+    marker = seed.seed_version() if marker == "current" else marker
+    run_seed = AsyncMock()
+    with _fake_session(), patch("scripts.seed.seed", run_seed), patch(
+        "scripts.seed.read_seed_marker", AsyncMock(return_value=marker)
+    ), patch("scripts.seed.read_schema_revision", AsyncMock(return_value=seed.schema_head())):
+        await seed.startup_check()
+    assert run_seed.await_count == (1 if seeds else 0)
+
+
+AS_OF = datetime.datetime(2026, 6, 1, tzinfo=datetime.UTC)
+
+
+def _activity(seed_value):
+    rng = random.Random(seed_value)
+    books = generate_books(1, 400, rng)
+    sampler = BookSampler(books, seed_value)
+    users = generate_users(1, 60, rng, AS_OF)
+    user_ids = [u[0] for u in users]
+    children = generate_children(1, user_ids, sampler, rng, AS_OF)
+    plans, items = generate_plans(1, user_ids, children, sampler, rng, AS_OF)
+    reviews = generate_reviews(user_ids, sampler, rng, AS_OF)
+    clicks = generate_clicks(500, sampler, ["Amazon"], rng, AS_OF)
+    return books, users, children, plans, items, reviews, clicks
+
+
+def test_activity_is_deterministic_and_consistent():
+    books, users, children, plans, items, reviews, clicks = _activity(5)
+    assert _activity(5)[1:] == (users, children, plans, items, reviews, clicks)
+
+    book_ids = {b[0] for b in books}
+    user_ids = {u[0] for u in users}
+    child_ids = {c[0] for c in children}
+    assert {c[1] for c in children} <= user_ids
+    assert {p[2] for p in plans if p[2] is not None} <= child_ids
+    assert {i[0] for i in items} <= {p[0] for p in plans}
+    assert {i[1] for i in items} | {r[1] for r in reviews} | {c[0] for c in clicks} <= book_ids
+    # book_reviews is unique on (user_id, book_id)
+    assert len({(r[0], r[1]) for r in reviews}) == len(reviews)
+    assert len(clicks) == 500
+    assert all(c[5] <= AS_OF.replace(tzinfo=None) for c in clicks)
+
+
+def test_plans_follow_one_subject():
+    books, _, _, plans, items, _, _ = _activity(2)
+    subjects = {b[0]: set(b[BOOK_COLUMNS.index("subjects")]) for b in books}
+    for plan_id in {p[0] for p in plans}:
+        plan_books = [i[1] for i in items if i[0] == plan_id]
+        assert set.intersection(*(subjects[b] for b in plan_books))
+
+
+def test_scale_defaults_follow_books():
+    scale = SyntheticScale(books=100_000)
+    assert scale.users == 10_000
+    assert scale.subscribers == 30_000
+    assert scale.clicks == 250_000
@@ -0,0 +1,59 @@
+"""Tests for the sitemap feed endpoints."""
+
+import datetime
+
+import pytest
+
+from tests.conftest import MockResult
+
+UPDATED = datetime.datetime(2025, 3, 1, tzinfo=datetime.UTC)
+
+
+@pytest.mark.asyncio
+async def test_sitemap_index(client, mock_db):
+    """GET /api/v1/sitemap reports page counts in one query."""
+    mock_db.execute = pytest.importorskip("unittest.mock").AsyncMock(
+        return_value=MockResult(items=[(120_000, 12)])
+    )
+    resp = await client.get("/api/v1/sitemap")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "page_size": 50_000,
+        "books": 120_000,
+        "lists": 12,
+        "book_pages": 3,
+        "list_pages": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_sitemap_books_page(client, mock_db):
+    """GET /api/v1/sitemap/books returns (id, updated_at) pairs with validators."""
+    mock = pytest.importorskip("unittest.mock")
+    mock_db.execute = mock.AsyncMock(
+        side_effect=[
+            MockResult(items=[(2, UPDATED)]),
+            MockResult(items=[(1, UPDATED), (2, UPDATED)]),
+        ]
+    )
+    resp = await client.get("/api/v1/sitemap/books?page=1")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "page": 1,
+        "items": [[1, "2025-03-01T00:00:00+00:00"], [2, "2025-03-01T00:00:00+00:00"]],
+    }
+    assert resp.headers["last-modified"] == "Sat, 01 Mar 2025 00:00:00 GMT"
+    assert resp.headers["etag"].startswith('W/"2-')
+
+
+@pytest.mark.asyncio
+async def test_sitemap_conditional_get(client, mock_db):
+    """A matching If-None-Match gets a 304 without reading the page."""
+    mock = pytest.importorskip("unittest.mock")
+    mock_db.execute = mock.AsyncMock(return_value=MockResult(items=[(1, UPDATED)]))
+    etag = (await client.get("/api/v1/sitemap/lists")).headers["etag"]
+
+    mock_db.execute = mock.AsyncMock(return_value=MockResult(items=[(1, UPDATED)]))
+    resp = await client.get("/api/v1/sitemap/lists", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert mock_db.execute.await_count == 1
@@ -2,6 +2,7 @@
 
 import pytest
 
+from app.core.config import settings
 from tests.conftest import MockResult
 
 
@@ -14,17 +15,19 @@ async def test_get_stats(client, mock_db):
         nonlocal call_count
         call_count += 1
         if call_count == 1:
-            return MockResult(scalar_value=50)  # total_books
+            # Facet cache load: (facet, value, count) rows in one round trip
+            return MockResult(items=[
+                ("books", None, 50),
+                ("age_range", "4-8", 20),
+                ("age_range", "6-10", 30),
+                ("reading_level", "beginner", 12),
+                ("reading_level", "intermediate", 25),
+                ("subjects", "nature", 18),
+                ("subjects", "history", 22),
+                ("lists", None, 19),
+            ])
         elif call_count == 2:
-            return MockResult(scalar_value=19)  # total_lists
-        elif call_count == 3:
             return MockResult(scalar_value=120)  # total_subscribers
-        elif call_count == 4:
-            return MockResult(items=[("nature",), ("history",)])  # subjects
-        elif call_count == 5:
-            return MockResult(items=[("4-8",), ("6-10",)])  # age_ranges
-        elif call_count == 6:
-            return MockResult(items=[("beginner",), ("intermediate",)])  # reading_levels
         return MockResult()
 
     mock_db.execute = side_effect
@@ -34,9 +37,9 @@ async def test_get_stats(client, mock_db):
     assert data["total_books"] == 50
     assert data["total_lists"] == 19
     assert data["total_subscribers"] == 120
-    assert "subjects" in data
-    assert "age_ranges" in data
-    assert "reading_levels" in data
+    assert data["subjects"] == ["history", "nature"]
+    assert data["age_ranges"] == ["4-8", "6-10"]
+    assert data["reading_levels"] == ["beginner", "intermediate"]
 
 
 @pytest.mark.asyncio
@@ -49,3 +52,23 @@ async def test_get_stats_empty_db(client, mock_db):
     assert resp.status_code == 200
     data = resp.json()
     assert data["total_books"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_stats_served_from_facet_cache(client, mock_db):
+    """GET /api/v1/stats only queries subscribers once the facet cache is warm."""
+    mock = pytest.importorskip("unittest.mock")
+    mock_db.execute = mock.AsyncMock(
+        side_effect=[
+            MockResult(items=[("books", None, 3), ("lists", None, 1)]),
+            MockResult(scalar_value=7),
+            MockResult(scalar_value=8),
+        ]
+    )
+    # Bypass the response cache so the second request reaches the endpoint
+    with mock.patch.object(settings, "response_cache_enabled", False):
+        await client.get("/api/v1/stats")
+        resp = await client.get("/api/v1/stats")
+    assert resp.json()["total_books"] == 3
+    assert resp.json()["total_subscribers"] == 8
+    assert mock_db.execute.await_count == 3
@@ -2,7 +2,12 @@ import Link from "next/link";
 import Image from "next/image";
 import { Suspense } from "react";
 import { notFound } from "next/navigation";
-import { getBook, getRelatedBooks, searchBooks } from "@/lib/api";
+import {
+  getAlsoPlannedBooks,
+  getBook,
+  getRelatedBooks,
+  searchBooks,
+} from "@/lib/api";
 import { BookCard } from "@/components/BookCard";
 import { AddToReadingPlan } from "@/components/AddToReadingPlan";
 import { BookJsonLd, BreadcrumbJsonLd } from "@/components/JsonLd";
@@ -63,14 +68,20 @@ export async function generateMetadata({ params }: Props): Promise<Metadata> {
 export default async function BookDetailPage({ params }: Props) {
   let book;
   let related;
+  let alsoPlanned;
   try {
-    [book, related] = await Promise.all([
+    [book, related, alsoPlanned] = await Promise.all([
       getBook(Number(params.id)),
       getRelatedBooks(Number(params.id)),
+      // Optional section: never fail the page over it
+      getAlsoPlannedBooks(Number(params.id)).catch(() => []),
     ]);
   } catch {
     notFound();
   }
+  const shownRelated = related.slice(0, 6);
+  const shownIds = new Set(shownRelated.map((b) => b.id));
+  const coPlanned = alsoPlanned.filter((b) => !shownIds.has(b.id)).slice(0, 6);
 
   return (
     <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8 md:py-12">
@@ -276,13 +287,27 @@ export default async function BookDetailPage({ params }: Props) {
           </div>
 
           {/* Related Books */}
-          {related.length > 0 && (
+          {shownRelated.length > 0 && (
             <div className="mt-16">
               <h2 className="text-xl font-serif font-bold text-ink mb-6">
                 You Might Also Love
               </h2>
               <div className="grid grid-cols-2 sm:grid-cols-3 gap-4">
-                {related.slice(0, 6).map((b) => (
+                {shownRelated.map((b) => (
+                  <BookCard key={b.id} book={b} />
+                ))}
+              </div>
+            </div>
+          )}
+
+          {/* Co-planned Books */}
+          {coPlanned.length > 0 && (
+            <div className="mt-16">
+              <h2 className="text-xl font-serif font-bold text-ink mb-6">
+                Families Who Planned This Also Planned
+              </h2>
+              <div className="grid grid-cols-2 sm:grid-cols-3 gap-4">
+                {coPlanned.map((b) => (
                   <BookCard key={b.id} book={b} />
                 ))}
               </div>
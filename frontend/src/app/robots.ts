@@ -1,12 +1,31 @@
 import { MetadataRoute } from "next";
 
-export default function robots(): MetadataRoute.Robots {
+const API_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
+const SITE_URL =
+  process.env.NEXT_PUBLIC_SITE_URL || "https://livingbookshub.com";
+
+// Sitemaps are split by generateSitemaps() in sitemap.ts: /sitemap/0.xml .. /sitemap/N.xml
+async function sitemapCount(): Promise<number> {
+  try {
+    const res = await fetch(`${API_URL}/api/v1/sitemap`, {
+      next: { revalidate: 3600 },
+    });
+    if (!res.ok) return 2;
+    const data: { book_pages: number } = await res.json();
+    return data.book_pages + 1;
+  } catch {
+    return 2;
+  }
+}
+
+export default async function robots(): Promise<MetadataRoute.Robots> {
+  const count = await sitemapCount();
   return {
     rules: {
       userAgent: "*",
       allow: "/",
       disallow: ["/admin/", "/api/", "/marketing/", "/free-book-list/download/"],
     },
-    sitemap: `${process.env.NEXT_PUBLIC_SITE_URL || "https://livingbookshub.com"}/sitemap.xml`,
+    sitemap: Array.from({ length: count }, (_, id) => `${SITE_URL}/sitemap/${id}.xml`),
   };
 }
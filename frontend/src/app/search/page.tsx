@@ -31,6 +31,8 @@ async function SearchResults({
     params.reading_level = searchParams.reading_level;
   if (searchParams.sort) params.sort = searchParams.sort;
   if (searchParams.page) params.page = searchParams.page;
+  if (searchParams.pagination) params.pagination = searchParams.pagination;
+  if (searchParams.cursor) params.cursor = searchParams.cursor;
   params.per_page = "24";
 
   try {
@@ -56,8 +58,21 @@ async function SearchResults({
           {/* Sort bar */}
           <div className="flex items-center justify-between mb-6">
             <p className="text-sm text-warm-gray">
-              <span className="font-medium text-ink">{results.total}</span>{" "}
-              {results.total === 1 ? "book" : "books"} found
+              {results.total !== null ? (
+                <>
+                  {results.total_strategy === "estimated" && "About "}
+                  <span className="font-medium text-ink">{results.total}</span>{" "}
+                  {results.total === 1 ? "book" : "books"} found
+                </>
+              ) : (
+                <>
+                  Showing{" "}
+                  <span className="font-medium text-ink">
+                    {results.items.length}
+                  </span>{" "}
+                  {results.items.length === 1 ? "book" : "books"}
+                </>
+              )}
               {searchParams.q && (
                 <>
                   {" "}
@@ -73,6 +88,9 @@ async function SearchResults({
               <span className="text-xs text-warm-gray">Sort:</span>
               <div className="flex gap-1" role="group" aria-label="Sort results">
                 {[
+                  ...(searchParams.q
+                    ? [{ value: "relevance", label: "Best match" }]
+                    : []),
                   { value: "popularity", label: "Popular" },
                   { value: "title", label: "A-Z" },
                   { value: "newest", label: "Newest" },
@@ -81,6 +99,7 @@ async function SearchResults({
                     (searchParams.sort || "popularity") === opt.value;
                   const sortParams = new URLSearchParams(searchParams);
                   sortParams.set("sort", opt.value);
+                  sortParams.delete("cursor");
                   return (
                     <Link
                       key={opt.value}
@@ -110,7 +129,7 @@ async function SearchResults({
               </div>
 
               {/* Pagination */}
-              {results.pages > 1 && (
+              {results.pages !== null && results.pages > 1 && (
                 <div className="mt-10 flex justify-center gap-2">
                   {Array.from({ length: Math.min(results.pages, 10) }, (_, i) => {
                     const page = i + 1;
@@ -134,6 +153,21 @@ async function SearchResults({
                   })}
                 </div>
               )}
+
+              {/* Cursor pagination: no page count, just the next page */}
+              {results.next_cursor && (
+                <div className="mt-10 flex justify-center">
+                  <Link
+                    href={`/search?${new URLSearchParams({
+                      ...searchParams,
+                      cursor: results.next_cursor,
+                    }).toString()}`}
+                    className="btn-secondary text-sm"
+                  >
+                    Next page
+                  </Link>
+                </div>
+              )}
             </>
           ) : (
             <div className="text-center py-20">
@@ -4,37 +4,73 @@ const API_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 const SITE_URL =
   process.env.NEXT_PUBLIC_SITE_URL || "https://livingbookshub.com";
 
-async function fetchBookIds(): Promise<number[]> {
+interface SitemapIndex {
+  page_size: number;
+  books: number;
+  lists: number;
+  book_pages: number;
+  list_pages: number;
+}
+
+// The feed returns bare [key, timestamp] pairs, 50k per page
+type SitemapPage = { page: number; items: [string | number, string][] };
+
+async function fetchSitemapIndex(): Promise<SitemapIndex | null> {
   try {
-    const res = await fetch(`${API_URL}/api/v1/books?per_page=100`, {
+    const res = await fetch(`${API_URL}/api/v1/sitemap`, {
       next: { revalidate: 3600 },
     });
-    if (!res.ok) return [];
-    const data = await res.json();
-    return data.items.map((b: { id: number }) => b.id);
+    if (!res.ok) return null;
+    return await res.json();
   } catch {
-    return [];
+    return null;
   }
 }
 
-async function fetchListSlugs(): Promise<string[]> {
+async function fetchSitemapPage(
+  kind: "books" | "lists",
+  page: number,
+): Promise<SitemapPage["items"]> {
   try {
-    const res = await fetch(`${API_URL}/api/v1/lists`, {
+    const res = await fetch(`${API_URL}/api/v1/sitemap/${kind}?page=${page}`, {
       next: { revalidate: 3600 },
     });
     if (!res.ok) return [];
-    const data = await res.json();
-    return data.map((l: { slug: string }) => l.slug);
+    const data: SitemapPage = await res.json();
+    return data.items;
   } catch {
     return [];
   }
 }
 
-export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
-  const [bookIds, listSlugs] = await Promise.all([
-    fetchBookIds(),
-    fetchListSlugs(),
-  ]);
+// Sitemap 0 holds static pages and lists; sitemaps 1..N hold books, 50k each
+export async function generateSitemaps() {
+  const index = await fetchSitemapIndex();
+  const bookPages = index?.book_pages ?? 1;
+  return Array.from({ length: bookPages + 1 }, (_, id) => ({ id }));
+}
+
+export default async function sitemap(props: {
+  id: Promise<string>;
+}): Promise<MetadataRoute.Sitemap> {
+  const id = Number(await props.id);
+
+  if (id > 0) {
+    const books = await fetchSitemapPage("books", id);
+    return books.map(([bookId, updatedAt]) => ({
+      url: `${SITE_URL}/books/${bookId}`,
+      lastModified: new Date(updatedAt),
+      changeFrequency: "weekly" as const,
+      priority: 0.8,
+    }));
+  }
+
+  const index = await fetchSitemapIndex();
+  const listPages = await Promise.all(
+    Array.from({ length: index?.list_pages ?? 1 }, (_, i) =>
+      fetchSitemapPage("lists", i + 1),
+    ),
+  );
 
   const now = new Date();
 
@@ -63,19 +99,12 @@ export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
     { url: `${SITE_URL}/about`, lastModified: now, changeFrequency: "monthly", priority: 0.4 },
   ];
 
-  const bookPages: MetadataRoute.Sitemap = bookIds.map((id) => ({
-    url: `${SITE_URL}/books/${id}`,
-    lastModified: now,
-    changeFrequency: "weekly" as const,
-    priority: 0.8,
-  }));
-
-  const listPages: MetadataRoute.Sitemap = listSlugs.map((slug) => ({
+  const listEntries: MetadataRoute.Sitemap = listPages.flat().map(([slug, createdAt]) => ({
     url: `${SITE_URL}/lists/${slug}`,
-    lastModified: now,
+    lastModified: new Date(createdAt),
     changeFrequency: "weekly" as const,
     priority: 0.7,
   }));
 
-  return [...staticPages, ...bookPages, ...listPages];
+  return [...staticPages, ...listEntries];
 }
@@ -1,6 +1,7 @@
 "use client";
 
 import { trackAffiliateClick } from "@/lib/api";
+import { CLICK_SESSION_KEY } from "@/lib/constants";
 
 interface BookLink {
   id: number;
@@ -20,6 +21,20 @@ const SOURCE_COLORS: Record<string, { bg: string; hover: string; text: string }>
 
 const DEFAULT_COLORS = { bg: "bg-ink/5", hover: "hover:bg-ink/10", text: "text-ink" };
 
+// Groups clicks from one browsing session for "families also planned" recommendations
+function clickSessionId(): string | undefined {
+  try {
+    let id = sessionStorage.getItem(CLICK_SESSION_KEY);
+    if (!id) {
+      id = crypto.randomUUID();
+      sessionStorage.setItem(CLICK_SESSION_KEY, id);
+    }
+    return id;
+  } catch {
+    return undefined;
+  }
+}
+
 export function AffiliateLinks({
   bookId,
   links,
@@ -34,6 +49,7 @@ export function AffiliateLinks({
       link_id: link.id,
       source_name: link.source_name,
       referrer: typeof window !== "undefined" ? window.location.pathname : undefined,
+      session_id: typeof window !== "undefined" ? clickSessionId() : undefined,
     }).catch(() => {});
   }
 
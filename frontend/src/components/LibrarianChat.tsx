@@ -1,7 +1,7 @@
 "use client";
 
 import { useState } from "react";
-import { askLibrarian } from "@/lib/api";
+import { streamLibrarian } from "@/lib/api";
 import type { BookSummary, LibrarianResponse } from "@/types";
 import Link from "next/link";
 
@@ -21,20 +21,32 @@ export function LibrarianChat() {
     setConversation((prev) => [...prev, { role: "user", text: userMsg }]);
     setLoading(true);
 
+    // Add the librarian reply, then keep replacing it (the last message) as it streams in
+    let started = false;
+    const setReply = (reply: {
+      role: "librarian";
+      text: string;
+      books?: BookSummary[];
+    }) => {
+      const replace = started;
+      started = true;
+      setConversation((prev) =>
+        replace ? [...prev.slice(0, -1), reply] : [...prev, reply]
+      );
+    };
+
     try {
-      const res: LibrarianResponse = await askLibrarian(userMsg);
-      setConversation((prev) => [
-        ...prev,
-        { role: "librarian", text: res.reply, books: res.suggested_books },
-      ]);
+      let text = "";
+      const res: LibrarianResponse = await streamLibrarian(userMsg, (token) => {
+        text += token;
+        setReply({ role: "librarian", text });
+      });
+      setReply({ role: "librarian", text: res.reply, books: res.suggested_books });
     } catch {
-      setConversation((prev) => [
-        ...prev,
-        {
-          role: "librarian",
-          text: "I'm sorry, I had trouble finding suggestions right now. Try browsing our curated lists instead!",
-        },
-      ]);
+      setReply({
+        role: "librarian",
+        text: "I'm sorry, I had trouble finding suggestions right now. Try browsing our curated lists instead!",
+      });
     } finally {
       setLoading(false);
     }
@@ -175,7 +187,7 @@ export function LibrarianChat() {
           </div>
         ))}
 
-        {loading && (
+        {loading && conversation[conversation.length - 1]?.role === "user" && (
           <div className="flex gap-1 px-4 py-3">
             <div className="w-2 h-2 rounded-full bg-sage animate-bounce" />
             <div className="w-2 h-2 rounded-full bg-sage animate-bounce [animation-delay:0.1s]" />
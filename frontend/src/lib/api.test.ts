@@ -5,7 +5,7 @@ const mockFetch = vi.fn();
 vi.stubGlobal("fetch", mockFetch);
 
 // Reset module cache so api.ts picks up our mock
-const { searchBooks, getBook, getRelatedBooks, subscribeNewsletter, trackAffiliateClick, getCatalogStats, askLibrarian } = await import("./api");
+const { searchBooks, getBook, getRelatedBooks, getAlsoPlannedBooks, subscribeNewsletter, trackAffiliateClick, getCatalogStats, askLibrarian, streamLibrarian } = await import("./api");
 
 describe("API Client", () => {
   beforeEach(() => {
@@ -53,6 +53,19 @@ describe("API Client", () => {
     );
   });
 
+  it("getAlsoPlannedBooks calls /api/v1/books/{id}/also-planned", async () => {
+    mockFetch.mockResolvedValue({
+      ok: true,
+      json: () => Promise.resolve([]),
+    });
+
+    await getAlsoPlannedBooks(5);
+    expect(mockFetch).toHaveBeenCalledWith(
+      expect.stringContaining("/api/v1/books/5/also-planned"),
+      expect.any(Object),
+    );
+  });
+
   it("subscribeNewsletter POSTs to /api/v1/newsletter/subscribe", async () => {
     mockFetch.mockResolvedValue({
       ok: true,
@@ -107,6 +120,33 @@ describe("API Client", () => {
     expect(result.reply).toContain("book");
   });
 
+  it("streamLibrarian forwards tokens and resolves with the done event", async () => {
+    const sse =
+      'event: token\ndata: {"text": "Try "}\n\n' +
+      'event: token\ndata: {"text": "this book!"}\n\n' +
+      'event: done\ndata: {"reply": "Try this book!", "suggested_books": []}\n\n';
+    mockFetch.mockResolvedValue({
+      ok: true,
+      body: new ReadableStream({
+        start(controller) {
+          const bytes = new TextEncoder().encode(sse);
+          controller.enqueue(bytes.slice(0, 20));
+          controller.enqueue(bytes.slice(20));
+          controller.close();
+        },
+      }),
+    });
+
+    const tokens: string[] = [];
+    const result = await streamLibrarian("nature books", (t) => tokens.push(t));
+    expect(mockFetch).toHaveBeenCalledWith(
+      expect.stringContaining("/api/v1/librarian/stream"),
+      expect.objectContaining({ method: "POST" }),
+    );
+    expect(tokens).toEqual(["Try ", "this book!"]);
+    expect(result.reply).toBe("Try this book!");
+  });
+
   it("throws on non-OK response", async () => {
     mockFetch.mockResolvedValue({
       ok: false,
@@ -35,6 +35,12 @@ export async function getRelatedBooks(id: number) {
   );
 }
 
+export async function getAlsoPlannedBooks(id: number) {
+  return fetchAPI<import("@/types").BookSummary[]>(
+    `/api/v1/books/${id}/also-planned`
+  );
+}
+
 export async function getFilterOptions() {
   return fetchAPI<import("@/types").FilterOptions>(`/api/v1/books/filters`);
 }
@@ -70,6 +76,51 @@ export async function askLibrarian(message: string) {
   });
 }
 
+/**
+ * Ask the Librarian over Server-Sent Events. `onToken` receives each piece of
+ * the reply as it is written; resolves with the final reply and suggested books.
+ */
+export async function streamLibrarian(
+  message: string,
+  onToken: (text: string) => void
+): Promise<import("@/types").LibrarianResponse> {
+  const res = await fetch(`${API_URL}/api/v1/librarian/stream`, {
+    method: "POST",
+    credentials: "include",
+    headers: {
+      "Content-Type": "application/json",
+      Accept: "text/event-stream",
+    },
+    body: JSON.stringify({ message }),
+  });
+
+  if (!res.ok || !res.body) {
+    throw new Error(`API error: ${res.status} ${res.statusText}`);
+  }
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += value;
+    let end;
+    while ((end = buffer.indexOf("\n\n")) !== -1) {
+      const block = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+      let event = "message";
+      let data = "";
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      if (event === "token") onToken(JSON.parse(data).text);
+      else if (event === "done") return JSON.parse(data);
+    }
+  }
+  throw new Error("Librarian stream ended early");
+}
+
 export async function createCheckoutSession(
   successUrl: string,
   cancelUrl: string,
@@ -110,6 +161,7 @@ export async function trackAffiliateClick(data: {
   link_id?: number;
   source_name: string;
   referrer?: string;
+  session_id?: string;
 }) {
   return fetchAPI<{ success: boolean }>(`/api/v1/tracking/click`, {
     method: "POST",
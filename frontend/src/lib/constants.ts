@@ -1 +1,2 @@
 export const LOCAL_PLAN_KEY = "living-books-reading-plan";
+export const CLICK_SESSION_KEY = "living-books-click-session";
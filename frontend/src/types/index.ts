@@ -36,10 +36,16 @@ export interface BookDetail extends BookSummary {
 
 export interface PaginatedBooks {
   items: BookSummary[];
-  total: number;
+  // null when the count was skipped (count=none, or cursor pagination)
+  total: number | null;
   page: number;
   per_page: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null;
+  // "estimated" totals are approximate
+  total_strategy: "exact" | "estimated" | "cached" | null;
+  // facet -> value -> book count; only with facets=true
+  facets: Record<string, Record<string, number>> | null;
 }
 
 export interface CuratedList {